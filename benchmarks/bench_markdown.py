@@ -0,0 +1,83 @@
+"""README table rendering: row-by-row vs vectorized.
+
+Usage: python -m benchmarks.bench_markdown [ROWS ...]   (default: 10000 100000 1000000)
+
+Times the per-row `iterrows` renderer the tables used to be built with
+against the vectorized `_render_rows` path (row cache disabled), checks the
+output is identical, and reports a warm run served from the row cache.
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+import pandas as pd
+
+from paper_cli.core.markdown import _ROW_FIELDS, _TABLE_HEADER, MarkdownGenerator
+
+from .synthetic import write_library
+
+
+def _row_by_row(md: MarkdownGenerator, df: pd.DataFrame) -> Dict[str, str]:
+    """The previous renderer: per-group sort on `.apply`, then `iterrows`."""
+    df = df.copy()
+    df["Topic"] = df["Topic"].astype(str).str.strip()
+    df = df[df["Topic"] != ""]
+    tables = {}
+    for topic, group in df.groupby("Topic"):
+        group = group.copy()
+        group["__date_sort"] = group["Date"].apply(md._date_sort_value)
+        group = group.sort_values(by=["__date_sort", "Title"], ascending=[False, True], kind="mergesort")
+        lines = [_TABLE_HEADER]
+        esc = md._escape_markdown_cell
+        for _, row in group.iterrows():
+            source = esc(md._format_source_column(row["Source"], row["Link"], row["Journal_Ref"]))
+            title = md._format_linked_title(row["Title"], row["Link"])
+            authors = esc(md._format_authors_display(row["Authors"]))
+            rest = " | ".join(esc(row[name]) for name in ("Tag", "Subjects", "Additional_Info", "Date"))
+            lines.append(f"| {source} | {title} | {authors} | {rest} |\n")
+        tables[topic] = "".join(lines)
+    return tables
+
+
+def _vectorized(md: MarkdownGenerator) -> Dict[str, str]:
+    tables = {}
+    for topic, group in md._topic_groups().items():
+        fields = group.reindex(columns=list(_ROW_FIELDS), fill_value="")
+        tables[topic] = _TABLE_HEADER + "".join(md._render_rows(fields))
+    return tables
+
+
+def _timed(build):
+    start = time.perf_counter()
+    result = build()
+    return result, time.perf_counter() - start
+
+
+def main(sizes) -> None:
+    print(f"{'rows':>9} {'row-by-row':>12} {'vectorized':>12} {'speedup':>8} {'warm cache':>11}")
+    for rows in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = write_library(Path(tmp) / "papers.csv", rows)
+            md = MarkdownGenerator(csv_path, Path(tmp) / "README.md")
+            df = md._load_dataframe()
+            # Both sides render from the already-parsed frame.
+            md._load_dataframe = lambda: df
+
+            old, t_old = _timed(lambda: _row_by_row(md, df))
+            new, t_new = _timed(lambda: _vectorized(md))
+            assert new == old, "vectorized output differs"
+
+            md.generate_tables_by_topic()  # fill the row cache
+            warm, t_warm = _timed(MarkdownGenerator(csv_path, md.readme_path).generate_tables_by_topic)
+            assert warm == old, "cached output differs"
+
+        print(f"{rows:>9} {t_old:>11.2f}s {t_new:>11.2f}s {t_old / t_new:>7.1f}x {t_warm:>10.2f}s")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
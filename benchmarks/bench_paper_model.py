@@ -0,0 +1,45 @@
+"""Construction cost of `Paper` objects per 10k CSV rows.
+
+Usage: python -m benchmarks.bench_paper_model [ROWS]
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from paper_cli.core.models import CSV_COLUMNS, Paper
+
+from .synthetic import write_library
+
+
+def _per_10k(label: str, build, items, repeat: int = 3) -> None:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            build(item)
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<34} {best * 1000 * 10_000 / len(items):>8.1f} ms / 10k rows")
+
+
+def main(rows: int = 100_000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = write_library(Path(tmp) / "papers.csv", rows)
+        df = pd.read_csv(csv_path, dtype=str, keep_default_na=False)
+    records = df.to_dict("records")
+    tuples = list(df[list(CSV_COLUMNS)].itertuples(index=False, name=None))
+    fields = tuple(Paper.model_fields)
+
+    _per_10k("from_csv_row (validated)", Paper.from_csv_row, records)
+    _per_10k("model_construct", lambda r: Paper.model_construct(**dict(zip(fields, r))), tuples)
+    _per_10k("from_trusted_row", Paper.from_trusted_row, records)
+    _per_10k("from_trusted_values", Paper.from_trusted_values, tuples)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,57 @@
+"""Memory and load time of the in-memory library representations.
+
+Usage: python -m benchmarks.bench_table [ROWS]
+
+Compares a list of `Paper` models, a list of row tuples and the columnar
+`PaperTable` built from the same synthetic papers.csv.
+"""
+
+from __future__ import annotations
+
+import pickle
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+
+from paper_cli.core.models import Paper
+from paper_cli.core.table import PaperTable
+
+from .synthetic import write_library
+
+
+def _measure(label: str, build) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {elapsed * 1000:>9.1f} ms {current / 2**20:>9.1f} MiB retained")
+    return result
+
+
+def main(rows: int = 100_000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = write_library(Path(tmp) / "papers.csv", rows)
+        print(f"{rows} rows, {csv_path.stat().st_size / 2**20:.1f} MiB CSV\n")
+
+        def read():
+            return pd.read_csv(csv_path, dtype=str, keep_default_na=False)
+
+        _measure("Paper models", lambda: [Paper.from_csv_row(r) for r in read().to_dict("records")])
+        _measure("row tuples", lambda: list(read().itertuples(index=False, name=None)))
+        table = _measure("PaperTable", lambda: PaperTable.from_dataframe(read()))
+
+        blob = pickle.dumps(table, protocol=pickle.HIGHEST_PROTOCOL)
+        tuples = pickle.dumps(list(table.iter_rows()), protocol=pickle.HIGHEST_PROTOCOL)
+        print(f"\ncached size: PaperTable {len(blob) / 2**20:.1f} MiB, row tuples {len(tuples) / 2**20:.1f} MiB")
+        _measure("PaperTable (from cache)", lambda: pickle.loads(blob))
+        _measure("row tuples (from cache)", lambda: pickle.loads(tuples))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,51 @@
+"""Synthetic papers.csv generator shared by the benchmark scripts."""
+
+from __future__ import annotations
+
+import csv
+import random
+from pathlib import Path
+
+from paper_cli.core.storage import PaperStorage
+
+TOPICS = ["Memory", "Personalization", "MLLM", "Agents", "Evaluation", "HCI", "Education", "Healthcare"]
+VENUES = ["CHI", "UIST", "CSCW", "IUI", "NeurIPS", "ICLR", "ACL", "EMNLP"]
+TAGS = ["llm", "vr", "imu", "rag", "survey", "benchmark", "dataset", "agent", "memory", "multimodal"]
+SUBJECTS = ["cs.HC", "cs.CL", "cs.AI", "cs.LG", "cs.CV"]
+WORDS = (
+    "large language model interactive user study adaptive memory retrieval personalized "
+    "agent multimodal evaluation benchmark interface design conversational learning"
+).split()
+SURNAMES = ["Zhang", "Li", "Wang", "Smith", "Müller", "García", "Kim", "Nguyen", "Ivanov", "Rossi"]
+
+
+def write_library(path: Path, rows: int, seed: int = 0) -> Path:
+    """Write a reproducible `rows`-row papers.csv to `path`."""
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=PaperStorage.FIELDNAMES, quoting=csv.QUOTE_ALL)
+        writer.writeheader()
+        for i in range(rows):
+            year = rng.randint(2019, 2025)
+            month = rng.randint(1, 12)
+            arxiv = rng.random() < 0.5
+            writer.writerow(
+                {
+                    "Source": f"arXiv(v{rng.randint(1, 3)}) {year}" if arxiv else f"{rng.choice(VENUES)} {year}",
+                    "Title": " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 12))).title() + f" {i}",
+                    "Authors": ", ".join(
+                        f"{chr(65 + rng.randint(0, 25))}. {rng.choice(SURNAMES)}" for _ in range(rng.randint(1, 6))
+                    ),
+                    "DOI": "" if arxiv else f"10.1145/{3500000 + i}",
+                    "Journal_Ref": "" if arxiv else f"{rng.choice(VENUES)} {year}",
+                    "Link": f"https://arxiv.org/abs/{year % 100:02d}{month:02d}.{i:05d}"
+                    if arxiv
+                    else f"https://doi.org/10.1145/{3500000 + i}",
+                    "Tag": ", ".join(rng.sample(TAGS, rng.randint(0, 3))),
+                    "Subjects": ", ".join(rng.sample(SUBJECTS, rng.randint(1, 2))),
+                    "Additional_Info": "",
+                    "Date": f"{year}.{month:02d}",
+                    "Topic": rng.choice(TOPICS),
+                }
+            )
+    return path
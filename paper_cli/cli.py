@@ -10,6 +10,8 @@ from .commands.preview import preview_markdown
 from .commands.sync import sync_readme
 from .commands.topics import list_topics
 from .commands.stats import show_stats
+from .commands.authors import list_authors
+from .commands.import_cmd import import_papers
 
 app = typer.Typer(
     name="paper",
@@ -29,6 +31,8 @@ app.command(name="preview", help="Preview Markdown table")(preview_markdown)
 app.command(name="sync", help="Sync README and push to git")(sync_readme)
 app.command(name="topics", help="List all topics")(list_topics)
 app.command(name="stats", help="Show library statistics")(show_stats)
+app.command(name="authors", help="List authors by paper count")(list_authors)
+app.command(name="import", help="Import papers in bulk from a file of links")(import_papers)
 
 
 @app.callback()
@@ -10,12 +10,11 @@ from rich.console import Console
 
 from ..core.fetchers import FetcherRegistry
 from ..core.git_ops import GitOperations
-from ..core.markdown import MarkdownGenerator
+from ..core.markdown import open_markdown
 from ..core.models import Paper
-from ..core.storage import PaperStorage
+from ..core.storage import open_storage
 from ..utils.cli_args import resolve_cli_values
 from ..utils.display import display_paper_detail, print_error, print_info, print_success, print_warning
-from ..utils.paths import repo_files
 
 console = Console()
 
@@ -53,6 +52,7 @@ def add_paper(
     no_sync: bool = typer.Option(False, "--no-sync", help="Don't update README"),
     no_git: bool = typer.Option(False, "--no-git", help="Don't commit/push"),
     dry_run: bool = typer.Option(False, "--dry-run", help="Preview only, don't save"),
+    offline: bool = typer.Option(False, "--offline", help="Use cached metadata only, no network"),
     commit_msg: Optional[str] = typer.Option(None, "-m", "--commit-msg", help="Custom commit message"),
     repo_path: Path = typer.Option(Path("."), "--repo", help="Repository path"),
 ):
@@ -73,6 +73,7 @@ def add_paper(
         no_sync,
         no_git,
         dry_run,
+        offline,
         commit_msg,
         repo_path,
     ) = resolve_cli_values(
@@ -84,6 +85,7 @@ def add_paper(
         no_sync,
         no_git,
         dry_run,
+        offline,
         commit_msg,
         repo_path,
     )
@@ -97,13 +99,17 @@ def add_paper(
         print_error("Topic cannot be empty")
         raise typer.Exit(2)
 
-    csv_path, readme_path = repo_files(repo_path)
-
-    storage = PaperStorage(csv_path)
-    registry = FetcherRegistry()
+    try:
+        storage = open_storage(repo_path)
+    except ValueError as exc:
+        print_error(str(exc))
+        raise typer.Exit(2)
+    # Duplicate checks, the append and README generation share one snapshot.
+    library = storage.library()
+    registry = FetcherRegistry.for_repo(repo_path, offline=offline)
     allow_duplicate = False
 
-    if storage.exists(link):
+    if library.exists(link):
         print_warning("This paper already exists in the library")
         if not typer.confirm("Add anyway?", default=False):
             raise typer.Exit(0)
@@ -135,7 +141,7 @@ def add_paper(
 
     if not allow_duplicate:
         for candidate in [paper.doi, paper.link]:
-            if candidate and storage.exists(candidate):
+            if candidate and library.exists(candidate):
                 print_warning("This paper already exists in the library (matched by fetched metadata)")
                 if not typer.confirm("Add anyway?", default=False):
                     raise typer.Exit(0)
@@ -161,24 +167,29 @@ def add_paper(
         print_warning("Dry run mode - no changes made")
         raise typer.Exit(0)
 
-    storage.add_paper(paper)
+    if not storage.add_paper(paper, allow_duplicate=allow_duplicate):
+        print_warning("This paper was added by a concurrent run - no changes made")
+        raise typer.Exit(0)
     print_success("Paper added to CSV")
 
     if not no_sync:
         try:
-            md_gen = MarkdownGenerator(csv_path, readme_path)
-            md_gen.update_readme()
+            md_gen = open_markdown(repo_path, library=storage.library())
+            rebuilt = md_gen.update_readme(coalesce=True)
         except Exception as exc:  # pragma: no cover - runtime I/O protection
             print_error(f"Failed to update README.md: {exc}")
             raise typer.Exit(1)
-        print_success("README.md updated")
+        if rebuilt:
+            print_success("README.md updated")
+        else:
+            print_info("README.md already updated by a concurrent run")
 
     if not no_git and not no_sync:
         git = GitOperations(repo_path)
         short_title = paper.title[:50]
         default_msg = f"Add paper: {short_title}{'...' if len(paper.title) > 50 else ''}"
         msg = commit_msg or default_msg
-        files = ["papers.csv", "README.md"]
+        files = ["papers.csv", *md_gen.output_files()]
 
         print_info("Committing and pushing...")
         success, error = git.add_commit_push(files, msg)
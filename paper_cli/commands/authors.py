@@ -0,0 +1,39 @@
+"""Authors command - list top authors by paper count."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from ..core.storage import open_storage
+from ..utils.cli_args import resolve_cli_values
+from ..utils.display import display_authors, print_error
+
+
+def list_authors(
+    name: Optional[str] = typer.Argument(None, help="Only authors whose name (or last name) starts with this"),
+    limit: int = typer.Option(20, "-l", "--limit", help="Max authors (0 for all)"),
+    repo_path: Path = typer.Option(Path("."), "--repo", help="Repository path"),
+):
+    """List authors and their paper counts."""
+    name, limit, repo_path = resolve_cli_values(name, limit, repo_path)
+
+    if limit < 0:
+        print_error("--limit must be >= 0")
+        raise typer.Exit(2)
+
+    try:
+        storage = open_storage(repo_path)
+    except ValueError as exc:
+        print_error(str(exc))
+        raise typer.Exit(2)
+    authors = storage.get_authors(prefix=name, limit=limit)
+
+    if not authors:
+        typer.echo("No authors found.")
+        return
+
+    title = f"Authors matching '{name}'" if name else "Top Authors"
+    display_authors(authors, title=title)
@@ -0,0 +1,198 @@
+"""Import papers in bulk from a file of links."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    ProgressColumn,
+    TextColumn,
+    TimeElapsedColumn,
+    TimeRemainingColumn,
+)
+from rich.text import Text
+
+from ..config import Config
+from ..core.fetchers import FetcherRegistry
+from ..core.git_ops import GitOperations
+from ..core.importer import ImportCheckpoint, Importer, read_import_file
+from ..core.markdown import open_markdown
+from ..core.storage import open_storage
+from ..utils.cli_args import resolve_cli_values
+from ..utils.display import print_error, print_info, print_success, print_warning
+
+console = Console()
+
+
+class ThroughputColumn(ProgressColumn):
+    """Papers processed per second."""
+
+    def render(self, task) -> Text:
+        speed = task.finished_speed or task.speed
+        return Text(f"{speed:.1f} papers/s" if speed else "-- papers/s", style="progress.data.speed")
+
+
+def import_papers(
+    file: Path = typer.Argument(..., help="File with one link, DOI or arXiv ID per line (optionally followed by a topic)"),
+    topic: Optional[str] = typer.Argument(None, help="Topic for lines without one (default: config default_topic)"),
+    tag: Optional[str] = typer.Option(None, "-t", "--tag", help="Custom tags (comma-separated) for every paper"),
+    jobs: int = typer.Option(8, "-j", "--jobs", help="Concurrent CrossRef requests"),
+    batch_size: int = typer.Option(100, "--batch-size", help="Links fetched and appended per batch"),
+    offline: bool = typer.Option(False, "--offline", help="Use cached metadata only, no network"),
+    restart: bool = typer.Option(False, "--restart", help="Ignore the checkpoint of an earlier run"),
+    no_sync: bool = typer.Option(False, "--no-sync", help="Don't update README"),
+    no_git: bool = typer.Option(False, "--no-git", help="Don't commit/push"),
+    commit_msg: Optional[str] = typer.Option(None, "-m", "--commit-msg", help="Custom commit message"),
+    repo_path: Path = typer.Option(Path("."), "--repo", help="Repository path"),
+):
+    """Import many papers at once.
+
+    Lines look like `2312.00752`, `10.1145/3544548.3581468 HCI` or
+    `https://arxiv.org/abs/2502.12110 Memory`; `#` starts a comment. An
+    interrupted import resumes where it stopped when run again.
+    """
+    (
+        file,
+        topic,
+        tag,
+        jobs,
+        batch_size,
+        offline,
+        restart,
+        no_sync,
+        no_git,
+        commit_msg,
+        repo_path,
+    ) = resolve_cli_values(file, topic, tag, jobs, batch_size, offline, restart, no_sync, no_git, commit_msg, repo_path)
+
+    if jobs < 1:
+        print_error("--jobs must be >= 1")
+        raise typer.Exit(2)
+    if batch_size < 1:
+        print_error("--batch-size must be >= 1")
+        raise typer.Exit(2)
+
+    file = Path(file)
+    if not file.exists():
+        print_error(f"File not found: {file}")
+        raise typer.Exit(1)
+
+    default_topic = str(topic or Config.for_repo(repo_path).default_topic).strip()
+    if not default_topic:
+        print_error("Topic cannot be empty")
+        raise typer.Exit(2)
+    items = read_import_file(file, default_topic)
+    if not items:
+        print_warning("No links to import")
+        return
+
+    checkpoint = ImportCheckpoint.for_file(repo_path, file)
+    if restart:
+        checkpoint.clear()
+    else:
+        checkpoint.load()
+
+    try:
+        storage = open_storage(repo_path)
+    except ValueError as exc:
+        print_error(str(exc))
+        raise typer.Exit(2)
+    importer = Importer(
+        storage,
+        FetcherRegistry.for_repo(repo_path, offline=offline),
+        concurrency=jobs,
+        batch_size=batch_size,
+        custom_tag=tag,
+        checkpoint=checkpoint,
+    )
+    pending = importer.pending(items)
+    # Papers appended by an interrupted run still need their README update.
+    resumed_added = sum(1 for status in checkpoint.done.values() if status == "added")
+    if len(pending) < len(items):
+        print_info(f"Resuming: {len(items) - len(pending)} of {len(items)} links already processed")
+
+    start = time.perf_counter()
+    with Progress(
+        TextColumn("[bold]Importing"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        ThroughputColumn(),
+        TextColumn("{task.fields[summary]}"),
+        TimeElapsedColumn(),
+        TimeRemainingColumn(),
+        console=console,
+    ) as progress:
+        task = progress.add_task("import", total=len(pending), summary="")
+
+        def on_progress(stats, n: int) -> None:
+            summary = f"+{stats.added} added, {stats.skipped} skipped, {stats.failed} failed"
+            progress.update(task, advance=n, summary=summary)
+
+        try:
+            stats = importer.run(pending, on_progress)
+        except KeyboardInterrupt:
+            progress.stop()
+            print_warning("Interrupted; run the same command again to resume")
+            raise typer.Exit(130)
+    elapsed = time.perf_counter() - start
+
+    report = print_warning if stats.failed else print_success
+    report(
+        f"Imported {stats.added} papers ({stats.skipped} skipped, {stats.failed} failed) "
+        f"in {elapsed:.1f}s, {stats.processed / elapsed if elapsed else 0:.1f} papers/s"
+    )
+    for link, error in list(stats.errors.items())[:20]:
+        console.print(f"  [red]✗[/red] {link}: {error}")
+    if len(stats.errors) > 20:
+        console.print(f"  ... and {len(stats.errors) - 20} more")
+    if stats.retryable:
+        print_info("Failed links are retried when the command is run again")
+
+    def finish(synced: bool) -> None:
+        # Called once the README is updated and committed (or skipped): until
+        # then the checkpoint stays, so a re-run redoes only those steps. While
+        # failed links remain, it keeps the synced papers out of the next count.
+        if not stats.retryable:
+            checkpoint.clear()
+        elif synced:
+            checkpoint.record({link: "synced" for link, status in checkpoint.done.items() if status == "added"})
+
+    total_added = stats.added + resumed_added
+    if total_added == 0 or no_sync:
+        finish(synced=False)
+        return
+
+    try:
+        md_gen = open_markdown(repo_path, library=storage.library())
+        md_gen.update_readme(coalesce=True)
+    except Exception as exc:  # pragma: no cover - runtime I/O protection
+        print_error(f"Failed to update README.md: {exc}")
+        raise typer.Exit(1)
+    print_success("README.md updated")
+
+    if no_git:
+        finish(synced=True)
+        return
+    git = GitOperations(repo_path)
+    if not git.is_git_repo():
+        print_warning("Not a git repository, skipping git operations")
+        finish(synced=True)
+        return
+    msg = commit_msg or f"Import {total_added} papers"
+    print_info("Committing and pushing...")
+    if not git.add_files(["papers.csv", *md_gen.output_files()]) or not git.commit(msg):
+        print_warning(f"Git operation: {git.last_error or 'commit failed'}")
+        print_info("Run the same command again to retry the commit")
+        return
+    finish(synced=True)
+    if git.push():
+        print_success("Changes committed and pushed")
+    else:
+        print_warning(f"Git operation: {git.last_error or 'Failed to push'}")
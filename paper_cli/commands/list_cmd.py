@@ -7,11 +7,9 @@ from typing import Optional
 
 import typer
 
-from ..core.storage import PaperStorage
+from ..core.storage import open_storage
 from ..utils.cli_args import resolve_cli_values
-from ..utils.date import date_key
 from ..utils.display import display_papers_table, print_error, print_info
-from ..utils.paths import papers_csv_path
 
 
 def list_papers(
@@ -30,21 +28,22 @@ def list_papers(
         print_error("--limit must be >= 0")
         raise typer.Exit(2)
 
-    csv_path = papers_csv_path(repo_path)
-    storage = PaperStorage(csv_path)
+    try:
+        storage = open_storage(repo_path)
+    except ValueError as exc:
+        print_error(str(exc))
+        raise typer.Exit(2)
 
+    # Only the displayed rows are materialized as papers; --recent walks the
+    # persisted date order instead of sorting the whole library.
+    papers = storage.search(topic=topic, limit=limit, recent=recent)
+    total = storage.last_match_count
     if topic:
-        papers = storage.search(topic=topic)
-        title = f"Papers in '{topic}' ({len(papers)} total)"
+        title = f"Papers in '{topic}' ({total} total)"
     else:
-        papers = storage.load_all()
-        title = f"All Papers ({len(papers)} total)"
-
-    if recent:
-        papers = sorted(papers, key=lambda p: date_key(p.date) or (-1, -1), reverse=True)
+        title = f"All Papers ({total} total)"
 
-    if limit > 0 and len(papers) > limit:
+    if limit > 0 and total > limit:
         print_info(f"Showing {limit} papers (use --limit 0 for all)")
-        papers = papers[:limit]
 
     display_papers_table(papers, title=title, show_all=show_all)
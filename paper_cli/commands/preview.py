@@ -10,7 +10,7 @@ from rich.console import Console
 from rich.markdown import Markdown
 from rich.panel import Panel
 
-from ..core.markdown import MarkdownGenerator
+from ..core.markdown import open_markdown
 from ..utils.cli_args import resolve_cli_values
 from ..utils.display import print_error
 from ..utils.paths import repo_files
@@ -22,17 +22,26 @@ def preview_markdown(
     topic: Optional[str] = typer.Option(None, "-t", "--topic", help="Preview specific topic only"),
     diff: bool = typer.Option(False, "--diff", help="Show diff with current README"),
     repo_path: Path = typer.Option(Path("."), "--repo", help="Repository path"),
+    jobs: int = typer.Option(1, "-j", "--jobs", help="Worker processes for rendering tables"),
 ):
     """Preview the Markdown table that will be generated."""
-    topic, diff, repo_path = resolve_cli_values(topic, diff, repo_path)
+    topic, diff, repo_path, jobs = resolve_cli_values(topic, diff, repo_path, jobs)
 
-    csv_path, readme_path = repo_files(repo_path)
+    if jobs < 1:
+        print_error("--jobs must be >= 1")
+        raise typer.Exit(2)
+
+    csv_path, _ = repo_files(repo_path)
 
     if not csv_path.exists():
         print_error(f"papers.csv not found: {csv_path}")
         raise typer.Exit(1)
 
-    md_gen = MarkdownGenerator(csv_path, readme_path)
+    try:
+        md_gen = open_markdown(repo_path, jobs=jobs)
+    except ValueError as exc:
+        print_error(str(exc))
+        raise typer.Exit(2)
 
     try:
         if diff:
@@ -7,47 +7,59 @@ from typing import Optional
 
 import typer
 
-from ..core.storage import PaperStorage
+from ..core.author_index import AUTHOR_MATCH_MODES
+from ..core.storage import open_storage
+from ..core.tag_index import TAG_MATCH_MODES
 from ..utils.cli_args import resolve_cli_values
 from ..utils.date import date_key, is_strict_yyyymm
 from ..utils.display import display_papers_table, print_error, print_info
-from ..utils.paths import papers_csv_path
 
 
 def search_papers(
-    query: Optional[str] = typer.Argument(None, help="Search query (searches title, tags, authors)"),
-    tag: Optional[str] = typer.Option(None, "-t", "--tag", help="Filter by tag"),
+    query: Optional[str] = typer.Argument(None, help="Search query (searches title, tags, authors; ranked by relevance)"),
+    tag: Optional[str] = typer.Option(None, "-t", "--tag", help="Filter by tag text (see --tag-match)"),
+    tag_match: str = typer.Option(
+        "substring", "--tag-match", help="Tag matching: substring, or exact tags with ',' = AND and '|' = OR"
+    ),
     author: Optional[str] = typer.Option(None, "-a", "--author", help="Filter by author"),
+    author_match: str = typer.Option("substring", "--author-match", help="Author matching: substring or prefix"),
     topic: Optional[str] = typer.Option(None, "--topic", help="Filter by topic"),
     date_from: Optional[str] = typer.Option(None, "--from", help="Start date (YYYY.MM)"),
     date_to: Optional[str] = typer.Option(None, "--to", help="End date (YYYY.MM)"),
     recent: bool = typer.Option(False, "--recent", help="Sort by date (most recent first)"),
     limit: int = typer.Option(20, "-l", "--limit", help="Max results (0 for all)"),
     show_all: bool = typer.Option(False, "--all", help="Show all fields"),
+    explain: bool = typer.Option(False, "--explain", help="Show which indexes were used and how long the search took"),
     repo_path: Path = typer.Option(Path("."), "--repo", help="Repository path"),
 ):
     """Search papers in the library."""
     (
         query,
         tag,
+        tag_match,
         author,
+        author_match,
         topic,
         date_from,
         date_to,
         recent,
         limit,
         show_all,
+        explain,
         repo_path,
     ) = resolve_cli_values(
         query,
         tag,
+        tag_match,
         author,
+        author_match,
         topic,
         date_from,
         date_to,
         recent,
         limit,
         show_all,
+        explain,
         repo_path,
     )
 
@@ -64,9 +76,22 @@ def search_papers(
         print_error("--from must be earlier than or equal to --to")
         raise typer.Exit(2)
 
-    csv_path = papers_csv_path(repo_path)
-    storage = PaperStorage(csv_path)
+    if tag_match not in TAG_MATCH_MODES:
+        print_error(f"--tag-match must be one of: {', '.join(TAG_MATCH_MODES)}")
+        raise typer.Exit(2)
+
+    if author_match not in AUTHOR_MATCH_MODES:
+        print_error(f"--author-match must be one of: {', '.join(AUTHOR_MATCH_MODES)}")
+        raise typer.Exit(2)
+
+    try:
+        storage = open_storage(repo_path)
+    except ValueError as exc:
+        print_error(str(exc))
+        raise typer.Exit(2)
 
+    # Keyword results come back BM25-ranked (or newest first with --recent);
+    # the limit is applied inside the storage.
     results = storage.search(
         query=query,
         tag=tag,
@@ -74,18 +99,20 @@ def search_papers(
         topic=topic,
         date_from=date_from,
         date_to=date_to,
+        limit=limit,
+        recent=recent,
+        tag_match=tag_match,
+        author_match=author_match,
     )
-
-    if recent:
-        results = sorted(results, key=lambda p: date_key(p.date) or (-1, -1), reverse=True)
+    total = storage.last_match_count
 
     filters = []
     if query:
         filters.append(f"query='{query}'")
     if tag:
-        filters.append(f"tag='{tag}'")
+        filters.append(f"tag='{tag}'" if tag_match == "exact" else f"tag~'{tag}'")
     if author:
-        filters.append(f"author='{author}'")
+        filters.append(f"author='{author}'" if author_match == "substring" else f"author^'{author}'")
     if topic:
         filters.append(f"topic='{topic}'")
     if date_from or date_to:
@@ -94,10 +121,14 @@ def search_papers(
         filters.append("sort=recent")
 
     filter_str = ", ".join(filters) if filters else "all"
-    title = f"Search Results ({len(results)} found, {filter_str})"
+    title = f"Search Results ({total} found, {filter_str})"
 
-    if limit > 0 and len(results) > limit:
+    if limit > 0 and total > limit:
         print_info(f"Showing top {limit} results (use --limit 0 for all)")
         results = results[:limit]
 
     display_papers_table(results, title=title, show_all=show_all)
+
+    if explain and storage.last_plan is not None:
+        for line in storage.last_plan.describe():
+            print_info(line)
@@ -8,7 +8,7 @@ from typing import Optional
 import typer
 
 from ..core.git_ops import GitOperations
-from ..core.markdown import MarkdownGenerator
+from ..core.markdown import open_markdown
 from ..utils.cli_args import resolve_cli_values
 from ..utils.display import print_error, print_info, print_success, print_warning
 from ..utils.paths import repo_files
@@ -19,20 +19,29 @@ def sync_readme(
     no_push: bool = typer.Option(False, "--no-push", help="Commit but don't push"),
     commit_msg: Optional[str] = typer.Option(None, "-m", "--commit-msg", help="Custom commit message"),
     repo_path: Path = typer.Option(Path("."), "--repo", help="Repository path"),
+    jobs: int = typer.Option(1, "-j", "--jobs", help="Worker processes for rendering tables"),
 ):
     """Sync README with CSV and optionally push to git."""
-    readme_only, no_push, commit_msg, repo_path = resolve_cli_values(
-        readme_only, no_push, commit_msg, repo_path
+    readme_only, no_push, commit_msg, repo_path, jobs = resolve_cli_values(
+        readme_only, no_push, commit_msg, repo_path, jobs
     )
 
-    csv_path, readme_path = repo_files(repo_path)
+    if jobs < 1:
+        print_error("--jobs must be >= 1")
+        raise typer.Exit(2)
+
+    csv_path, _ = repo_files(repo_path)
 
     if not csv_path.exists():
         print_error(f"papers.csv not found: {csv_path}")
         raise typer.Exit(1)
 
     print_info("Updating README.md...")
-    md_gen = MarkdownGenerator(csv_path, readme_path)
+    try:
+        md_gen = open_markdown(repo_path, jobs=jobs)
+    except ValueError as exc:
+        print_error(str(exc))
+        raise typer.Exit(2)
 
     try:
         diff_text = md_gen.get_diff()
@@ -64,7 +73,7 @@ def sync_readme(
         return
 
     msg = commit_msg or "Update paper list"
-    files = ["papers.csv", "README.md"]
+    files = ["papers.csv", *md_gen.output_files()]
 
     print_info("Staging files...")
     if not git.add_files(files):
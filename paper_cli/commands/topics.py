@@ -6,10 +6,9 @@ from pathlib import Path
 
 import typer
 
-from ..core.storage import PaperStorage
+from ..core.storage import open_storage
 from ..utils.cli_args import resolve_cli_value
-from ..utils.display import display_topics
-from ..utils.paths import papers_csv_path
+from ..utils.display import display_topics, print_error
 
 
 def list_topics(
@@ -18,8 +17,11 @@ def list_topics(
     """List all topics and their paper counts."""
     repo_path = resolve_cli_value(repo_path)
 
-    csv_path = papers_csv_path(repo_path)
-    storage = PaperStorage(csv_path)
+    try:
+        storage = open_storage(repo_path)
+    except ValueError as exc:
+        print_error(str(exc))
+        raise typer.Exit(2)
 
     topics = storage.get_topics()
 
@@ -21,6 +21,20 @@ class Config(BaseModel):
     default_topic: str = "HCI"
     auto_sync: bool = True
     auto_git: bool = True
+    # "csv" reads papers.csv directly; "sqlite" serves reads from a SQLite
+    # mirror in .paper-cache/ (papers.csv remains the source of truth).
+    storage_backend: str = "csv"
+    # fsync papers.csv appends (and their journal) before returning.
+    fsync_writes: bool = True
+    # README layout: "single" keeps every topic table in README.md; "pages"
+    # writes one Markdown file per topic under pages_dir, optionally split
+    # by year and/or at page_rows rows (0 = no cap), with an index in README.md.
+    readme_layout: str = "single"
+    pages_dir: Path = Path("topics")
+    pages_by_year: bool = False
+    page_rows: int = 0
+    # Size bound of the fetcher response cache in .paper-cache/http/ (0 = no bound).
+    http_cache_max_mb: int = 200
 
     @classmethod
     def load(cls, config_path: Optional[Path] = None) -> "Config":
@@ -44,6 +58,11 @@ class Config(BaseModel):
 
         return cls()
 
+    @classmethod
+    def for_repo(cls, repo_path: Path) -> "Config":
+        """加载指定仓库的配置（优先使用仓库内的 .paper-cli.toml）。"""
+        return cls.load(Path(repo_path) / ".paper-cli.toml")
+
     def get_csv_path(self) -> Path:
         """获取 CSV 文件的绝对路径。"""
         if self.csv_path.is_absolute():
@@ -2,8 +2,9 @@
 
 from .models import Paper
 from .storage import PaperStorage
+from .library import Library
 from .markdown import MarkdownGenerator
 from .git_ops import GitOperations
 from .fetchers import FetcherRegistry, BaseFetcher
 
-__all__ = ["Paper", "PaperStorage", "MarkdownGenerator", "GitOperations", "FetcherRegistry", "BaseFetcher"]
+__all__ = ["Paper", "PaperStorage", "Library", "MarkdownGenerator", "GitOperations", "FetcherRegistry", "BaseFetcher"]
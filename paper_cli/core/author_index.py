@@ -0,0 +1,131 @@
+"""Author index keyed on normalized names, with prefix lookups."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Set
+
+from .identity import normalize_title
+
+
+AUTHOR_MATCH_MODES = ("substring", "prefix")
+
+# Normalized Authors entries that are not names.
+_PLACEHOLDERS = {"et al", "authors tbd"}
+_SEP = "\0"
+
+
+def normalize_author(name: str) -> str:
+    """Casefold, strip accents and punctuation: "Jürgen  Müller-Lee" -> "jurgen muller lee"."""
+    return normalize_title(name)
+
+
+def split_authors(value: str) -> List[str]:
+    """Split an Authors cell ("A, B, C, et al.") into names, placeholders dropped."""
+    names = []
+    for piece in (value or "").split(","):
+        name = piece.strip()
+        if name and normalize_author(name) not in _PLACEHOLDERS:
+            names.append(name)
+    return names
+
+
+def name_suffixes(key: str) -> List[str]:
+    """The name and each of its word-boundary suffixes ("yu wang" -> ["yu wang", "wang"])."""
+    words = key.split()
+    return [" ".join(words[i:]) for i in range(len(words))]
+
+
+class AuthorIndex:
+    """Normalized author name -> rows of that author's papers.
+
+    `rows(name)` is a dictionary lookup. `prefix(text)` finds every author
+    with a name, or a trailing part of it, starting with `text` ("wang",
+    "yu w" and "yu wang" all find "Yu Wang"), using a sorted list of
+    `suffix NUL name` entries and one bisection.
+    """
+
+    def __init__(self) -> None:
+        self.size = 0
+        self.postings: Dict[str, array] = {}
+        self.spellings: Dict[str, Dict[str, int]] = {}
+        self._sorted: List[str] = []
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, str]]) -> "AuthorIndex":
+        index = cls()
+        for record in records:
+            for key in index._add(record):
+                index._sorted.extend(f"{suffix}{_SEP}{key}" for suffix in name_suffixes(key))
+        index._sorted.sort()
+        return index
+
+    def _add(self, record: Dict[str, str]) -> List[str]:
+        """Index the next row; return the author keys seen for the first time."""
+        row = self.size
+        self.size += 1
+        new: List[str] = []
+        for name in split_authors(record.get("Authors", "")):
+            key = normalize_author(name)
+            if not key:
+                continue
+            posting = self.postings.get(key)
+            if posting is None:
+                posting = self.postings[key] = array("I")
+                self.spellings[key] = {}
+                new.append(key)
+            elif posting[-1] == row:
+                continue  # listed twice on one paper
+            posting.append(row)
+            spellings = self.spellings[key]
+            spellings[name] = spellings.get(name, 0) + 1
+        return new
+
+    def add_record(self, record: Dict[str, str]) -> int:
+        """Index the next CSV row and return its row number."""
+        for key in self._add(record):
+            for suffix in name_suffixes(key):
+                insort(self._sorted, f"{suffix}{_SEP}{key}")
+        return self.size - 1
+
+    def label(self, key: str) -> str:
+        """Display spelling of an author (most common; first seen wins ties)."""
+        spellings = self.spellings[key]
+        return max(spellings, key=spellings.__getitem__)
+
+    def rows(self, name: str) -> array:
+        """Rows of the author whose normalized name equals `name`'s."""
+        return self.postings.get(normalize_author(name), array("I"))
+
+    def prefix(self, text: str) -> Set[str]:
+        """Author keys with a name or trailing name part starting with `text`."""
+        needle = normalize_author(text)
+        if not needle:
+            return set()
+        found: Set[str] = set()
+        entries = self._sorted
+        for i in range(bisect_left(entries, needle), len(entries)):
+            entry = entries[i]
+            if not entry.startswith(needle):
+                break
+            found.add(entry.split(_SEP, 1)[1])
+        return found
+
+    def prefix_rows(self, text: str) -> Set[int]:
+        """Rows of every author matching `prefix(text)`."""
+        rows: Set[int] = set()
+        for key in self.prefix(text):
+            rows.update(self.postings[key])
+        return rows
+
+    def top(self, limit: int = 0, prefix: Optional[str] = None) -> Dict[str, int]:
+        """Authors by paper count, most first (ties in order of first appearance).
+
+        With `prefix`, only authors matching `prefix(prefix)` are counted.
+        """
+        keys = self.postings.keys() if not prefix else self.prefix(prefix)
+        ranked = sorted((key for key in self.postings if key in keys), key=lambda key: -len(self.postings[key]))
+        if limit > 0:
+            ranked = ranked[:limit]
+        return {self.label(key): len(self.postings[key]) for key in ranked}
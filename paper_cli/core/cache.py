@@ -0,0 +1,390 @@
+"""Binary sidecar cache for data derived from papers.csv.
+
+Parsing the CSV (and everything built on top of it) dominates the runtime of
+most commands once the library grows. Derived artifacts are therefore pickled
+into a `.paper-cache/` directory next to the CSV, each tagged with the CSV
+fingerprint (size, mtime and content hash) it was built from. A cached entry
+is only served while the CSV still matches that fingerprint, so external
+edits, `git pull` and manual fixes invalidate the cache transparently.
+
+Appends made through `PaperStorage` do not rewrite the entries. They are
+recorded in an append log instead, and an entry built before them is brought
+up to date by replaying the logged rows when it is loaded. A load that has
+to replay many rows writes the entry back in full.
+
+Unpickling runs code, and `.paper-cache/` lives in the working tree where a
+cloned repository could ship one. Every entry is therefore authenticated with
+a keyed hash under a per-user key stored outside the repository
+(`~/.config/paper-cli/cache.key`, or the file named by `$PAPER_CLI_CACHE_KEY`);
+entries that fail the check are treated as misses and never unpickled.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import os
+import pickle
+import secrets
+import struct
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+CACHE_DIRNAME = ".paper-cache"
+
+# Bump when the layout of any cached payload changes.
+CACHE_FORMAT_VERSION = 4
+
+# Entry layout: magic, MAC, header length, JSON header, pickled payload.
+_MAGIC = b"PCC2"
+_MAC_SIZE = 32
+_HEADER_LEN = struct.Struct(">I")
+
+# Entry name of the append log.
+_APPENDS = "appends"
+# Rows kept in the append log; entries older than its oldest step are rebuilt.
+_MAX_LOG_ROWS = 2000
+# A load replaying at least this many rows stores the updated entry.
+_REWRITE_AFTER_ROWS = 256
+
+# Environment variable naming the cache key file, instead of the per-user default.
+KEY_PATH_ENV = "PAPER_CLI_CACHE_KEY"
+# Keys read (or created) by this process, by key file.
+_keys: Dict[Path, bytes] = {}
+
+# Like git's "racy" index entries: a CSV modified within this window of the
+# cache write could have changed without a visible size/mtime change.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass(frozen=True)
+class CsvFingerprint:
+    """Identity of a CSV file's content at a point in time."""
+
+    size: int
+    mtime_ns: int
+    digest: str
+
+    @classmethod
+    def of(cls, path: Path) -> Optional["CsvFingerprint"]:
+        """Fingerprint `path`, or return None if it does not exist."""
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return cls(size=st.st_size, mtime_ns=st.st_mtime_ns, digest=file_digest(path))
+
+    def same_stat(self, other: "CsvFingerprint") -> bool:
+        return self.size == other.size and self.mtime_ns == other.mtime_ns
+
+
+def file_digest(path: Path) -> str:
+    """Return a content hash of `path` (cheap compared to CSV parsing)."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def cache_key_path() -> Path:
+    """Return the key file: `$PAPER_CLI_CACHE_KEY`, else `~/.config/paper-cli/cache.key`."""
+    override = os.environ.get(KEY_PATH_ENV)
+    if override:
+        return Path(override).expanduser()
+    return Path.home() / ".config" / "paper-cli" / "cache.key"
+
+
+def cache_key() -> bytes:
+    """Return the cache key, creating it on first use.
+
+    When the key file cannot be read or written, a key for this process only
+    is used: entries then still work within a run but not across runs.
+    """
+    path = cache_key_path()
+    key = _keys.get(path)
+    if key is not None:
+        return key
+    try:
+        key = path.read_bytes()
+    except OSError:
+        key = b""
+    if len(key) < 32:
+        key = secrets.token_bytes(32)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(key)
+        except FileExistsError:  # another process created it first
+            key = path.read_bytes()
+        except OSError:
+            pass
+    _keys[path] = key
+    return key
+
+
+def _mac(header: bytes, body: bytes) -> bytes:
+    h = hashlib.blake2b(key=cache_key(), digest_size=_MAC_SIZE)
+    h.update(header)
+    h.update(body)
+    return h.digest()
+
+
+def dump_entry(f: IO[bytes], header: Dict[str, Any], payload: Any) -> None:
+    """Write an authenticated entry: a JSON `header` and a pickled `payload`."""
+    head = json.dumps(header, sort_keys=True).encode("utf-8")
+    body = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+    f.write(_MAGIC + _mac(head, body) + _HEADER_LEN.pack(len(head)) + head + body)
+
+
+def load_entry(
+    f: IO[bytes], accept: Callable[[Dict[str, Any]], bool]
+) -> Optional[Tuple[Dict[str, Any], Any]]:
+    """Read an entry written by `dump_entry`; return (header, payload) or None.
+
+    `accept` sees the header before the payload is read, so stale entries
+    are rejected cheaply. The payload is only unpickled once the MAC over
+    header and payload checks out under this user's key.
+    """
+    prefix = f.read(len(_MAGIC) + _MAC_SIZE + _HEADER_LEN.size)
+    if len(prefix) != len(_MAGIC) + _MAC_SIZE + _HEADER_LEN.size or not prefix.startswith(_MAGIC):
+        return None
+    mac = prefix[len(_MAGIC) : len(_MAGIC) + _MAC_SIZE]
+    (length,) = _HEADER_LEN.unpack(prefix[-_HEADER_LEN.size :])
+    head = f.read(length)
+    header = json.loads(head)
+    if not isinstance(header, dict) or not accept(header):
+        return None
+    body = f.read()
+    if not hmac.compare_digest(mac, _mac(head, body)):
+        return None
+    return header, pickle.loads(body)
+
+
+def fingerprint_matches(
+    path: Path, stored: CsvFingerprint, written_ns: int
+) -> Optional[CsvFingerprint]:
+    """Return the current fingerprint of `path` if it still matches `stored`.
+
+    `written_ns` is when the derived data was written; files modified around
+    that time are verified by content hash rather than trusted by stat.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    if st.st_size != stored.size:
+        return None
+
+    racy = st.st_mtime_ns >= written_ns - _RACY_WINDOW_NS
+    if st.st_mtime_ns == stored.mtime_ns and not racy:
+        return stored
+
+    # Same size but touched (checkout, copy) or racy: fall back to content.
+    digest = file_digest(path)
+    if digest != stored.digest:
+        return None
+    return CsvFingerprint(size=st.st_size, mtime_ns=st.st_mtime_ns, digest=digest)
+
+
+def _header_fingerprint(header: Dict[str, Any]) -> CsvFingerprint:
+    return CsvFingerprint(size=header["size"], mtime_ns=header["mtime_ns"], digest=header["digest"])
+
+
+def _fingerprint_header(fingerprint: CsvFingerprint) -> Dict[str, Any]:
+    return {
+        "version": CACHE_FORMAT_VERSION,
+        "size": fingerprint.size,
+        "mtime_ns": fingerprint.mtime_ns,
+        "digest": fingerprint.digest,
+        "written_ns": time.time_ns(),
+    }
+
+
+class SidecarCache:
+    """Fingerprint-keyed pickle store living next to a CSV file.
+
+    Each entry is written by `dump_entry`: a JSON header with the format
+    version, CSV fingerprint and write time, then the payload, so a stale
+    entry is rejected without reading the payload.
+
+    The append log (`log_append`) is an entry too. Its header holds the CSV
+    fingerprint after the last logged append and the content digest the log
+    starts from; its payload is one `(digest after, records)` step per append.
+    """
+
+    def __init__(self, csv_path: Path, cache_dir: Optional[Path] = None):
+        self.csv_path = Path(csv_path)
+        self.cache_dir = Path(cache_dir) if cache_dir else self.csv_path.parent / CACHE_DIRNAME
+        # In-process copies of entries, so repeated loads skip unpickling.
+        self._memo: Dict[str, Tuple[CsvFingerprint, int, Any]] = {}
+
+    def _entry_path(self, name: str) -> Path:
+        return self.cache_dir / f"{self.csv_path.stem}.{name}.pickle"
+
+    def current_fingerprint(self) -> Optional[CsvFingerprint]:
+        """Fingerprint the CSV as it is on disk right now."""
+        return CsvFingerprint.of(self.csv_path)
+
+    def _matches(self, stored: CsvFingerprint, written_ns: int) -> Optional[CsvFingerprint]:
+        return fingerprint_matches(self.csv_path, stored, written_ns)
+
+    def load(self, name: str) -> Optional[Any]:
+        """Return the cached payload for `name`, or None if missing/stale."""
+        hit = self.load_with_fingerprint(name)
+        return hit[1] if hit else None
+
+    def load_with_fingerprint(
+        self, name: str, replay: Optional[Callable[[Any, Dict[str, str]], Any]] = None
+    ) -> Optional[tuple[CsvFingerprint, Any]]:
+        """Like `load`, but also return the CSV fingerprint the entry matches.
+
+        With `replay(payload, record)`, an entry built before rows were
+        appended to the CSV is updated from the append log instead of being
+        treated as stale.
+        """
+        memo = self._memo.get(name)
+        if memo is not None:
+            stored, written_ns, payload = memo
+            current = self._matches(stored, written_ns)
+            if current is not None:
+                self._memo[name] = (current, written_ns, payload)
+                return current, payload
+            del self._memo[name]
+
+        path = self._entry_path(name)
+        current: Optional[CsvFingerprint] = None
+        pending: Optional[Tuple[CsvFingerprint, int, List[Dict[str, str]]]] = None
+
+        def accept(header: Dict[str, Any]) -> bool:
+            nonlocal current, pending
+            if header.get("version") != CACHE_FORMAT_VERSION:
+                return False
+            current = self._matches(_header_fingerprint(header), header["written_ns"])
+            if current is None and replay is not None:
+                pending = self._appended_since(header["digest"])
+            return current is not None or pending is not None
+
+        try:
+            with open(path, "rb") as f:
+                entry = load_entry(f, accept)
+        except FileNotFoundError:
+            return None
+        except Exception:  # corrupt/truncated/foreign entry: treat as a miss
+            return None
+        if entry is None:
+            return None
+        header, payload = entry
+
+        if pending is not None:
+            current, written_ns, records = pending
+            for record in records:
+                replay(payload, record)
+            if len(records) >= _REWRITE_AFTER_ROWS:
+                self.store(name, payload, current)
+            else:
+                self._memo[name] = (current, written_ns, payload)
+            return current, payload
+
+        stored, written_ns = _header_fingerprint(header), header["written_ns"]
+        if not current.same_stat(stored):
+            # Refresh the stat part so the next load skips hashing again.
+            self.store(name, payload, current)
+        else:
+            self._memo[name] = (current, written_ns, payload)
+        return current, payload
+
+    def _read_log(self) -> Optional[Tuple[Dict[str, Any], List[Tuple[str, List[Dict[str, str]]]]]]:
+        """Return the append log as (header, steps), or None."""
+        try:
+            with open(self._entry_path(_APPENDS), "rb") as f:
+                return load_entry(f, lambda header: header.get("version") == CACHE_FORMAT_VERSION)
+        except Exception:  # missing/corrupt/foreign log: nothing to replay
+            return None
+
+    def _appended_since(self, digest: str) -> Optional[Tuple[CsvFingerprint, int, List[Dict[str, str]]]]:
+        """Rows appended since the CSV had content `digest`, if the log covers it.
+
+        Returns (current fingerprint, log write time, records) when the log
+        leads from `digest` to the CSV as it is now, else None.
+        """
+        log = self._read_log()
+        if log is None:
+            return None
+        header, steps = log
+        current = self._matches(_header_fingerprint(header), header["written_ns"])
+        if current is None:
+            return None
+        digests = [header["base"]] + [after for after, _ in steps]
+        if digest not in digests:
+            return None
+        start = digests.index(digest)
+        records = [record for _, step in steps[start:] for record in step]
+        return current, header["written_ns"], records
+
+    def log_append(self, before: CsvFingerprint, after: CsvFingerprint, records: Sequence[Dict[str, str]]) -> None:
+        """Record that `records` were appended, taking the CSV from `before` to `after`.
+
+        The log continues when it ends at `before`; otherwise it starts over.
+        Only the last `_MAX_LOG_ROWS` rows are kept.
+        """
+        base, steps = before.digest, []
+        log = self._read_log()
+        if log is not None:
+            header, old_steps = log
+            last = old_steps[-1][0] if old_steps else header["base"]
+            if last == before.digest:
+                base, steps = header["base"], list(old_steps)
+        steps.append((after.digest, list(records)))
+        total = sum(len(step) for _, step in steps)
+        while total > _MAX_LOG_ROWS and len(steps) > 1:
+            base, dropped = steps.pop(0)
+            total -= len(dropped)
+
+        header = _fingerprint_header(after)
+        header["base"] = base
+        self._write(_APPENDS, header, steps)
+
+    def store(self, name: str, payload: Any, fingerprint: Optional[CsvFingerprint]) -> None:
+        """Persist `payload` for `name`, tagged with the CSV `fingerprint`.
+
+        The fingerprint should be taken *before* reading the CSV so a concurrent
+        modification leaves the entry stale rather than wrong. Write failures
+        (read-only checkout, full disk) are ignored: the cache is best effort.
+        """
+        if fingerprint is None:
+            return
+        header = _fingerprint_header(fingerprint)
+        if self._write(name, header, payload):
+            self._memo[name] = (fingerprint, header["written_ns"], payload)
+
+    def _write(self, name: str, header: Dict[str, Any], payload: Any) -> bool:
+        """Atomically write one entry; return False if it could not be written."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix=".tmp-", dir=self.cache_dir)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    dump_entry(f, header, payload)
+                os.replace(tmp, self._entry_path(name))
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except OSError:
+            return False
+        return True
+
+    def clear(self) -> None:
+        """Drop every cache entry belonging to this CSV."""
+        self._memo.clear()
+        if not self.cache_dir.exists():
+            return
+        for path in self.cache_dir.glob(f"{self.csv_path.stem}.*.pickle"):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,74 @@
+"""Date-sorted row permutation for range queries and recency order."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, Iterator
+
+from .table import pack_date
+
+
+class DateIndex:
+    """Rows ordered by packed YYYYMM date (ties in CSV order).
+
+    `keys[i]` is the date of row `order[i]`; rows without a valid date are
+    kept apart in `undated`. Range queries are two bisections on `keys`, and
+    the most-recent-first order is a backward walk over date groups, so
+    `--recent --limit N` touches only the rows it returns.
+    """
+
+    def __init__(self) -> None:
+        self.size = 0
+        self.keys = array("i")
+        self.order = array("I")
+        self.undated = array("I")
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, str]]) -> "DateIndex":
+        index = cls()
+        dated = []
+        for row, record in enumerate(records):
+            packed = pack_date(record.get("Date", "") or "")
+            if packed:
+                dated.append((packed, row))
+            else:
+                index.undated.append(row)
+            index.size += 1
+        dated.sort()
+        index.keys = array("i", (packed for packed, _ in dated))
+        index.order = array("I", (row for _, row in dated))
+        return index
+
+    def add_record(self, record: Dict[str, str]) -> int:
+        """Index the next CSV row and return its row number."""
+        row = self.size
+        self.size += 1
+        packed = pack_date(record.get("Date", "") or "")
+        if not packed:
+            self.undated.append(row)
+            return row
+        # The new row number is the largest, so it goes after its date's ties.
+        at = bisect_right(self.keys, packed)
+        self.keys.insert(at, packed)
+        self.order.insert(at, row)
+        return row
+
+    def range(self, date_from: int = 0, date_to: int = 0) -> array:
+        """Rows dated within [date_from, date_to] (packed YYYYMM; 0 = open end)."""
+        lo = bisect_left(self.keys, date_from) if date_from else 0
+        hi = bisect_right(self.keys, date_to) if date_to else len(self.keys)
+        return self.order[lo:hi]
+
+    def recent(self) -> Iterator[int]:
+        """Yield every row, most recent date first; undated rows come last.
+
+        Matches a stable `sorted(..., reverse=True)` over CSV order.
+        """
+        keys, order = self.keys, self.order
+        hi = len(keys)
+        while hi > 0:
+            lo = bisect_left(keys, keys[hi - 1], 0, hi)
+            yield from order[lo:hi]
+            hi = lo
+        yield from self.undated
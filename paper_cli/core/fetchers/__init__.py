@@ -1,9 +1,12 @@
 """Paper fetchers for different sources."""
 
 from abc import ABC, abstractmethod
+from pathlib import Path
 from typing import Optional
 import re
 
+from ...config import Config
+from ..http_cache import ResponseCache
 from ..models import Paper
 
 
@@ -24,15 +27,24 @@ class BaseFetcher(ABC):
 class FetcherRegistry:
     """Registry for paper fetchers with auto-detection."""
 
-    def __init__(self):
+    def __init__(self, cache: Optional[ResponseCache] = None, offline: bool = False):
         from .arxiv import ArxivFetcher
         from .crossref import CrossRefFetcher
 
+        self.cache = cache
+        self.offline = offline
         self._fetchers = [
-            ArxivFetcher(),
-            CrossRefFetcher(),
+            ArxivFetcher(cache, offline),
+            CrossRefFetcher(cache, offline),
         ]
 
+    @classmethod
+    def for_repo(cls, repo_path: Path, offline: bool = False) -> "FetcherRegistry":
+        """Fetchers caching their responses in the repository's `.paper-cache/http/`."""
+        config = Config.for_repo(repo_path)
+        cache = ResponseCache.for_repo(repo_path, max_bytes=config.http_cache_max_mb * 1024 * 1024)
+        return cls(cache, offline)
+
     def get_fetcher(self, url: str) -> BaseFetcher:
         """Get appropriate fetcher for the given URL."""
         for fetcher in self._fetchers:
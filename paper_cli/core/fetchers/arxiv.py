@@ -2,20 +2,42 @@
 
 import re
 import arxiv
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from . import BaseFetcher
+from ..http_cache import ResponseCache, Throttle, cached_session
 from ..models import Paper
 
 
 class ArxivFetcher(BaseFetcher):
     """Fetcher for arXiv papers."""
 
-    def __init__(self):
+    # Ids per `id_list` query in `fetch_many` (also the result page size).
+    BATCH_SIZE = 100
+    # How long a cached API response is used without revalidation (seconds).
+    CACHE_TTL = 7 * 24 * 3600
+    # Minimum seconds between API requests (arXiv asks for one every 3 s).
+    REQUEST_INTERVAL = 3.0
+
+    def __init__(self, cache: Optional[ResponseCache] = None, offline: bool = False):
+        # One client for every query. Successive API requests are spaced by
+        # `REQUEST_INTERVAL`, whether they serve one paper or a whole batch;
+        # the spacing is applied by the session right before a request goes
+        # out, so responses served from the cache never wait. (The client's
+        # own `delay_seconds` would sleep before cache hits too.)
+        # Offline, every response comes from the cache: no delay, no retries.
         self.client = arxiv.Client(
-            page_size=1,
-            delay_seconds=3.0,
-            num_retries=3
+            page_size=self.BATCH_SIZE,
+            delay_seconds=0.0,
+            num_retries=0 if offline else 3
+        )
+        # arxiv.Client has no public hook for its HTTP session.
+        cached_session(
+            cache,
+            self.CACHE_TTL,
+            offline,
+            session=self.client._session,
+            throttle=None if offline else Throttle(self.REQUEST_INTERVAL),
         )
 
     def can_handle(self, url: str) -> bool:
@@ -36,6 +58,52 @@ class ArxivFetcher(BaseFetcher):
         if not result:
             raise ValueError(f"Paper not found on arXiv: {paper_id}")
 
+        return self._to_paper(result, custom_tag)
+
+    def fetch_many(
+        self, urls: Iterable[str], custom_tag: Optional[str] = None
+    ) -> Tuple[Dict[str, Paper], List[str]]:
+        """Fetch many arXiv papers with one API query per `BATCH_SIZE` ids.
+
+        Returns ({input: Paper} in input order, inputs not found on arXiv).
+        Raises ValueError before any request if an input is not an arXiv id.
+        """
+        inputs = list(dict.fromkeys(urls))
+        ids = {url: self._extract_id(url) for url in inputs}
+        unique_ids = list(dict.fromkeys(ids.values()))
+
+        found: Dict[str, arxiv.Result] = {}
+        for start in range(0, len(unique_ids), self.BATCH_SIZE):
+            self._fetch_batch(unique_ids[start:start + self.BATCH_SIZE], found)
+
+        papers = {url: self._to_paper(found[ids[url]], custom_tag) for url in inputs if ids[url] in found}
+        missing = [url for url in inputs if ids[url] not in found]
+        return papers, missing
+
+    def _fetch_batch(self, paper_ids: List[str], found: Dict[str, "arxiv.Result"]) -> None:
+        """Look up `paper_ids` in one query, adding results to `found` by bare id.
+
+        arXiv can reject a whole query over one bad id, so a failing batch
+        is split in halves until the offending ids are isolated (and missing).
+        """
+        search = arxiv.Search(id_list=paper_ids, max_results=len(paper_ids))
+        try:
+            results = list(self.client.results(search))
+        except arxiv.HTTPError:
+            if len(paper_ids) == 1:
+                return
+            middle = len(paper_ids) // 2
+            self._fetch_batch(paper_ids[:middle], found)
+            self._fetch_batch(paper_ids[middle:], found)
+            return
+        wanted = set(paper_ids)
+        for result in results:
+            match = re.search(r'(\d{4}\.\d{4,5})', result.entry_id)
+            if match and match.group(1) in wanted:
+                found[match.group(1)] = result
+
+    def _to_paper(self, result: "arxiv.Result", custom_tag: Optional[str] = None) -> Paper:
+        """Build a Paper from an arXiv API result."""
         # Format authors
         authors = self._format_authors(result.authors)
 
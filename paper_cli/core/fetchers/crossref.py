@@ -7,6 +7,7 @@ from typing import Optional
 from urllib.parse import quote
 
 from . import BaseFetcher
+from ..http_cache import CachingAdapter, ResponseCache, cached_session
 from ..models import Paper
 
 
@@ -16,6 +17,15 @@ class CrossRefFetcher(BaseFetcher):
     CROSSREF_API = "https://api.crossref.org/works/"
     _IMWUT_ISSN = "2474-9567"
     _DOI_RE = re.compile(r"(10\.\d{4,9}/[^\s\"'<>]+)", re.IGNORECASE)
+    # How long cached responses are used without revalidation (seconds).
+    CACHE_TTL = 30 * 24 * 3600
+    IEEE_CACHE_TTL = 180 * 24 * 3600
+
+    def __init__(self, cache: Optional[ResponseCache] = None, offline: bool = False):
+        self.session = cached_session(cache, self.CACHE_TTL, offline)
+        if cache is not None:
+            # A document's DOI never changes: keep IEEE landing pages longer.
+            self.session.mount("https://ieeexplore.ieee.org/", CachingAdapter(cache, self.IEEE_CACHE_TTL, offline))
 
     def _clean_doi(self, doi: str) -> str:
         """Clean a DOI token extracted from text/URLs."""
@@ -71,7 +81,7 @@ class CrossRefFetcher(BaseFetcher):
             raise ValueError(f"Could not extract DOI from: {url}")
 
         # Fetch from CrossRef
-        response = requests.get(
+        response = self.session.get(
             f"{self.CROSSREF_API}{quote(doi)}",
             headers={"Accept": "application/json"},
             timeout=10
@@ -81,7 +91,10 @@ class CrossRefFetcher(BaseFetcher):
             raise ValueError(f"CrossRef API error: {response.status_code}")
 
         data = response.json().get("message", {})
+        return self._paper_from_message(doi, data, custom_tag)
 
+    def _paper_from_message(self, doi: str, data: dict, custom_tag: Optional[str] = None) -> Paper:
+        """Build a Paper from the `message` of a CrossRef works response."""
         # Extract metadata
         title = self._normalize_title(data.get("title", [""])[0])
         if not title:
@@ -168,7 +181,7 @@ class CrossRefFetcher(BaseFetcher):
     def _fetch_ieee_doi(self, url: str) -> Optional[str]:
         """Fetch IEEE Xplore page and parse DOI."""
         try:
-            resp = requests.get(
+            resp = self.session.get(
                 url,
                 headers={
                     # Some sites block requests without a UA; keep it simple.
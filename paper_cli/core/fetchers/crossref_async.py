@@ -0,0 +1,240 @@
+"""Asynchronous CrossRef fetcher for looking up many DOIs at once."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+from urllib.parse import quote
+
+from ..http_cache import ResponseCache, cached_session
+from ..models import Paper
+from .crossref import CrossRefFetcher
+
+
+_INTERVAL_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*(ms|s|m|h)?\s*$")
+_INTERVAL_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0, None: 1.0}
+
+
+def parse_rate_limit(headers: Mapping[str, str]) -> Optional[Tuple[int, float]]:
+    """(requests, seconds) from CrossRef's `X-Rate-Limit-Limit` / `-Interval` headers.
+
+    Returns None when the headers are missing or malformed.
+    """
+    limit = headers.get("X-Rate-Limit-Limit")
+    interval = _INTERVAL_RE.match(headers.get("X-Rate-Limit-Interval") or "")
+    if not limit or not interval:
+        return None
+    try:
+        count = int(limit)
+    except ValueError:
+        return None
+    seconds = float(interval.group(1)) * _INTERVAL_UNITS[interval.group(2)]
+    if count <= 0 or seconds <= 0:
+        return None
+    return count, seconds
+
+
+class TokenBucket:
+    """Async token bucket: `rate` requests per second, bursts of up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def configure(self, rate: float, capacity: float) -> None:
+        """Change the rate (e.g. from server headers), keeping the tokens earned so far."""
+        self._refill()
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = min(self._tokens, capacity)
+
+    async def acquire(self) -> None:
+        """Wait for and take one token; waiters are served first come, first served."""
+        if self._lock is None:
+            # Created lazily so the bucket can be built outside a running loop.
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class AsyncCrossRefFetcher:
+    """Fetch many DOIs from CrossRef concurrently and politely.
+
+    Requests go through one keep-alive `requests.Session` (run on a thread
+    pool of `concurrency` workers), at most `concurrency` at a time. A token
+    bucket spaces them at `rate` per second, lowered to what CrossRef's
+    `X-Rate-Limit-*` response headers allow. Concurrent lookups of the same
+    DOI share one request. Metadata is parsed exactly like `CrossRefFetcher`.
+    With a `cache`, responses are cached like the synchronous fetcher's and
+    cache hits take no token; `offline` serves them from the cache only.
+    `requests_sent` counts the requests that reached the network.
+
+        async with AsyncCrossRefFetcher(concurrency=8) as fetcher:
+            papers, errors = await fetcher.fetch_many(dois)
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 8,
+        rate: float = 5.0,
+        api_url: str = CrossRefFetcher.CROSSREF_API,
+        timeout: float = 10.0,
+        mailto: Optional[str] = None,
+        max_retries: int = 2,
+        cache: Optional[ResponseCache] = None,
+        offline: bool = False,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self.parser = CrossRefFetcher(cache, offline)
+        self.api_url = api_url
+        self.concurrency = concurrency
+        self.max_rate = rate
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.offline = offline
+        self.bucket = TokenBucket(rate, capacity=concurrency)
+        self.requests_sent = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # The session takes a bucket token right before a request goes out,
+        # so responses answered from the cache are not rate limited.
+        self.session = cached_session(
+            cache,
+            CrossRefFetcher.CACHE_TTL,
+            offline,
+            throttle=None if offline else self._wait_for_token,
+            pool_connections=1,
+            pool_maxsize=concurrency,
+        )
+        # A mailto in the User-Agent puts requests in CrossRef's "polite" pool.
+        agent = f"paper-cli/0.1.0 (mailto:{mailto})" if mailto else "paper-cli/0.1.0"
+        self.session.headers.update({"Accept": "application/json", "User-Agent": agent})
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="crossref")
+
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def __aenter__(self) -> "AsyncCrossRefFetcher":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close pooled connections and worker threads."""
+        self._executor.shutdown(wait=False)
+        self.session.close()
+
+    def can_handle(self, url: str) -> bool:
+        return self.parser.can_handle(url)
+
+    async def fetch(self, url: str, custom_tag: Optional[str] = None) -> Paper:
+        """Fetch paper metadata from CrossRef (same result as `CrossRefFetcher.fetch`)."""
+        doi = await self._extract_doi(url)
+        if not doi:
+            raise ValueError(f"Could not extract DOI from: {url}")
+        data = await self._message(doi)
+        return self.parser._paper_from_message(doi, data, custom_tag)
+
+    async def fetch_many(
+        self, urls: Iterable[str], custom_tag: Optional[str] = None
+    ) -> Tuple[Dict[str, Paper], Dict[str, Exception]]:
+        """Fetch every input concurrently.
+
+        Returns ({input: Paper}, {input: error}), both in input order.
+        """
+        inputs = list(dict.fromkeys(urls))
+        results = await asyncio.gather(*(self.fetch(url, custom_tag) for url in inputs), return_exceptions=True)
+        papers: Dict[str, Paper] = {}
+        errors: Dict[str, Exception] = {}
+        for url, result in zip(inputs, results):
+            if isinstance(result, Paper):
+                papers[url] = result
+            elif isinstance(result, Exception):
+                errors[url] = result
+            else:  # cancellation and other BaseExceptions
+                raise result
+        return papers, errors
+
+    async def _extract_doi(self, url: str) -> Optional[str]:
+        match = self.parser._DOI_RE.search(url or "")
+        if match:
+            return self.parser._clean_doi(match.group(1))
+        # IEEE document URLs need a (blocking) landing page request.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.parser._extract_doi, url)
+
+    async def _message(self, doi: str) -> dict:
+        """CrossRef `message` for a DOI; concurrent callers share one request."""
+        key = doi.lower()  # DOIs are case-insensitive
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._request(doi))
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._inflight.pop(key, None))
+        # Shielded: one caller giving up must not cancel the others.
+        return await asyncio.shield(future)
+
+    def _wait_for_token(self) -> None:
+        """Session throttle: block the worker thread until the bucket grants a request."""
+        asyncio.run_coroutine_threadsafe(self._take_token(), self._loop).result()
+
+    async def _take_token(self) -> None:
+        await self.bucket.acquire()
+        self.requests_sent += 1
+
+    async def _request(self, doi: str) -> dict:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        loop = self._loop = asyncio.get_running_loop()
+        url = f"{self.api_url}{quote(doi)}"
+        async with self._semaphore:
+            attempt = 0
+            while True:
+                response = await loop.run_in_executor(
+                    self._executor, lambda: self.session.get(url, timeout=self.timeout)
+                )
+                self._apply_rate_limit(response.headers)
+                if response.status_code == 429 and attempt < self.max_retries:
+                    attempt += 1
+                    await asyncio.sleep(self._retry_after(response.headers))
+                    continue
+                if response.status_code != 200:
+                    raise ValueError(f"CrossRef API error: {response.status_code}")
+                return response.json().get("message", {})
+
+    def _apply_rate_limit(self, headers: Mapping[str, str]) -> None:
+        limit = parse_rate_limit(headers)
+        if limit is None:
+            return
+        count, seconds = limit
+        rate = min(self.max_rate, count / seconds)
+        capacity = max(1.0, min(float(self.concurrency), rate * seconds))
+        if (rate, capacity) != (self.bucket.rate, self.bucket.capacity):
+            self.bucket.configure(rate, capacity)
+
+    @staticmethod
+    def _retry_after(headers: Mapping[str, str]) -> float:
+        try:
+            return max(0.0, float(headers.get("Retry-After", "1")))
+        except ValueError:
+            return 1.0
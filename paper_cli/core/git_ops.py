@@ -57,10 +57,17 @@ class GitOperations:
         return bool(result.stdout.strip())
 
     def add_files(self, files: List[str]) -> bool:
-        """添加文件到暂存区。"""
+        """添加文件到暂存区。
+
+        Paths that no longer exist are staged as deletions (a no-op if they
+        were never tracked).
+        """
         try:
             for file in files:
-                self._run(["git", "add", file], check=True)
+                if (self.repo_path / file).exists():
+                    self._run(["git", "add", file], check=True)
+                else:
+                    self._run(["git", "rm", "-r", "--cached", "--quiet", "--ignore-unmatch", "--", file], check=True)
             return True
         except (subprocess.CalledProcessError, OSError):
             return False
@@ -0,0 +1,300 @@
+"""On-disk cache of raw HTTP responses from the metadata fetchers.
+
+Fetchers go through a `requests` session with a `CachingAdapter` mounted, so
+the arXiv API, CrossRef and IEEE landing pages are cached the same way:
+
+- a response younger than the source's TTL is served without a request;
+- an older one is revalidated with `If-None-Match` / `If-Modified-Since`
+  (a 304 renews it), and is still served when the network is unreachable;
+- in offline mode nothing is requested and a miss raises `OfflineCacheMiss`.
+
+Rate limits are applied by a `throttle` callable the adapter runs right before
+each network request, so responses served from the cache never wait for one.
+
+Bodies are stored once per content hash under `objects/`; a small SQLite
+index maps request URLs to bodies and validators and drives LRU eviction
+once the stored bodies exceed `max_bytes`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .cache import CACHE_DIRNAME
+
+
+HTTP_CACHE_DIRNAME = "http"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    body TEXT NOT NULL,
+    content_type TEXT NOT NULL DEFAULT '',
+    etag TEXT NOT NULL DEFAULT '',
+    last_modified TEXT NOT NULL DEFAULT '',
+    stored_at REAL NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_used ON entries (used_at);
+CREATE INDEX IF NOT EXISTS entries_body ON entries (body);
+CREATE TABLE IF NOT EXISTS objects (hash TEXT PRIMARY KEY, size INTEGER NOT NULL);
+"""
+
+
+class OfflineCacheMiss(requests.ConnectionError):
+    """Offline mode was asked for a response that is not cached."""
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    url: str
+    body: bytes
+    content_type: str
+    etag: str
+    last_modified: str
+    stored_at: float
+
+
+class ResponseCache:
+    """Content-addressed response store with an LRU size bound (0 = unbounded).
+
+    Every call opens its own SQLite connection, so one cache can be shared by
+    threads (the async CrossRef fetcher) and concurrent `paper` processes.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = 200 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._ready = False
+
+    @classmethod
+    def for_repo(cls, repo_path: Path, max_bytes: int = 200 * 1024 * 1024) -> "ResponseCache":
+        return cls(Path(repo_path) / CACHE_DIRNAME / HTTP_CACHE_DIRNAME, max_bytes)
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._ready:
+            (self.directory / "objects").mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.directory / "index.sqlite", timeout=30)
+        if not self._ready:
+            conn.executescript(_SCHEMA)
+            self._ready = True
+        return conn
+
+    def _object_path(self, digest: str) -> Path:
+        return self.directory / "objects" / digest[:2] / digest
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """The stored response for `url` (marking it recently used), or None."""
+        conn = self._connect()
+        try:
+            with conn:
+                row = conn.execute(
+                    "SELECT body, content_type, etag, last_modified, stored_at FROM entries WHERE key = ?",
+                    (self.key(url),),
+                ).fetchone()
+                if row is None:
+                    return None
+                try:
+                    body = self._object_path(row[0]).read_bytes()
+                except OSError:  # body evicted or deleted by hand
+                    conn.execute("DELETE FROM entries WHERE key = ?", (self.key(url),))
+                    return None
+                conn.execute("UPDATE entries SET used_at = ? WHERE key = ?", (time.time(), self.key(url)))
+        finally:
+            conn.close()
+        return CachedResponse(url, body, row[1], row[2], row[3], row[4])
+
+    def put(self, url: str, body: bytes, content_type: str = "", etag: str = "", last_modified: str = "") -> None:
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix=".tmp-", dir=path.parent)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(body)
+                os.replace(tmp, path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("INSERT OR IGNORE INTO objects (hash, size) VALUES (?, ?)", (digest, len(body)))
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (self.key(url), url, digest, content_type, etag, last_modified, now, now),
+                )
+                self._evict(conn)
+        finally:
+            conn.close()
+
+    def renew(self, url: str) -> None:
+        """Restart the TTL of `url` after a successful revalidation."""
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("UPDATE entries SET stored_at = ?, used_at = ? WHERE key = ?", (now, now, self.key(url)))
+        finally:
+            conn.close()
+
+    def size(self) -> int:
+        conn = self._connect()
+        try:
+            return conn.execute("SELECT COALESCE(SUM(size), 0) FROM objects").fetchone()[0]
+        finally:
+            conn.close()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop least recently used entries (and orphaned bodies) down to `max_bytes`."""
+        orphans = conn.execute("SELECT hash FROM objects WHERE hash NOT IN (SELECT body FROM entries)").fetchall()
+        for (digest,) in orphans:  # bodies of replaced entries
+            conn.execute("DELETE FROM objects WHERE hash = ?", (digest,))
+            self._object_path(digest).unlink(missing_ok=True)
+        if self.max_bytes <= 0:
+            return
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM objects").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, digest in conn.execute("SELECT key, body FROM entries ORDER BY used_at").fetchall():
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            if conn.execute("SELECT 1 FROM entries WHERE body = ? LIMIT 1", (digest,)).fetchone() is None:
+                total -= conn.execute("SELECT size FROM objects WHERE hash = ?", (digest,)).fetchone()[0]
+                conn.execute("DELETE FROM objects WHERE hash = ?", (digest,))
+                self._object_path(digest).unlink(missing_ok=True)
+            if total <= self.max_bytes:
+                break
+
+
+class Throttle:
+    """Spaces successive calls at least `interval` seconds apart (thread-safe)."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> None:
+        with self._lock:
+            wait = self._next - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._next = time.monotonic() + self.interval
+
+
+class ThrottledAdapter(HTTPAdapter):
+    """`requests` transport that calls `throttle()` before every request it sends."""
+
+    def __init__(self, throttle: Optional[Callable[[], None]] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.throttle = throttle
+
+    def send(self, request, **kwargs):
+        if self.throttle is not None:
+            self.throttle()
+        return super().send(request, **kwargs)
+
+
+class CachingAdapter(ThrottledAdapter):
+    """`requests` transport that answers GETs from a `ResponseCache`.
+
+    `ttl` is in seconds. Only 200 responses are stored. The throttle only
+    runs for requests that reach the network (including revalidations).
+    """
+
+    def __init__(self, cache: ResponseCache, ttl: float, offline: bool = False, **kwargs):
+        super().__init__(**kwargs)
+        self.cache = cache
+        self.ttl = ttl
+        self.offline = offline
+
+    def send(self, request, **kwargs):
+        if request.method != "GET":
+            return super().send(request, **kwargs)
+        url = request.url
+        entry = self.cache.get(url)
+        if entry is not None and (self.offline or time.time() - entry.stored_at < self.ttl):
+            return self._from_cache(request, entry)
+        if self.offline:
+            raise OfflineCacheMiss(f"Not in the offline cache: {url}", request=request)
+
+        if entry is not None:
+            if entry.etag:
+                request.headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request.headers["If-Modified-Since"] = entry.last_modified
+        try:
+            response = super().send(request, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            if entry is None:
+                raise
+            return self._from_cache(request, entry)  # stale beats nothing
+
+        if response.status_code == 304 and entry is not None:
+            self.cache.renew(url)
+            return self._from_cache(request, entry)
+        if response.status_code == 200:
+            self.cache.put(
+                url,
+                response.content,
+                response.headers.get("Content-Type", ""),
+                response.headers.get("ETag", ""),
+                response.headers.get("Last-Modified", ""),
+            )
+        return response
+
+    def _from_cache(self, request, entry: CachedResponse) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = request.url
+        response.request = request
+        response._content = entry.body
+        response.headers = CaseInsensitiveDict({"Content-Type": entry.content_type, "X-Paper-Cache": "hit"})
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.connection = self
+        return response
+
+
+def cached_session(
+    cache: Optional[ResponseCache],
+    ttl: float,
+    offline: bool = False,
+    session: Optional[requests.Session] = None,
+    throttle: Optional[Callable[[], None]] = None,
+    **adapter_options,
+) -> requests.Session:
+    """A session (new or the given one) whose http(s) requests go through `cache`.
+
+    `throttle` is called before each request that is actually sent.
+    """
+    session = session or requests.Session()
+    if cache is not None:
+        adapter = CachingAdapter(cache, ttl, offline=offline, throttle=throttle, **adapter_options)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+    elif adapter_options or throttle is not None:
+        adapter = ThrottledAdapter(throttle, **adapter_options)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+    return session
@@ -0,0 +1,156 @@
+"""Paper identity normalization and the duplicate-detection index."""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+
+_ARXIV_ID_RE = re.compile(r"(\d{4}\.\d{4,5})(?:v\d+)?", re.IGNORECASE)
+_ARXIV_BARE_RE = re.compile(r"^\d{4}\.\d{4,5}(?:v\d+)?$", re.IGNORECASE)
+_DOI_RE = re.compile(r"(10\.\d{4,9}/[^\s]+)", re.IGNORECASE)
+_TITLE_PUNCT_RE = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def extract_arxiv_id(value: str) -> Optional[str]:
+    """Extract canonical arXiv id (without version) from an arXiv-like input."""
+    if not value:
+        return None
+
+    raw = str(value).strip()
+    lowered = raw.lower()
+    looks_like_arxiv = (
+        "arxiv.org" in lowered
+        or lowered.startswith("arxiv:")
+        or bool(_ARXIV_BARE_RE.fullmatch(raw))
+    )
+    if not looks_like_arxiv:
+        return None
+
+    match = _ARXIV_ID_RE.search(raw)
+    return match.group(1) if match else None
+
+
+def extract_doi(value: str) -> Optional[str]:
+    """Extract and normalize DOI token from free text/URLs."""
+    if not value:
+        return None
+
+    match = _DOI_RE.search(str(value))
+    if not match:
+        return None
+
+    doi = match.group(1)
+    doi = re.split(r"[&#?]", doi, maxsplit=1)[0]
+    doi = doi.lstrip("(<[{\"'")
+    doi = doi.rstrip(".,;:)]}>\"'")
+    return doi.lower()
+
+
+def normalize_link(value: str) -> str:
+    """Normalize links for safer duplicate checks without changing semantics."""
+    if not value:
+        return ""
+
+    raw = str(value).strip()
+    if not raw:
+        return ""
+
+    parsed = urlsplit(raw)
+    if not (parsed.scheme and parsed.netloc):
+        return raw
+
+    # Normalize only scheme/host case and trailing slash in path.
+    path = parsed.path.rstrip("/")
+    return urlunsplit((parsed.scheme.lower(), parsed.netloc.lower(), path, parsed.query, parsed.fragment))
+
+
+def normalize_title(value: str) -> str:
+    """Normalize a title for near-duplicate checks (case, accents, punctuation)."""
+    if not value:
+        return ""
+    text = unicodedata.normalize("NFKD", str(value).casefold())
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return " ".join(_TITLE_PUNCT_RE.sub(" ", text).split())
+
+
+def record_keys(doi: str, link: str, title: str) -> List[Tuple[str, str]]:
+    """Return the `(kind, key)` identity keys of a stored paper."""
+    keys: List[Tuple[str, Optional[str]]] = []
+    if doi:
+        keys.append(("doi", extract_doi(doi)))
+    if link:
+        keys.append(("link", normalize_link(link)))
+        keys.append(("doi", extract_doi(link)))
+        keys.append(("arxiv", extract_arxiv_id(link)))
+    keys.append(("title", normalize_title(title)))
+    return [(kind, key) for kind, key in keys if key]
+
+
+def query_keys(link: str) -> List[Tuple[str, str]]:
+    """Return the `(kind, key)` pairs a user-supplied link/DOI/arXiv id matches on.
+
+    Notes:
+        - arXiv IDs are only extracted/compared when the input looks like an arXiv link/ID.
+          (Avoid false positives on ACM DOIs like 10.1145/3706598.3713728.)
+        - DOIs are compared against stored DOI fields and DOI-style links.
+        - Fallback link matching uses normalized links (trim + URL host/scheme normalization).
+    """
+    if not link:
+        return []
+    keys = [("doi", extract_doi(link)), ("arxiv", extract_arxiv_id(link)), ("link", normalize_link(link))]
+    return [(kind, key) for kind, key in keys if key]
+
+
+class IdentityIndex:
+    """Maps normalized DOI / arXiv id / link / title keys to CSV row numbers.
+
+    Row numbers are 0-based positions of data rows in papers.csv. The index is
+    persisted in the sidecar cache and extended in place when rows are appended,
+    so duplicate checks are dictionary lookups instead of full CSV scans.
+    """
+
+    def __init__(self) -> None:
+        self.size = 0
+        self.keys: Dict[str, Dict[str, List[int]]] = {
+            "doi": {},
+            "arxiv": {},
+            "link": {},
+            "title": {},
+        }
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, str]]) -> "IdentityIndex":
+        """Build from CSV-style row dicts in row order."""
+        index = cls()
+        for record in records:
+            index.add_record(record)
+        return index
+
+    def add_record(self, record: Dict[str, str]) -> int:
+        """Index the next CSV row and return its row number."""
+        return self.add(record.get("DOI", ""), record.get("Link", ""), record.get("Title", ""))
+
+    def add(self, doi: str, link: str, title: str) -> int:
+        """Index the next row and return its row number."""
+        row = self.size
+        self.size += 1
+        for kind, key in record_keys(doi, link, title):
+            rows = self.keys[kind].setdefault(key, [])
+            if not rows or rows[-1] != row:
+                rows.append(row)
+        return row
+
+    def lookup(self, link: str) -> Set[int]:
+        """Return rows matching a user-supplied link/DOI/arXiv id (see `query_keys`)."""
+        rows: Set[int] = set()
+        for kind, key in query_keys(link):
+            rows.update(self.keys[kind].get(key, ()))
+        return rows
+
+    def lookup_title(self, title: str) -> Set[int]:
+        """Return rows whose normalized title equals `title`'s."""
+        key = normalize_title(title)
+        return set(self.keys["title"].get(key, ())) if key else set()
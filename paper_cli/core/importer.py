@@ -0,0 +1,260 @@
+"""Bulk import of papers from a file of links and DOIs.
+
+The input is processed in chunks of `batch_size` links. For each chunk,
+links already in the library are skipped, arXiv ids are fetched with
+batched API queries (in a worker thread) while DOIs go through the async
+CrossRef fetcher, and the fetched papers are appended to papers.csv with one
+journaled write. A checkpoint in `.paper-cache/import/` then records the
+chunk's links, so an interrupted import resumes after the last finished
+chunk. Re-running a chunk whose append landed before the checkpoint did is
+harmless: its papers are found in the library and skipped. Links that failed
+to fetch are left out of the checkpoint and retried by the next run, except
+malformed ones and arXiv ids arXiv does not know, which a retry cannot fix:
+those are recorded as "rejected".
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .cache import CACHE_DIRNAME
+from .fetchers import FetcherRegistry
+from .fetchers.arxiv import ArxivFetcher
+from .fetchers.crossref import CrossRefFetcher
+from .fetchers.crossref_async import AsyncCrossRefFetcher
+from .locking import atomic_write_text
+from .models import Paper
+from .storage import PaperStorage
+
+
+# "#" starts a comment at the beginning of a line or after whitespace (not in URLs).
+_COMMENT_RE = re.compile(r"(^|\s)#.*$")
+
+
+@dataclass(frozen=True)
+class ImportItem:
+    """One input line: a link/DOI/arXiv id and the topic it goes under."""
+
+    link: str
+    topic: str
+
+
+@dataclass
+class ImportStats:
+    added: int = 0
+    skipped: int = 0
+    failed: int = 0
+    # Of `failed`, malformed or unknown inputs; unlike other failures they are not retried.
+    rejected: int = 0
+    # Failed inputs with the reason.
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def retryable(self) -> int:
+        return self.failed - self.rejected
+
+    @property
+    def processed(self) -> int:
+        return self.added + self.skipped + self.failed
+
+
+def read_import_file(path: Path, default_topic: str) -> List[ImportItem]:
+    """Parse an import file: one `LINK [TOPIC]` per line, `#` starts a comment.
+
+    Repeated links keep their first occurrence.
+    """
+    items: Dict[str, ImportItem] = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = _COMMENT_RE.sub("", line).strip()
+            if not line:
+                continue
+            parts = line.split(None, 1)
+            link = parts[0]
+            topic = parts[1].strip() if len(parts) > 1 else default_topic
+            items.setdefault(link, ImportItem(link, topic))
+    return list(items.values())
+
+
+class ImportCheckpoint:
+    """Links of an import file that are done, kept across runs.
+
+    Statuses are "added", "synced" (added and already in a README update and
+    commit), "skipped" (already in the library) and "rejected" (malformed or
+    not found on arXiv).
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.done: Dict[str, str] = {}
+
+    @classmethod
+    def for_file(cls, repo_path: Path, source: Path) -> "ImportCheckpoint":
+        key = hashlib.blake2b(str(Path(source).resolve()).encode("utf-8"), digest_size=8).hexdigest()
+        return cls(Path(repo_path) / CACHE_DIRNAME / "import" / f"{key}.json")
+
+    def load(self) -> "ImportCheckpoint":
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        done = data.get("done") if isinstance(data, dict) else None
+        self.done = dict(done) if isinstance(done, dict) else {}
+        return self
+
+    def record(self, statuses: Dict[str, str]) -> None:
+        self.done.update(statuses)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(self.path, json.dumps({"done": self.done}, sort_keys=True))
+
+    def clear(self) -> None:
+        self.done = {}
+        self.path.unlink(missing_ok=True)
+
+
+class Importer:
+    """Fetch, deduplicate and append the papers of many `ImportItem`s."""
+
+    def __init__(
+        self,
+        storage: PaperStorage,
+        registry: FetcherRegistry,
+        concurrency: int = 8,
+        batch_size: int = 100,
+        custom_tag: Optional[str] = None,
+        checkpoint: Optional[ImportCheckpoint] = None,
+    ):
+        self.storage = storage
+        self.registry = registry
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.custom_tag = custom_tag
+        self.checkpoint = checkpoint
+
+    def pending(self, items: Sequence[ImportItem]) -> List[ImportItem]:
+        """Items not finished by an earlier (interrupted) run."""
+        done = self.checkpoint.done if self.checkpoint is not None else {}
+        return [item for item in items if item.link not in done]
+
+    def run(
+        self, items: Sequence[ImportItem], on_progress: Optional[Callable[[ImportStats, int], None]] = None
+    ) -> ImportStats:
+        """Import `items` chunk by chunk; `on_progress(stats, n)` follows every chunk."""
+        return asyncio.run(self._run(list(items), on_progress))
+
+    async def _run(self, items: List[ImportItem], on_progress) -> ImportStats:
+        stats = ImportStats()
+        crossref = AsyncCrossRefFetcher(
+            concurrency=self.concurrency, cache=self.registry.cache, offline=self.registry.offline
+        )
+        try:
+            for start in range(0, len(items), self.batch_size):
+                chunk = items[start : start + self.batch_size]
+                statuses = await self._import_chunk(chunk, crossref, stats)
+                if self.checkpoint is not None:
+                    self.checkpoint.record(statuses)
+                if on_progress is not None:
+                    on_progress(stats, len(chunk))
+        finally:
+            crossref.close()
+        return stats
+
+    async def _import_chunk(
+        self, chunk: List[ImportItem], crossref: AsyncCrossRefFetcher, stats: ImportStats
+    ) -> Dict[str, str]:
+        """Import one chunk; return the statuses of its finished links."""
+        statuses: Dict[str, str] = {}
+        failures: Dict[str, str] = {}
+        library = self.storage.library()
+        arxiv_fetcher: Optional[ArxivFetcher] = None
+        arxiv_links: List[str] = []
+        doi_links: List[str] = []
+        for item in chunk:
+            if library.exists(item.link):
+                statuses[item.link] = "skipped"
+                continue
+            try:
+                fetcher = self.registry.get_fetcher(item.link)
+                if isinstance(fetcher, ArxivFetcher):
+                    fetcher._extract_id(item.link)  # reject malformed ids before batching
+                    arxiv_fetcher = fetcher
+                    arxiv_links.append(item.link)
+                elif isinstance(fetcher, CrossRefFetcher):
+                    doi_links.append(item.link)
+                else:  # pragma: no cover - only the two fetchers are registered
+                    raise ValueError(f"Unsupported paper source: {item.link}")
+            except ValueError as exc:
+                failures[item.link] = str(exc)
+                statuses[item.link] = "rejected"
+        already = len(statuses) - len(failures)
+        stats.rejected += len(failures)
+
+        fetched, errors, unknown = await self._fetch(arxiv_fetcher, arxiv_links, crossref, doi_links)
+        failures.update(errors)
+        for link in unknown:
+            statuses[link] = "rejected"
+        stats.rejected += len(unknown)
+
+        # Append in input order, whichever source answered first.
+        papers: List[Paper] = []
+        links = {}
+        for item in chunk:
+            paper = fetched.get(item.link)
+            if paper is not None:
+                paper.topic = item.topic
+                papers.append(paper)
+                links[id(paper)] = item.link
+        added, skipped = self.storage.add_papers(papers, skip_duplicates=True)
+        for paper in added:
+            statuses[links[id(paper)]] = "added"
+        for paper in skipped:
+            statuses[links[id(paper)]] = "skipped"
+        stats.added += len(added)
+        stats.skipped += already + len(skipped)
+        stats.failed += len(failures)
+        stats.errors.update(failures)
+        return statuses
+
+    async def _fetch(
+        self,
+        arxiv_fetcher: Optional[ArxivFetcher],
+        arxiv_links: List[str],
+        crossref: AsyncCrossRefFetcher,
+        doi_links: List[str],
+    ) -> Tuple[Dict[str, Paper], Dict[str, str], List[str]]:
+        """Fetch both sources concurrently.
+
+        Returns ({link: Paper}, {link: error}, links arXiv reported missing);
+        the missing links are among the errors too.
+        """
+        papers: Dict[str, Paper] = {}
+        errors: Dict[str, str] = {}
+        unknown: List[str] = []
+
+        async def fetch_arxiv() -> None:
+            if not arxiv_links:
+                return
+            try:
+                found, missing = await asyncio.to_thread(arxiv_fetcher.fetch_many, arxiv_links, self.custom_tag)
+            except Exception as exc:  # network/service failure: the whole batch is retried next run
+                errors.update((link, f"arXiv request failed: {exc}") for link in arxiv_links)
+                return
+            papers.update(found)
+            errors.update((link, "Paper not found on arXiv") for link in missing)
+            unknown.extend(missing)
+
+        async def fetch_crossref() -> None:
+            if not doi_links:
+                return
+            found, failed = await crossref.fetch_many(doi_links, self.custom_tag)
+            papers.update(found)
+            errors.update((link, str(exc)) for link, exc in failed.items())
+
+        await asyncio.gather(fetch_arxiv(), fetch_crossref())
+        return papers, errors, unknown
@@ -0,0 +1,131 @@
+"""Write-ahead journal for appends to papers.csv.
+
+An append is first recorded in a small journal file (offset, length, checksum
+and the bytes themselves) before the CSV is touched. If the process dies
+mid-append, the next load finds the journal and replays the append over the
+torn tail; a journal that was itself only partially written means the CSV was
+never touched and is discarded, and so is one the CSV has moved past.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+from pathlib import Path
+from typing import Optional
+
+from .cache import CACHE_DIRNAME
+
+
+_MAGIC = b"PCJ1"
+# magic, CSV offset, payload length, payload digest
+_HEADER = struct.Struct(">4sQQ16s")
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _fsync_dir(path: Path) -> None:
+    """Persist a directory entry change (file creation/removal) where supported."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:  # pragma: no cover - e.g. Windows
+        return
+    try:
+        os.fsync(fd)
+    except OSError:  # pragma: no cover
+        pass
+    finally:
+        os.close(fd)
+
+
+class AppendJournal:
+    """Single-slot write-ahead journal guarding appends to one CSV file."""
+
+    def __init__(self, csv_path: Path, journal_path: Optional[Path] = None, fsync: bool = True):
+        self.csv_path = Path(csv_path)
+        self.journal_path = Path(journal_path) if journal_path else (
+            self.csv_path.parent / CACHE_DIRNAME / f"{self.csv_path.stem}.journal"
+        )
+        self.fsync = fsync
+
+    def pending(self) -> bool:
+        return self.journal_path.exists()
+
+    def append(self, data: bytes) -> int:
+        """Append `data` to the CSV under journal protection; return the offset."""
+        self.recover()
+        try:
+            offset = os.path.getsize(self.csv_path)
+        except FileNotFoundError:
+            offset = 0
+
+        self._begin(offset, data)
+        with open(self.csv_path, "ab") as f:
+            f.write(data)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        self._commit()
+        return offset
+
+    def _begin(self, offset: int, data: bytes) -> None:
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.journal_path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, offset, len(data), _digest(data)))
+            f.write(data)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        if self.fsync:
+            _fsync_dir(self.journal_path.parent)
+
+    def _commit(self) -> None:
+        self.journal_path.unlink(missing_ok=True)
+
+    def recover(self) -> Optional[str]:
+        """Repair an interrupted append, if any.
+
+        The CSV is only touched while its tail is still torn: it ends between
+        the journaled offset and offset + length, and the bytes past the
+        offset are a prefix of the journaled data (possibly followed by the
+        NULs a crash can leave). Any other state means the append finished or
+        the file was changed since (`git pull`, a manual fix), and the stale
+        journal is dropped without touching the CSV.
+
+        Returns "replayed" when the CSV tail was rewritten from the journal,
+        "discarded" when the journal was incomplete or no longer applies, and
+        None when the append had completed.
+        """
+        try:
+            raw = self.journal_path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        outcome = "discarded"
+        if len(raw) >= _HEADER.size:
+            magic, offset, length, digest = _HEADER.unpack_from(raw)
+            data = raw[_HEADER.size:]
+            complete = magic == _MAGIC and len(data) == length and _digest(data) == digest
+            try:
+                size = os.path.getsize(self.csv_path)
+            except FileNotFoundError:
+                size = 0
+            if complete and offset <= size <= offset + length:
+                with open(self.csv_path, "r+b" if self.csv_path.exists() else "wb") as f:
+                    f.seek(offset)
+                    tail = f.read(length)
+                    if tail == data:
+                        outcome = None
+                    elif data.startswith(tail.rstrip(b"\0")):
+                        f.seek(offset)
+                        f.truncate()
+                        f.write(data)
+                        f.flush()
+                        if self.fsync:
+                            os.fsync(f.fileno())
+                        outcome = "replayed"
+        self._commit()
+        return outcome
@@ -0,0 +1,366 @@
+"""Single-load library session shared across a command's operations."""
+
+from __future__ import annotations
+
+import time
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Collection, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .cache import CsvFingerprint, fingerprint_matches
+from .models import CSV_COLUMNS, Paper
+from .planner import QueryPlan
+from .tag_index import bitmap_rows, parse_tag_expression
+from .search_index import SEARCH_FIELDS
+from .table import PaperTable, pack_date
+
+if TYPE_CHECKING:
+    from .storage import PaperStorage
+
+
+def _add_record(index: Any, record: Dict[str, str]) -> None:
+    index.add_record(record)
+
+
+class Library:
+    """A snapshot of papers.csv, loaded once and reused for a whole command.
+
+    Storage queries, README generation and stats all read from the same
+    columnar `PaperTable` and indexes, so a command parses (or unpickles) the
+    library at most once, and `Paper` objects are only built for rows that are
+    returned. Rows appended through `PaperStorage.add_paper` are applied to
+    the snapshot and its indexes in place.
+    """
+
+    def __init__(self, storage: "PaperStorage"):
+        self.storage = storage
+        self.fingerprint: Optional[CsvFingerprint] = None
+        self.table = PaperTable([])
+        self._loaded_ns = 0
+        self._loaded = False
+        self._indexes: Dict[str, Any] = {}
+        self.last_plan: Optional[QueryPlan] = None
+
+    # -- snapshot --------------------------------------------------------
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded_ns = time.time_ns()
+        self.fingerprint, self.table = self.storage.load_table_with_fingerprint()
+        self._indexes = {}
+        self._loaded = True
+
+    def load(self) -> "Library":
+        """Load the snapshot now instead of on first access."""
+        self._ensure_loaded()
+        return self
+
+    def invalidate(self) -> None:
+        """Drop the snapshot; it is reloaded on next access."""
+        self._loaded = False
+        self._indexes = {}
+
+    def is_current(self) -> bool:
+        """Return True if the snapshot still matches the CSV on disk."""
+        if not self._loaded:
+            return True
+        if self.fingerprint is None:
+            return not self.storage.csv_path.exists()
+        return fingerprint_matches(self.storage.csv_path, self.fingerprint, self._loaded_ns) is not None
+
+    def field(self, row: int, name: str) -> str:
+        """Return one cell of the snapshot ("" for columns the CSV lacks)."""
+        self._ensure_loaded()
+        return self.table.value(row, name)
+
+    @property
+    def columns(self) -> List[str]:
+        self._ensure_loaded()
+        return self.table.columns
+
+    def record(self, row: int) -> Dict[str, str]:
+        self._ensure_loaded()
+        return dict(zip(self.table.columns, self.table.row(row)))
+
+    def records(self) -> Iterator[Dict[str, str]]:
+        """Yield each row as a CSV-style dict (column name -> value)."""
+        self._ensure_loaded()
+        columns = self.table.columns
+        for row in self.table.iter_rows():
+            yield dict(zip(columns, row))
+
+    def _aligned(self) -> bool:
+        """True when the CSV columns are exactly the Paper fields, in order."""
+        return tuple(self.table.columns) == CSV_COLUMNS
+
+    def paper(self, row: int) -> Paper:
+        # Rows come from our own CSV and are already strings: skip validation.
+        self._ensure_loaded()
+        if self._aligned():
+            return Paper.from_trusted_values(self.table.row(row))
+        return Paper.from_trusted_row(self.record(row))
+
+    @property
+    def papers(self) -> List[Paper]:
+        self._ensure_loaded()
+        if self._aligned():
+            return [Paper.from_trusted_values(row) for row in self.table.iter_rows()]
+        return [Paper.from_trusted_row(record) for record in self.records()]
+
+    def papers_at(self, rows: Sequence[int]) -> List[Paper]:
+        """Build `Paper` objects for the given rows only."""
+        return [self.paper(i) for i in rows]
+
+    def dataframe(self) -> pd.DataFrame:
+        """Return the snapshot as an all-string DataFrame (like `pd.read_csv(dtype=str)`)."""
+        self._ensure_loaded()
+        return self.table.to_dataframe()
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self.table)
+
+    # -- indexes ---------------------------------------------------------
+
+    def index(self, name: str):
+        """Return a derived index of this snapshot, from the sidecar cache if possible."""
+        self._ensure_loaded()
+        if name in self._indexes:
+            return self._indexes[name]
+
+        cache = self.storage.cache
+        if cache is not None and self.fingerprint is not None:
+            hit = cache.load_with_fingerprint(name, replay=_add_record)
+            if hit is not None and hit[0].digest == self.fingerprint.digest:
+                self._indexes[name] = hit[1]
+                return hit[1]
+
+        index = self.storage.INDEXES[name].from_records(self.records())
+        if cache is not None:
+            cache.store(name, index, self.fingerprint)
+        self._indexes[name] = index
+        return index
+
+    def extend(self, records: Sequence[Dict[str, str]], appended: int) -> None:
+        """Apply rows just appended to the CSV (`appended` bytes) to the snapshot.
+
+        The snapshot and the indexes loaded so far are extended in place; the
+        sidecar cache only records the rows in its append log, and other
+        cached entries catch up when they are next loaded. If anything else
+        touched the file in the meantime, the snapshot is invalidated instead
+        and reloaded on next access.
+        """
+        if not self._loaded:
+            return
+
+        before = self.fingerprint
+        after = CsvFingerprint.of(self.storage.csv_path)
+        if (
+            before is None
+            or after is None
+            or after.size != before.size + appended
+            or self.table.columns != list(self.storage.FIELDNAMES)
+        ):
+            self.invalidate()
+            return
+
+        for record in records:
+            self.table.append(record)
+            for index in self._indexes.values():
+                index.add_record(record)
+
+        self.fingerprint = after
+        self._loaded_ns = time.time_ns()
+        if self.storage.cache is not None:
+            self.storage.cache.log_append(before, after, records)
+
+    # -- queries ---------------------------------------------------------
+
+    def exists(self, link: str) -> bool:
+        """检查论文是否已存在（规则见 `IdentityIndex.lookup`）。"""
+        if not link:
+            return False
+        if self.storage.backend == "sqlite":
+            return bool(self.storage._sqlite().lookup(link))
+        return bool(self.index("identity").lookup(link))
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        tag: Optional[str] = None,
+        author: Optional[str] = None,
+        topic: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        limit: int = 0,
+        recent: bool = False,
+        tag_match: str = "substring",
+        author_match: str = "substring",
+    ) -> Tuple[List[Paper], int]:
+        """Search the snapshot; returns (papers, match count before `limit`).
+
+        See `PaperStorage.search` for the semantics.
+        """
+        started = time.perf_counter()
+        if self.storage.backend == "sqlite":
+            mirror = self.storage._sqlite()
+            ids = mirror.search(
+                query, tag, author, topic, date_from, date_to, recent=recent, tag_match=tag_match, author_match=author_match
+            )
+            total = len(ids)
+            plan = QueryPlan("sqlite", mirror.count(), verified=total, matched=total)
+            plan.notes = [f"sqlite: {detail}" for detail in mirror.query_plan()]
+            if limit > 0:
+                ids = ids[:limit]
+            papers = [Paper.from_trusted_row(record) for record in mirror.fetch(ids)]
+            plan.elapsed = time.perf_counter() - started
+            self.last_plan = plan
+            return papers, total
+
+        self._ensure_loaded()
+        plan = QueryPlan("csv", len(self.table))
+
+        # Every filter an index can answer contributes a candidate set; the
+        # planner intersects them smallest first. Keyword candidates come from
+        # the search index (the same term expansion ranks them below) and, for
+        # anything but a single word, from the trigram index as well;
+        # substring-mode tag and author use the trigram index. These are
+        # supersets and are verified below, except for a single-word query,
+        # whose search index candidates are exact. Tag (exact mode), author
+        # (prefix mode), topic and date sets are exact.
+        sources: List[Tuple[str, str, Collection[int]]] = []
+        tag_substring = tag if tag_match == "substring" else None
+        author_substring = author if author_match == "substring" else None
+        index = None
+        expansions = None
+        verify_query = False
+        if query:
+            index = self.index("search")
+            expansions = index.expand(query)
+            found = index.candidates(expansions)
+            if found is not None:
+                sources.append(("keyword", "search", found))
+            verify_query = list(expansions) != [query.lower()]
+            if verify_query:
+                found_grams = self.index("trigram").candidates(query)
+                if found_grams is not None:
+                    sources.append(("keyword", "trigram", found_grams))
+                elif found is None:
+                    plan.scanned_filters.append("keyword")
+        if tag and not tag_substring:
+            clauses = parse_tag_expression(tag)
+            if clauses:
+                sources.append(("tag", "tags", bitmap_rows(self.index("tags").match(clauses))))
+        for name, needle in (("tag", tag_substring), ("author", author_substring)):
+            if needle:
+                found = self.index("trigram").candidates(needle)
+                if found is not None:
+                    sources.append((name, "trigram", found))
+                else:
+                    plan.scanned_filters.append(name)
+        if author and not author_substring:
+            sources.append(("author", "authors", self.index("authors").prefix_rows(author)))
+        if topic:
+            sources.append(("topic", "topics", self.index("topics").rows(topic)))
+        from_packed = pack_date(date_from) if date_from else 0
+        to_packed = pack_date(date_to) if date_to else 0
+        if date_from or date_to:
+            sources.append(("date", "dates", self.index("dates").range(from_packed, to_packed)))
+
+        selected = plan.intersect(sources)
+        candidates = range(len(self.table)) if selected is None else selected
+
+        query_lower = query.lower() if verify_query else None
+        dates = self.table.dates
+        value = self.table.value
+
+        matched: List[int] = []
+        for i in candidates:
+            # 关键字搜索 (same fields as Paper.matches_query)
+            if query_lower and not any(query_lower in value(i, name).lower() for name in SEARCH_FIELDS):
+                continue
+
+            # 标签过滤 (substring mode)
+            if tag_substring and tag_substring.lower() not in value(i, "Tag").lower():
+                continue
+
+            # 作者过滤 (substring mode)
+            if author_substring and author_substring.lower() not in value(i, "Authors").lower():
+                continue
+
+            # Exact tag, prefix author, topic and date range filters were resolved by their indexes.
+            matched.append(i)
+
+        total = len(matched)
+        if index is not None and expansions:
+            matched = index.rank(expansions, matched, 0 if recent else limit)
+            if recent:
+                # Stable: equal dates keep their relevance order.
+                matched.sort(key=lambda i: -dates[i])
+                if limit > 0:
+                    matched = matched[:limit]
+        elif recent:
+            matched = self._most_recent(matched, limit)
+        elif limit > 0:
+            matched = matched[:limit]
+
+        plan.verified = len(candidates)
+        plan.matched = total
+        plan.elapsed = time.perf_counter() - started
+        self.last_plan = plan
+        return self.papers_at(matched), total
+
+    def _most_recent(self, rows: List[int], limit: int) -> List[int]:
+        """Order ascending `rows` most recent first (undated last), keeping `limit`.
+
+        Large selections walk the persisted date order and stop after
+        `limit` rows instead of sorting everything.
+        """
+        size = len(self.table)
+        if len(rows) * 8 < size:
+            dates = self.table.dates
+            ordered = sorted(rows, key=lambda i: -dates[i])
+            return ordered[:limit] if limit > 0 else ordered
+
+        walk = self.index("dates").recent()
+        if len(rows) != size:
+            wanted = set(rows)
+            walk = (i for i in walk if i in wanted)
+        return list(islice(walk, limit if limit > 0 else None))
+
+    def topics(self) -> Dict[str, int]:
+        """获取所有 topics 及其论文数量。"""
+        if self.storage.backend == "sqlite":
+            return self.storage._sqlite().topics()
+        self._ensure_loaded()
+        topics = {topic: n for topic, n in self.table.value_counts("Topic").items() if topic}
+        return dict(sorted(topics.items(), key=lambda x: -x[1]))
+
+    def tags(self) -> Dict[str, int]:
+        """获取所有标签及其论文数量（大小写/空白不同的写法合并为一个标签）。"""
+        if self.storage.backend == "sqlite":
+            return self.storage._sqlite().tags()
+        return self.index("tags").tag_counts()
+
+    def authors(self, prefix: Optional[str] = None, limit: int = 0) -> Dict[str, int]:
+        """Authors by paper count, optionally only those matching a name prefix."""
+        if self.storage.backend == "sqlite":
+            return self.storage._sqlite().authors(prefix, limit)
+        return self.index("authors").top(limit, prefix)
+
+    def count(self) -> int:
+        """返回论文总数。"""
+        if self.storage.backend == "sqlite":
+            return self.storage._sqlite().count()
+        return len(self)
+
+    def date_range(self) -> Tuple[Optional[str], Optional[str]]:
+        """Return the earliest and latest valid YYYY.MM dates, or (None, None)."""
+        self._ensure_loaded()
+        valid = [d for d in self.table.dates if d]
+        if not valid:
+            return None, None
+        lo, hi = min(valid), max(valid)
+        return f"{lo // 100:04d}.{lo % 100:02d}", f"{hi // 100:04d}.{hi % 100:02d}"
@@ -0,0 +1,135 @@
+"""Cross-process advisory locks and coalesced rebuild tickets.
+
+Several `paper add` processes may run in parallel (e.g. ingestion scripts).
+CSV appends and README rewrites are serialized with advisory file locks, and
+README rebuilds are coalesced: each writer takes a ticket after its append,
+and a writer whose ticket was already covered by someone else's rebuild
+skips regenerating the tables.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, Union
+
+try:  # POSIX
+    import fcntl
+
+    def _lock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+except ImportError:  # pragma: no cover - Windows
+    import msvcrt
+
+    def _lock(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+    def _unlock(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on `path` (created if missing)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        _lock(fd)
+        try:
+            yield
+        finally:
+            _unlock(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_write_text(
+    path: Path, content: Union[str, Iterable[str]], encoding: str = "utf-8", newline: Optional[str] = None
+) -> None:
+    """Replace `path` with `content` via a temp file and rename.
+
+    `content` is a string or an iterable of string chunks written in order.
+    Readers see either the old or the new file, never a partial one.
+    `newline` has the same meaning as for `open()`.
+    """
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding=encoding, newline=newline) as f:
+            if isinstance(content, str):
+                f.write(content)
+            else:
+                f.writelines(content)
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            os.chmod(tmp, path.stat().st_mode & 0o777)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+class CoalescingRebuild:
+    """Ticketed rebuild of a derived file shared by concurrent writers.
+
+    Two counters live next to the lock file: `requested` (bumped by every
+    writer after it changed the inputs) and `completed` (the highest request
+    covered by a finished rebuild). A rebuild covers every request made before
+    it started reading its inputs, so later writers whose ticket is already
+    covered skip the work.
+    """
+
+    def __init__(self, lock_path: Path):
+        self.lock_path = Path(lock_path)
+        self.seq_path = self.lock_path.with_suffix(".seq")
+        self._seq_lock = self.lock_path.with_suffix(".seq.lock")
+
+    def _read(self) -> tuple[int, int]:
+        try:
+            requested, completed = self.seq_path.read_text(encoding="utf-8").split()
+            return int(requested), int(completed)
+        except (FileNotFoundError, ValueError):
+            return 0, 0
+
+    def _write(self, requested: int, completed: int) -> None:
+        atomic_write_text(self.seq_path, f"{requested} {completed}\n")
+
+    def request(self) -> int:
+        """Record that the inputs changed; return this writer's ticket."""
+        with file_lock(self._seq_lock):
+            requested, completed = self._read()
+            requested += 1
+            self._write(requested, completed)
+            return requested
+
+    def run(self, rebuild: Callable[[], None], ticket: Optional[int] = None) -> bool:
+        """Run `rebuild` unless `ticket` was already covered; return True if it ran.
+
+        Without a ticket the rebuild always runs (but still marks every
+        request made so far as covered).
+        """
+        if ticket is None:
+            ticket = self.request()
+
+        with file_lock(self.lock_path):
+            with file_lock(self._seq_lock):
+                target, completed = self._read()
+            if completed >= ticket:
+                return False
+
+            rebuild()
+
+            with file_lock(self._seq_lock):
+                requested, completed = self._read()
+                self._write(requested, max(completed, target))
+            return True
@@ -2,21 +2,157 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
 
+from ..config import Config
+from .cache import CACHE_DIRNAME
+from .locking import CoalescingRebuild, atomic_write_text
+from .pages import INDEX_END, INDEX_START, PageLayout, plan_pages, render_index, render_page, topic_slugs
+from .render_cache import RowRenderCache
+from .table_diff import diff_tables
 from ..utils.date import date_key
+from ..utils.paths import repo_files
+
+if TYPE_CHECKING:
+    from .library import Library
+
+
+# "single": every topic table inside README.md; "pages": one Markdown file
+# per topic (see `PageLayout`) and a topic index in README.md.
+README_LAYOUTS = ("single", "pages")
+
+# Bump when the table rendering changes, so cached topic digests are ignored.
+_RENDER_VERSION = 1
+
+# Bump when the layout of README.pages.json changes. Format 2 stores page
+# paths relative to the README's directory instead of the working directory.
+_PAGES_STATE_FORMAT = 2
+
+# Columns a table row is rendered from, in `_render_row` argument order.
+_ROW_FIELDS = ("Source", "Title", "Link", "Authors", "Journal_Ref", "Tag", "Subjects", "Additional_Info", "Date")
+
+# Below this many rows to render, pool startup costs more than it saves.
+_PARALLEL_MIN_ROWS = 20_000
+_PARALLEL_CHUNK_ROWS = 10_000
+
+_TABLE_HEADER = (
+    "| Source | Title (Link) | Authors | Tag | Subjects | Additional info | Date |\n"
+    "|---|---|---|---|---|---|---|\n"
+)
+
+_START_MARKER = re.compile(r"<!-- TABLE_START: (.*?) -->")
+
+# Stands in for removed README blocks until the blank lines around them are collapsed.
+_REMOVED = "\0"
+_REMOVED_RUN = re.compile(r"\n*(?:\0\n*)+")
+
+# The topic index block of the `pages` layout, with the heading `_paged_readme` adds above it.
+_TOPIC_INDEX = re.compile(
+    rf"(?:\n#+\s+Topics[ \t]*\n)?{re.escape(INDEX_START)}.*?{re.escape(INDEX_END)}\n?", re.DOTALL
+)
+
+# (topic, text): a managed table block, or static README text when topic is None.
+Segment = Tuple[Optional[str], str]
+
+
+def split_readme(content: str) -> List[Segment]:
+    """Split README content into static text and managed table blocks in one pass.
+
+    A block runs from `<!-- TABLE_START: T -->` to the nearest following
+    `<!-- TABLE_END: T -->` and is kept whole, markers included; a start
+    marker without its end marker is static text. Joining the texts gives
+    back `content`.
+    """
+    segments: List[Segment] = []
+    pos = scan = 0
+    while True:
+        match = _START_MARKER.search(content, scan)
+        if match is None:
+            break
+        topic = match.group(1)
+        if topic and topic == topic.strip():
+            end_marker = f"<!-- TABLE_END: {topic} -->"
+            end = content.find(end_marker, match.end())
+            if end != -1:
+                if match.start() > pos:
+                    segments.append((None, content[pos : match.start()]))
+                pos = scan = end + len(end_marker)
+                segments.append((topic, content[match.start() : pos]))
+                continue
+        scan = match.start() + 1
+    if pos < len(content) or not segments:
+        segments.append((None, content[pos:]))
+    return segments
+
+
+def _collapse_removed(content: str) -> str:
+    """Replace each run of removed blocks, and the newlines around it, by one blank line."""
+
+    def gap(match: "re.Match[str]") -> str:
+        if match.start() == 0:
+            return ""
+        return "\n" if match.end() == len(content) else "\n\n"
+
+    return _REMOVED_RUN.sub(gap, content)
+
+
+def _first_blocks(segments: List[Segment]) -> Dict[str, str]:
+    """First managed block of each topic."""
+    blocks: Dict[str, str] = {}
+    for name, text in segments:
+        if name is not None:
+            blocks.setdefault(name, text)
+    return blocks
 
 
 class MarkdownGenerator:
     """Markdown 表格生成器，负责更新 README.md。"""
 
-    def __init__(self, csv_path: Path, readme_path: Path):
+    def __init__(
+        self,
+        csv_path: Path,
+        readme_path: Path,
+        library: Optional["Library"] = None,
+        jobs: int = 1,
+        pages: Optional[PageLayout] = None,
+    ):
         self.csv_path = Path(csv_path)
         self.readme_path = Path(readme_path)
+        # When given, tables are rendered from this already-loaded snapshot.
+        self.library = library
+        # Worker processes for rendering large libraries (1 = in-process).
+        self.jobs = jobs
+        # When set, tables go to per-topic pages and the README keeps an index.
+        self.pages = pages
+        # Topic page files the last `update_readme` (re)wrote.
+        self.last_written: List[Path] = []
+        # Topic page files the last `update_readme` deleted after leaving the `pages` layout.
+        self.last_removed: List[Path] = []
+        # Paths to stage for those deletions: the old pages directory.
+        self._removed_paths: List[Path] = []
+        # topic -> (rows digest, table) rendered by `get_diff`, reused by `update_readme`.
+        self._prepared: Dict[str, Tuple[str, str]] = {}
+        # Topics whose tables the last `update_readme` actually re-rendered.
+        self.last_rendered: List[str] = []
+        self._row_cache = RowRenderCache(
+            self.readme_path.parent / CACHE_DIRNAME / f"{self.readme_path.stem}.rows.pickle", _RENDER_VERSION
+        )
+
+    def _load_dataframe(self) -> pd.DataFrame:
+        # A concurrent writer may have appended since the snapshot was taken.
+        if self.library is not None and self.library.is_current():
+            return self.library.dataframe()
+        # Keep all columns as strings to preserve formatting like 'YYYY.MM'.
+        return pd.read_csv(self.csv_path, dtype=str, keep_default_na=False)
 
     @staticmethod
     def _date_sort_value(value: str) -> int:
@@ -61,94 +197,219 @@ class MarkdownGenerator:
         return f"{authors[0]}, et al."
 
     @staticmethod
-    def _remove_topic_section(content: str, topic: str) -> str:
-        """Remove a topic section (optional heading + table markers) from README content."""
-        start_marker = re.escape(f"<!-- TABLE_START: {topic} -->")
-        end_marker = re.escape(f"<!-- TABLE_END: {topic} -->")
-        # Remove only headings directly attached to the managed table block.
-        pattern = re.compile(
-            rf"(?:\n#+\s+{re.escape(topic)}\s*\n)?{start_marker}\n.*?{end_marker}\n?",
-            flags=re.DOTALL,
-        )
-        return pattern.sub("\n", content)
+    def _drop_topic_blocks(segments: List[Segment], topic: str, placeholder: str = "\n") -> List[Segment]:
+        """Remove a topic's blocks (plus a heading directly above) from split README content.
 
-    def generate_tables_by_topic(self) -> Dict[str, str]:
+        Each block, with its attached heading and one trailing newline, is
+        replaced by `placeholder` (a single character, a newline by default).
+        Only a start marker on its own line opens a removable block.
         """
-        从 CSV 生成按 topic 分组的 Markdown 表格。
+        start_line = f"<!-- TABLE_START: {topic} -->\n"
+        # Remove only headings directly attached to the managed table block.
+        heading = re.compile(rf"\n#+\s+{re.escape(topic)}\s*\n\Z")
+        out: List[Segment] = []
+        # Text before `floor` in the last static segment was produced by a
+        # removal and may not be matched as a heading again.
+        floor = 0
+        after_removal = False
+        for name, text in segments:
+            if after_removal and name is None and text.startswith("\n"):
+                text = text[1:]
+            # The block may open with extra start markers; removal begins at
+            # the first one on its own line.
+            cut = text.find(start_line) if name == topic else -1
+            if cut != -1:
+                before = out.pop()[1] if out and out[-1][0] is None else ""
+                before += text[:cut]
+                match = heading.search(before, floor)
+                if match:
+                    before = before[: match.start()]
+                out.append((None, before + placeholder))
+                floor = len(before) + 1
+                after_removal = True
+                continue
+            after_removal = False
+            if name is None and out and out[-1][0] is None:
+                out[-1] = (None, out[-1][1] + text)
+            else:
+                out.append((name, text))
+                floor = 0
+        return out
 
-        Returns:
-            Dict[topic, markdown_table]
+    def _topic_groups(self) -> Dict[str, pd.DataFrame]:
+        """Split the library into per-topic row groups, each in table order.
+
+        Groups are sorted by topic; rows within a group newest first
+        (invalid/missing dates last), then by title, then in CSV order.
         """
-        # Keep all columns as strings to preserve formatting like 'YYYY.MM'.
-        df = pd.read_csv(self.csv_path, dtype=str, keep_default_na=False)
+        df = self._load_dataframe()
 
-        tables = {}
+        groups: Dict[str, pd.DataFrame] = {}
 
         if "Topic" not in df.columns or df["Topic"].isnull().all():
-            return tables
+            return groups
 
         # Treat blank/whitespace-only topic as missing metadata.
         df = df.copy()
         df["Topic"] = df["Topic"].astype(str).str.strip()
         df = df[df["Topic"] != ""]
         if df.empty:
-            return tables
+            return groups
+
+        # One stable sort for all topics instead of one per group.
+        if "Date" in df.columns:
+            df["__date_sort"] = self._date_sort_values(df["Date"])
+        else:
+            df["__date_sort"] = -1
+        df = df.sort_values(
+            by=["Topic", "__date_sort", "Title"],
+            ascending=[True, False, True],
+            kind="mergesort",
+        )
+        df.drop(columns=["__date_sort"], inplace=True)
 
         for topic, group in df.groupby("Topic"):
-            if group.empty:
-                continue
+            if not group.empty:
+                groups[topic] = group
+        return groups
 
-            # Default: show newest papers first (invalid/missing dates go last).
-            group = group.copy()
-            if "Date" in group.columns:
-                group["__date_sort"] = group["Date"].apply(self._date_sort_value)
-            else:
-                group["__date_sort"] = -1
-            group = group.sort_values(
-                by=["__date_sort", "Title"],
-                ascending=[False, True],
-                kind="mergesort",
-            )
-            group.drop(columns=["__date_sort"], inplace=True)
-
-            # 表格头
-            md_table = "| Source | Title (Link) | Authors | Tag | Subjects | Additional info | Date |\n"
-            md_table += "|---|---|---|---|---|---|---|\n"
-
-            for _, row in group.iterrows():
-                source = row.get("Source", "")
-                title = row.get("Title", "")
-                link = row.get("Link", "")
-                authors_full = row.get("Authors", "")
-                journal_ref = row.get("Journal_Ref", "")
-                tag = row.get("Tag", "")
-                subjects = row.get("Subjects", "")
-                additional_info = row.get("Additional_Info", "")
-                date = row.get("Date", "")
-
-                # 格式化 Source 列：优先显示 arXiv 信息
-                source = self._format_source_column(source, link, journal_ref)
-
-                # 格式化作者显示
-                authors_display = self._format_authors_display(authors_full)
-
-                # 带链接的标题
-                linked_title = self._format_linked_title(title, link)
-
-                source = self._escape_markdown_cell(source)
-                authors_display = self._escape_markdown_cell(authors_display)
-                tag = self._escape_markdown_cell(tag)
-                subjects = self._escape_markdown_cell(subjects)
-                additional_info = self._escape_markdown_cell(additional_info)
-                date = self._escape_markdown_cell(date)
-
-                # 构建表格行
-                md_table += (
-                    f"| {source} | {linked_title} | {authors_display} | {tag} | {subjects} | {additional_info} | {date} |\n"
-                )
-
-            tables[topic] = md_table
+    @staticmethod
+    def _date_sort_values(dates: pd.Series) -> np.ndarray:
+        """Vectorized `_date_sort_value`: YYYYMM integers, -1 when invalid/missing."""
+        # Few distinct dates: parse each once, then broadcast through the codes.
+        codes, uniques = pd.factorize(dates.astype(str), use_na_sentinel=False)
+        parts = pd.Series(uniques, dtype=object).str.extract(r"(20\d{2})\.(\d{2})")
+        year = pd.to_numeric(parts[0]).to_numpy(dtype=float)
+        month = pd.to_numeric(parts[1]).to_numpy(dtype=float)
+        valid = (month >= 1) & (month <= 12)
+        packed = np.where(valid, year * 100 + month, -1).astype(np.int64)
+        return packed[codes]
+
+    @staticmethod
+    def _group_digest(group: pd.DataFrame) -> str:
+        """Content hash of a topic's rows; equal digests render equal tables."""
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(f"{_RENDER_VERSION}|{'|'.join(group.columns)}".encode("utf-8"))
+        hasher.update(pd.util.hash_pandas_object(group, index=False).to_numpy().tobytes())
+        return hasher.hexdigest()
+
+    def _render_tables(self, groups: Dict[str, pd.DataFrame]) -> Dict[str, str]:
+        """Render topic groups (rows already in table order) as Markdown tables.
+
+        Rows found in the row cache are reused; the rest are rendered in one
+        batch per topic, spread over `jobs` worker processes when there are
+        enough of them to pay for the pool. Output order follows `groups`.
+        """
+        cache = self._row_cache
+        keys: Dict[str, List[int]] = {}
+        lines: Dict[str, List[Optional[str]]] = {}
+        batches: List[Tuple[str, List[int], pd.DataFrame]] = []
+        for topic, group in groups.items():
+            fields = group.reindex(columns=list(_ROW_FIELDS), fill_value="")
+            keys[topic] = pd.util.hash_pandas_object(fields, index=False).tolist()
+            lines[topic] = [cache.get(key) for key in keys[topic]]
+            missing = [i for i, line in enumerate(lines[topic]) if line is None]
+            # Split big topics so one of them does not keep a single worker busy.
+            for lo in range(0, len(missing), _PARALLEL_CHUNK_ROWS):
+                rows = missing[lo : lo + _PARALLEL_CHUNK_ROWS]
+                batches.append((topic, rows, fields.iloc[rows]))
+
+        pending = sum(len(rows) for _, rows, _ in batches)
+        if self.jobs > 1 and len(batches) > 1 and pending >= _PARALLEL_MIN_ROWS:
+            with ProcessPoolExecutor(max_workers=min(self.jobs, len(batches))) as pool:
+                rendered = list(pool.map(_render_fields, [fields for _, _, fields in batches]))
+        else:
+            rendered = [self._render_rows(fields) for _, _, fields in batches]
+
+        for (topic, rows, _), new_lines in zip(batches, rendered):
+            for i, line in zip(rows, new_lines):
+                lines[topic][i] = line
+                cache.put(keys[topic][i], line)
+        return {topic: _TABLE_HEADER + "".join(lines[topic]) for topic in groups}
 
+    @classmethod
+    def _escape_markdown_cells(cls, values: pd.Series) -> pd.Series:
+        """Vectorized `_escape_markdown_cell`."""
+        # Tags, subjects, dates... repeat a lot: escape each distinct value once.
+        codes, uniques = pd.factorize(values, use_na_sentinel=False)
+        escaped = (
+            pd.Series(uniques, dtype=values.dtype)
+            .str.replace("\r\n", "\n", regex=False)
+            .str.replace("\r", "\n", regex=False)
+            .str.strip()
+            .str.replace("\n", "<br>", regex=False)
+            .str.replace("|", "\\|", regex=False)
+        )
+        return pd.Series(escaped.to_numpy()[codes], index=values.index, dtype=values.dtype)
+
+    @staticmethod
+    def _format_authors_displays(authors: pd.Series) -> pd.Series:
+        """Vectorized `_format_authors_display`: first author, ", et al." when there are more."""
+        first = authors.str.extract(r"(?s)^(?:\s*,)*\s*([^,]*[^,\s])", expand=False).fillna("")
+        more = authors.str.contains(r"(?s)[^,\s][^,]*,.*[^,\s]", regex=True)
+        return first.where(~more, first + ", et al.")
+
+    @staticmethod
+    def _format_source_columns(source: pd.Series, link: pd.Series, journal_ref: pd.Series) -> pd.Series:
+        """Vectorized `_format_source_column` (same three cases)."""
+        result = source.copy()
+        is_arxiv_source = source.str.lower().str.contains("arxiv", regex=False).to_numpy(dtype=bool)
+
+        # 情况1: Source 已经包含 arXiv 格式 -> 补上不在其中的会议信息
+        conf_info = journal_ref.str.strip()
+        candidates = np.flatnonzero(is_arxiv_source & (conf_info != "").to_numpy(dtype=bool))
+        if len(candidates):
+            sources, confs = source.to_numpy(), conf_info.to_numpy()
+            add = candidates[[confs[i] not in sources[i] for i in candidates]]
+            result.iloc[add] = source.iloc[add] + " (" + conf_info.iloc[add] + ")"
+
+        # 情况2: Source 是会议名，但 Link 是 arXiv
+        is_arxiv_link = link.str.lower().str.contains("arxiv.org", regex=False).to_numpy(dtype=bool)
+        from_link = np.flatnonzero(~is_arxiv_source & is_arxiv_link)
+        if len(from_link):
+            src = source.iloc[from_link]
+            version = link.iloc[from_link].str.extract(r"v(\d+)(?:\.pdf)?$", expand=False).fillna("1")
+            year = src.str.extract(r"(20\d{2})", expand=False).fillna("")
+            arxiv_format = "arXiv(v" + version + ")" + (" " + year).where(year != "", "")
+            result.iloc[from_link] = (arxiv_format + " (" + src + ")").where(src != "", arxiv_format)
+
+        # 情况3: 非 arXiv 论文
+        plain = np.flatnonzero(~is_arxiv_source & ~is_arxiv_link & (journal_ref != "").to_numpy(dtype=bool))
+        if len(plain):
+            src, ref = source.iloc[plain], journal_ref.iloc[plain]
+            result.iloc[plain] = (src + " (" + ref + ")").where(src != "", ref)
+        return result
+
+    @classmethod
+    def _render_rows(cls, fields: pd.DataFrame) -> List[str]:
+        """Render papers as Markdown table lines (`fields` holds the `_ROW_FIELDS` columns)."""
+        fields = fields.astype(str)
+        esc = cls._escape_markdown_cells
+
+        # 格式化 Source 列：优先显示 arXiv 信息
+        source = esc(cls._format_source_columns(fields["Source"], fields["Link"], fields["Journal_Ref"]))
+
+        # 格式化作者显示
+        authors = esc(cls._format_authors_displays(fields["Authors"]))
+
+        # 带链接的标题
+        title = esc(fields["Title"]).str.replace("[", "\\[", regex=False).str.replace("]", "\\]", regex=False)
+        link = fields["Link"]
+        title = title.where(link == "", "[" + title + "](" + link.str.strip() + ")")
+
+        # 构建表格行
+        others = [title, authors] + [esc(fields[name]) for name in ("Tag", "Subjects", "Additional_Info", "Date")]
+        return ("| " + source.str.cat(others, sep=" | ") + " |\n").tolist()
+
+    def generate_tables_by_topic(self) -> Dict[str, str]:
+        """
+        从 CSV 生成按 topic 分组的 Markdown 表格。
+
+        Returns:
+            Dict[topic, markdown_table]
+        """
+        tables = self._render_tables(self._topic_groups())
+        self._row_cache.save()
         return tables
 
     def _format_source_column(self, source: str, link: str, journal_ref: str) -> str:
@@ -229,42 +490,143 @@ class MarkdownGenerator:
             return f"v{match.group(1)}"
         return "v1"  # 默认 v1
 
-    def update_readme(self) -> None:
-        """更新 README.md 中的表格。"""
-        tables = self.generate_tables_by_topic()
+    def update_readme(self, coalesce: bool = False) -> bool:
+        """更新 README.md 中的表格，返回是否重新生成。
 
-        if not self.readme_path.exists():
+        Rewrites are serialized across processes and replace the file
+        atomically. With `coalesce`, the rebuild is skipped when a concurrent
+        run already regenerated the README from a CSV that includes this
+        process's changes.
+        """
+        rebuild = CoalescingRebuild(self.readme_path.parent / CACHE_DIRNAME / f"{self.readme_path.stem}.lock")
+        ticket = rebuild.request() if coalesce else None
+        return rebuild.run(self._rewrite_readme, ticket)
+
+    @property
+    def _state_path(self) -> Path:
+        return self.readme_path.parent / CACHE_DIRNAME / f"{self.readme_path.stem}.topics.json"
+
+    def _load_render_state(self) -> Dict[str, Dict[str, str]]:
+        """Per-topic {"input": rows digest, "output": block digest} from the last rewrite."""
+        try:
+            state = json.loads(self._state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(state, dict) or state.get("version") != _RENDER_VERSION:
+            return {}
+        topics = state.get("topics")
+        return topics if isinstance(topics, dict) else {}
+
+    def _save_render_state(self, topics: Dict[str, Dict[str, str]]) -> None:
+        try:
+            self._state_path.parent.mkdir(parents=True, exist_ok=True)
+            state = {"version": _RENDER_VERSION, "topics": topics}
+            atomic_write_text(self._state_path, json.dumps(state, sort_keys=True))
+        except OSError:
+            pass  # the state only saves work; a missing file means a full render
+
+    @staticmethod
+    def _block_digest(block: str) -> str:
+        return hashlib.blake2b(block.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _plan_topics(
+        self, groups: Dict[str, pd.DataFrame], first_blocks: Dict[str, str], previous: Dict[str, Dict[str, str]]
+    ) -> Tuple[Dict[str, Dict[str, str]], Dict[str, str]]:
+        """Split topics into up-to-date ones and ones whose table must be regenerated.
+
+        Returns the render state kept for up-to-date topics and the rows
+        digest of every other topic, in topic order.
+        """
+        state: Dict[str, Dict[str, str]] = {}
+        digests: Dict[str, str] = {}
+        for topic, group in groups.items():
+            block = first_blocks.get(topic)
+            digest = self._group_digest(group)
+            known = previous.get(topic)
+            if (
+                block is not None
+                and known is not None
+                and known.get("input") == digest
+                and known.get("output") == self._block_digest(block)
+            ):
+                state[topic] = known
+                continue
+            digests[topic] = digest
+        return state, digests
+
+    def _tables_for(self, groups: Dict[str, pd.DataFrame], digests: Dict[str, str]) -> Dict[str, str]:
+        """Tables of the topics in `digests`, reusing ones `get_diff` rendered from the same rows."""
+        prepared = self._prepared
+        reused = {
+            topic: prepared[topic][1] for topic, digest in digests.items() if prepared.get(topic, ("",))[0] == digest
+        }
+        rendered = self._render_tables({topic: groups[topic] for topic in digests if topic not in reused})
+        tables = {topic: reused[topic] if topic in reused else rendered[topic] for topic in digests}
+        self._prepared = {topic: (digests[topic], table) for topic, table in tables.items()}
+        return tables
+
+    def _rewrite_readme(self) -> None:
+        """Splice regenerated tables into the README (or write topic pages).
+
+        A topic's table is re-rendered only when its rows changed since the
+        last rewrite (or its block in the README was edited by hand); the
+        digests are kept in `.paper-cache/<README>.topics.json`.
+        """
+        if self.pages is not None:
+            self._rewrite_pages()
+            return
+
+        groups = self._topic_groups()
+        previous = self._load_render_state()
+        self.last_rendered = []
+
+        exists = self.readme_path.exists()
+        if not exists:
             # 如果 README 不存在，创建一个基础版本
             content = "# Paper Collection\n\n"
         else:
             with open(self.readme_path, "r", encoding="utf-8") as f:
                 content = f.read()
 
-        existing_topics = self._extract_existing_topics(content)
-        table_topics = set(tables.keys())
+        left_pages = self._leave_pages()
+        if INDEX_START in content:
+            content = _collapse_removed(_TOPIC_INDEX.sub(_REMOVED, content))
+            left_pages = True
+
+        segments = split_readme(content)
+        existing_topics = {name for name, _ in segments if name is not None}
 
         # Remove stale topic sections that no longer exist in CSV.
-        for stale_topic in sorted(existing_topics - table_topics):
-            content = self._remove_topic_section(content, stale_topic)
+        stale_topics = sorted(existing_topics - set(groups))
+        for stale_topic in stale_topics:
+            segments = self._drop_topic_blocks(segments, stale_topic)
+        changed = bool(stale_topics) or left_pages or not exists
 
-        for topic, table in tables.items():
-            start_marker = f"<!-- TABLE_START: {topic} -->"
-            end_marker = f"<!-- TABLE_END: {topic} -->"
+        first_blocks = _first_blocks(segments)
+        state, digests = self._plan_topics(groups, first_blocks, previous)
 
-            pattern = re.compile(f"(?s){re.escape(start_marker)}(.*?){re.escape(end_marker)}")
+        self.last_rendered = list(digests)
+        tables = self._tables_for(groups, digests)
+
+        replacements: Dict[str, str] = {}
+        appended: List[str] = []
+        for topic, table in tables.items():
+            replacement = f"<!-- TABLE_START: {topic} -->\n{table}<!-- TABLE_END: {topic} -->"
+            state[topic] = {"input": digests[topic], "output": self._block_digest(replacement)}
 
-            if pattern.search(content):
-                # 已存在标记，替换内容
-                # Use a function replacement so backslashes in table content (e.g., LaTeX \href)
-                # are not treated as regex replacement escapes.
-                replacement = f"{start_marker}\n{table}{end_marker}"
-                content = pattern.sub(lambda _m: replacement, content)
+            if topic in first_blocks:
+                # 已存在标记，替换内容（所有同名 block）
+                replacements[topic] = replacement
             else:
                 # 不存在标记，在文件末尾添加新 section
-                content += f"\n# {topic}\n{start_marker}\n{table}{end_marker}\n"
+                appended.append(f"\n# {topic}\n{replacement}\n")
 
-        with open(self.readme_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        chunks = [text if name not in replacements else replacements[name] for name, text in segments]
+        changed = changed or bool(appended) or any(new != old for new, (_, old) in zip(chunks, segments))
+        if changed:
+            atomic_write_text(self.readme_path, chunks + appended)
+        self._save_render_state(state)
+        self._row_cache.save()
 
     def preview_topic(self, topic: Optional[str] = None) -> str:
         """
@@ -293,43 +655,299 @@ class MarkdownGenerator:
         """
         获取当前 CSV 与 README 的差异。
 
+        Rows of each managed table are matched by paper identity (arXiv id,
+        DOI, link, else title) to count added, removed and modified papers.
+        Only topics whose rows changed since the last rewrite are rendered,
+        and those tables are reused by a following `update_readme`.
+
         Returns:
             差异描述字符串
         """
+        if self.pages is not None:
+            return self._pages_diff()
+
         if not self.readme_path.exists():
             return "README.md does not exist. Will be created."
 
-        tables = self.generate_tables_by_topic()
-
         with open(self.readme_path, "r", encoding="utf-8") as f:
             content = f.read()
 
+        groups = self._topic_groups()
+        first_blocks = _first_blocks(split_readme(content))
+        _, digests = self._plan_topics(groups, first_blocks, self._load_render_state())
+        tables = self._tables_for(groups, digests)
+        self._row_cache.save()
+
         existing_topics = self._extract_existing_topics(content)
-        table_topics = set(tables.keys())
+        table_topics = set(groups.keys())
 
         diffs = []
         for topic, new_table in tables.items():
+            block = first_blocks.get(topic)
+            if block is None:
+                diffs.append(f"  {topic}: NEW ({len(groups[topic])} rows)")
+                continue
+
             start_marker = f"<!-- TABLE_START: {topic} -->"
             end_marker = f"<!-- TABLE_END: {topic} -->"
+            old_table = block[len(start_marker) : -len(end_marker)].strip()
+            if old_table != new_table.strip():
+                diffs.append(f"  {topic}: {diff_tables(old_table, new_table).describe()}")
+
+        for topic in sorted(existing_topics - table_topics):
+            diffs.append(f"  {topic}: REMOVED")
+
+        if diffs:
+            return "Changes:\n" + "\n".join(diffs)
+        return "No changes detected."
+
+    def output_files(self) -> List[str]:
+        """Files `update_readme` maintains, for staging in git."""
+        files = [str(self.readme_path)]
+        if self.pages is not None and self.pages.directory.exists():
+            files.append(str(self.pages.directory))
+        # Pages removed when leaving the `pages` layout, so their deletion is staged.
+        files.extend(str(path) for path in self._removed_paths)
+        return files
+
+    # -- per-topic pages --------------------------------------------------
+
+    @property
+    def _pages_state_path(self) -> Path:
+        return self.readme_path.parent / CACHE_DIRNAME / f"{self.readme_path.stem}.pages.json"
+
+    def _load_pages_state(self) -> Dict[str, Any]:
+        """{"layout": signature, "directory": key, "topics": {topic: {"input": digest, "pages": {key: digest}}}}.
+
+        Keys are paths relative to the README's directory (see `_page_key`);
+        the digests are of the topic's rows and of each page's text.
+        """
+        try:
+            state = json.loads(self._pages_state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if (
+            not isinstance(state, dict)
+            or state.get("version") != _RENDER_VERSION
+            or state.get("format") != _PAGES_STATE_FORMAT
+        ):
+            return {}
+        return state
+
+    def _save_pages_state(self, layout: str, topics: Dict[str, Dict[str, Any]]) -> None:
+        try:
+            self._pages_state_path.parent.mkdir(parents=True, exist_ok=True)
+            state = {
+                "version": _RENDER_VERSION,
+                "format": _PAGES_STATE_FORMAT,
+                "layout": layout,
+                "directory": self._page_key(self.pages.directory),
+                "topics": topics,
+            }
+            atomic_write_text(self._pages_state_path, json.dumps(state, sort_keys=True))
+        except OSError:
+            pass
+
+    @property
+    def _base_dir(self) -> Path:
+        return self.readme_path.parent.resolve()
+
+    def _page_key(self, path: Path) -> str:
+        """State key of a page path: relative to the README's directory, whatever the working directory."""
+        return Path(os.path.relpath(Path(path).resolve(), self._base_dir)).as_posix()
+
+    def _page_file(self, key: str) -> Path:
+        """Resolved path of a state key."""
+        return (self._base_dir / key).resolve()
 
-            pattern = re.compile(f"(?s){re.escape(start_marker)}(.*?){re.escape(end_marker)}")
-            match = pattern.search(content)
-
-            if match:
-                old_table = match.group(1).strip()
-                new_table_stripped = new_table.strip()
-                if old_table != new_table_stripped:
-                    # 计算行数差异
-                    old_lines = len(old_table.split("\n"))
-                    new_lines = len(new_table_stripped.split("\n"))
-                    diffs.append(f"  {topic}: {old_lines} -> {new_lines} rows")
+    @staticmethod
+    def _read_text(path: Path) -> Optional[str]:
+        try:
+            return path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def _page_years(self, group: pd.DataFrame) -> List[int]:
+        if "Date" not in group.columns:
+            return [0] * len(group)
+        return [int(packed) // 100 if packed > 0 else 0 for packed in self._date_sort_values(group["Date"])]
+
+    def _plan_page_output(self):
+        """Work out every topic's pages and render those whose rows or files changed.
+
+        Returns (groups, pages per topic, new page texts per re-rendered
+        topic, state entries of topics left as they are, row digests of the
+        re-rendered topics, previous state).
+        """
+        layout = self.pages
+        groups = self._topic_groups()
+        slugs = topic_slugs(list(groups))
+        pages = {topic: plan_pages(layout, slugs[topic], self._page_years(group)) for topic, group in groups.items()}
+
+        previous = self._load_pages_state()
+        known_topics = previous.get("topics", {}) if previous.get("layout") == layout.signature(self._base_dir) else {}
+        kept: Dict[str, Dict[str, Any]] = {}
+        digests: Dict[str, str] = {}
+        for topic, group in groups.items():
+            digest = self._group_digest(group)
+            known = known_topics.get(topic)
+            if (
+                known is not None
+                and known.get("input") == digest
+                and set(known.get("pages", {})) == {self._page_key(page.path) for page in pages[topic]}
+                and all(self._file_matches(self._page_file(key), digest) for key, digest in known["pages"].items())
+            ):
+                kept[topic] = known
             else:
-                new_lines = len(new_table.strip().split("\n"))
-                diffs.append(f"  {topic}: NEW ({new_lines} rows)")
+                digests[topic] = digest
+
+        texts: Dict[str, Dict[Path, str]] = {}
+        for topic, table in self._tables_for(groups, digests).items():
+            lines = table[len(_TABLE_HEADER) :].split("\n")[:-1]
+            lines = [line + "\n" for line in lines]
+            texts[topic] = {
+                page.path: render_page(topic, page, _TABLE_HEADER, lines, self.readme_path) for page in pages[topic]
+            }
+        return groups, pages, texts, kept, digests, previous
+
+    def _file_matches(self, path: Path, text_digest: str) -> bool:
+        text = self._read_text(path)
+        return text is not None and self._block_digest(text) == text_digest
+
+    def _paged_readme(self, content: str, index: str) -> str:
+        """README content with managed topic tables removed and the topic index in place."""
+        segments = split_readme(content)
+        for topic in sorted({name for name, _ in segments if name is not None}):
+            segments = self._drop_topic_blocks(segments, topic, _REMOVED)
+        content = _collapse_removed("".join(text for _, text in segments))
+
+        start = content.find(INDEX_START)
+        end = content.find(INDEX_END, start + len(INDEX_START)) if start != -1 else -1
+        if end != -1:
+            return content[:start] + index + content[end + len(INDEX_END) :]
+        return content + f"\n# Topics\n{index}\n"
+
+    def _rewrite_pages(self) -> None:
+        """Write per-topic pages whose rows changed, drop stale ones, refresh the README index."""
+        groups, pages, texts, state, digests, previous = self._plan_page_output()
+        self.last_rendered = list(digests)
+        self.last_written = []
+
+        for topic, files in texts.items():
+            for path, text in files.items():
+                if self._read_text(path) != text:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    atomic_write_text(path, text)
+                    self.last_written.append(path)
+            state[topic] = {
+                "input": digests[topic],
+                "pages": {self._page_key(path): self._block_digest(text) for path, text in files.items()},
+            }
+
+        # Remove pages we generated earlier that are no longer produced. Only
+        # recorded files inside the pages directory are ever deleted.
+        directory = self.pages.directory.resolve()
+        current = {self._page_key(page.path) for topic_pages in pages.values() for page in topic_pages}
+        for entry in previous.get("topics", {}).values():
+            for key in entry.get("pages", {}):
+                path = self._page_file(key)
+                if key not in current and directory in path.parents:
+                    self._remove_page(path, directory)
+
+        content = self._read_text(self.readme_path)
+        original = content
+        if content is None:
+            content = "# Paper Collection\n\n"
+        counts = {topic: len(group) for topic, group in groups.items()}
+        content = self._paged_readme(content, render_index(pages, counts, self.readme_path.parent))
+        if content != original:
+            atomic_write_text(self.readme_path, content)
 
-        for topic in sorted(existing_topics - table_topics):
+        self._save_pages_state(self.pages.signature(self._base_dir), {topic: state[topic] for topic in groups})
+        self._row_cache.save()
+
+    @staticmethod
+    def _remove_page(path: Path, directory: Path) -> None:
+        """Delete a page and the directories it leaves empty, up to `directory`.
+
+        Both paths are resolved. `directory` itself is kept; pass the pages
+        directory's parent to remove the pages directory too once empty.
+        """
+        path.unlink(missing_ok=True)
+        parent = path.parent
+        while parent != directory and directory in parent.parents:
+            try:
+                parent.rmdir()
+            except OSError:
+                break
+            parent = parent.parent
+
+    def _leave_pages(self) -> bool:
+        """Delete the pages of an earlier `pages` layout, if any; returns whether there were some."""
+        self.last_removed = []
+        self._removed_paths = []
+        state = self._load_pages_state()
+        if not state:
+            return False
+        # Only recorded files inside the recorded pages directory are deleted.
+        directory = self._page_file(state["directory"]) if "directory" in state else None
+        for entry in state.get("topics", {}).values():
+            for key in entry.get("pages", {}):
+                path = self._page_file(key)
+                if directory is not None and directory in path.parents:
+                    self._remove_page(path, directory.parent)
+                    self.last_removed.append(path)
+        if self.last_removed:
+            self._removed_paths.append(directory)
+        self._pages_state_path.unlink(missing_ok=True)
+        return True
+
+    def _pages_diff(self) -> str:
+        groups, pages, texts, _, _, previous = self._plan_page_output()
+        self._row_cache.save()
+        old_topics = previous.get("topics", {})
+
+        diffs = []
+        for topic, files in texts.items():
+            written = {self._page_key(path) for path in files}
+            old_pages = old_topics.get(topic, {}).get("pages", {})
+            paths = list(files) + [self._page_file(key) for key in old_pages if key not in written]
+            old = {path: text for path in paths if (text := self._read_text(path)) is not None}
+            if not old:
+                diffs.append(f"  {topic}: NEW ({len(groups[topic])} rows)")
+            elif old.keys() != files.keys() or any(old[path] != text for path, text in files.items()):
+                diff = diff_tables("".join(old.values()), "".join(files.values()))
+                diffs.append(f"  {topic}: {diff.describe()}")
+
+        for topic in sorted(set(old_topics) - set(groups)):
             diffs.append(f"  {topic}: REMOVED")
 
+        content = self._read_text(self.readme_path) or ""
+        counts = {topic: len(group) for topic, group in groups.items()}
+        if self._paged_readme(content, render_index(pages, counts, self.readme_path.parent)) != content:
+            diffs.append(f"  {self.readme_path.name}: topic index updated")
+
         if diffs:
             return "Changes:\n" + "\n".join(diffs)
         return "No changes detected."
+
+
+def open_markdown(
+    repo_path: Path, library: Optional["Library"] = None, jobs: int = 1
+) -> MarkdownGenerator:
+    """Create the README generator of a repository with its configured layout."""
+    config = Config.for_repo(repo_path)
+    csv_path, readme_path = repo_files(repo_path)
+    if config.readme_layout not in README_LAYOUTS:
+        raise ValueError(
+            f"Unknown readme layout: {config.readme_layout!r} (expected one of {', '.join(README_LAYOUTS)})"
+        )
+    pages = None
+    if config.readme_layout == "pages":
+        pages = PageLayout(Path(repo_path) / config.pages_dir, config.pages_by_year, config.page_rows)
+    return MarkdownGenerator(csv_path, readme_path, library=library, jobs=jobs, pages=pages)
+
+
+def _render_fields(fields: pd.DataFrame) -> List[str]:
+    """Process-pool entry point for `MarkdownGenerator._render_tables`."""
+    return MarkdownGenerator._render_rows(fields)
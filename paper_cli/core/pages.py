@@ -0,0 +1,114 @@
+"""Per-topic Markdown pages for libraries too large for a single README."""
+
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+
+INDEX_START = "<!-- TOPIC_INDEX_START -->"
+INDEX_END = "<!-- TOPIC_INDEX_END -->"
+
+PAGE_NOTICE = "<!-- Generated from papers.csv by `paper sync`; edits will be overwritten. -->"
+
+_SLUG_RE = re.compile(r"[^\w]+", re.UNICODE)
+
+
+@dataclass(frozen=True)
+class PageLayout:
+    """Where topic pages go and how a topic is split across pages.
+
+    `by_year` puts each publication year on its own page (undated papers
+    last); `max_rows` caps the rows per page (0 = no cap).
+    """
+
+    directory: Path
+    by_year: bool = False
+    max_rows: int = 0
+
+    def signature(self, base: Path) -> str:
+        """Settings key, with the directory relative to `base` so it doesn't depend on the working directory."""
+        directory = Path(os.path.relpath(Path(self.directory).resolve(), Path(base).resolve())).as_posix()
+        return f"{directory}|{int(self.by_year)}|{self.max_rows}"
+
+
+@dataclass
+class Page:
+    """One output file: rows [start, end) of a topic table."""
+
+    path: Path
+    label: str
+    start: int
+    end: int
+
+
+def topic_slugs(topics: Sequence[str]) -> Dict[str, str]:
+    """File-name-safe, unique slug per topic ("Personalization & Memory" -> "personalization-memory")."""
+    slugs: Dict[str, str] = {}
+    used = set()
+    for topic in topics:
+        base = _SLUG_RE.sub("-", topic.casefold()).strip("-_") or "topic"
+        slug, n = base, 2
+        while slug in used:
+            slug, n = f"{base}-{n}", n + 1
+        used.add(slug)
+        slugs[topic] = slug
+    return slugs
+
+
+def plan_pages(layout: PageLayout, slug: str, years: Sequence[int]) -> List[Page]:
+    """Split a topic's rows (in table order, `years[i]` = 0 when undated) into pages."""
+    runs = []  # (label, start, end)
+    if layout.by_year:
+        start = 0
+        for i in range(1, len(years) + 1):
+            if i == len(years) or years[i] != years[start]:
+                runs.append((str(years[start]) if years[start] else "undated", start, i))
+                start = i
+    else:
+        runs.append(("", 0, len(years)))
+
+    pages = []
+    for label, start, end in runs:
+        base = f"{slug}/{label}" if label else slug
+        step = layout.max_rows if layout.max_rows > 0 else max(end - start, 1)
+        chunks = range(start, end, step) if end > start else [start]
+        for n, lo in enumerate(chunks, 1):
+            if len(chunks) == 1:
+                name, page_label = base, label
+            else:
+                name, page_label = f"{base}-{n}", f"{label} ({n})" if label else str(n)
+            pages.append(Page(layout.directory / f"{name}.md", page_label, lo, min(lo + step, end)))
+    return pages
+
+
+def relative_link(target: Path, start: Path) -> str:
+    """Markdown link target for `target` as seen from directory `start`."""
+    return Path(os.path.relpath(target, start)).as_posix()
+
+
+def render_page(topic: str, page: Page, table_header: str, lines: Sequence[str], readme_path: Path) -> str:
+    """Full content of one topic page."""
+    title = f"{topic} - {page.label}" if page.label else topic
+    back = relative_link(readme_path, page.path.parent)
+    return f"{PAGE_NOTICE}\n# {title}\n\n[Back to index]({back})\n\n{table_header}{''.join(lines[page.start : page.end])}"
+
+
+def render_index(topics: Dict[str, List[Page]], counts: Dict[str, int], readme_dir: Path) -> str:
+    """README block listing each topic with its paper count and pages."""
+    entries = [INDEX_START]
+    for topic, pages in topics.items():
+        papers = f"{counts[topic]} paper{'s' if counts[topic] != 1 else ''}"
+        name = topic.replace("[", "\\[").replace("]", "\\]")
+        if len(pages) == 1 and not pages[0].label:
+            entries.append(f"- [{name}]({relative_link(pages[0].path, readme_dir)}) ({papers})")
+            continue
+        links = " · ".join(
+            f"[{page.label}]({relative_link(page.path, readme_dir)}) ({page.end - page.start})" for page in pages
+        )
+        entries.append(f"- {name} ({papers}): {links}")
+    entries.append(INDEX_END)
+    return "\n".join(entries)
@@ -0,0 +1,65 @@
+"""Query planning: intersect per-filter candidate sets, most selective first."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Collection, List, Optional, Sequence, Tuple
+
+
+@dataclass
+class PlanStep:
+    """One index lookup and the candidates left after intersecting it."""
+
+    filter: str
+    index: str
+    candidates: int
+    remaining: int
+
+
+@dataclass
+class QueryPlan:
+    """What a search did, for `paper search --explain`."""
+
+    backend: str
+    total_rows: int
+    steps: List[PlanStep] = field(default_factory=list)
+    # Filters no index could narrow; they are only checked row by row.
+    scanned_filters: List[str] = field(default_factory=list)
+    verified: int = 0
+    matched: int = 0
+    elapsed: float = 0.0
+    notes: List[str] = field(default_factory=list)
+
+    def intersect(self, sources: Sequence[Tuple[str, str, Collection[int]]]) -> Optional[List[int]]:
+        """Intersect (filter, index, rows) candidate sets, smallest first.
+
+        Returns the sorted surviving rows, or None when there was nothing to
+        intersect (every row is a candidate).
+        """
+        if not sources:
+            return None
+        ordered = sorted(sources, key=lambda source: len(source[2]))
+        selected: Optional[set] = None
+        for name, index, rows in ordered:
+            if selected is None:
+                selected = set(rows)
+            elif selected:
+                selected.intersection_update(rows)
+            self.steps.append(PlanStep(name, index, len(rows), len(selected)))
+        return sorted(selected)
+
+    def describe(self) -> List[str]:
+        """Human-readable lines, one per step."""
+        lines = [f"backend: {self.backend}, {self.total_rows} rows"]
+        for i, step in enumerate(self.steps, 1):
+            lines.append(
+                f"{i}. {step.filter} via {step.index} index: "
+                f"{step.candidates} candidates -> {step.remaining} remaining"
+            )
+        if not self.steps and self.backend == "csv":
+            lines.append("no index applies: scanning every row")
+        if self.scanned_filters:
+            lines.append(f"checked row by row: {', '.join(self.scanned_filters)}")
+        lines.extend(self.notes)
+        lines.append(f"verified {self.verified} rows, {self.matched} matched in {self.elapsed * 1000:.2f} ms")
+        return lines
@@ -0,0 +1,76 @@
+"""Persisted cache of rendered Markdown table rows."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+from .cache import dump_entry, load_entry
+
+
+class RowRenderCache:
+    """Rendered table line per row hash, kept in `.paper-cache/` across runs.
+
+    Keys are 64-bit hashes of the fields a row is rendered from; the renderer
+    `version` is stored with the entries and a mismatch discards them all.
+    Entries not used by a run are dropped on save once they outnumber the
+    used ones, so edited or deleted rows do not accumulate forever.
+    """
+
+    def __init__(self, path: Path, version: int):
+        self.path = Path(path)
+        self.version = version
+        self._lines: Optional[Dict[int, str]] = None
+        self._used: set = set()
+        self._dirty = False
+
+    def _load(self) -> Dict[int, str]:
+        try:
+            with open(self.path, "rb") as f:
+                entry = load_entry(f, lambda header: header.get("version") == self.version)
+            if entry is not None and isinstance(entry[1], dict):
+                return entry[1]
+        except Exception:  # missing/corrupt/foreign/unsigned file: start over
+            pass
+        return {}
+
+    def get(self, key: int) -> Optional[str]:
+        if self._lines is None:
+            self._lines = self._load()
+        line = self._lines.get(key)
+        if line is not None:
+            self._used.add(key)
+        return line
+
+    def put(self, key: int, line: str) -> None:
+        if self._lines is None:
+            self._lines = self._load()
+        self._lines[key] = line
+        self._used.add(key)
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write new entries back (best effort, like the sidecar cache)."""
+        lines = self._lines
+        if lines is None:
+            return
+        if len(lines) > 2 * len(self._used):
+            lines = self._lines = {key: lines[key] for key in self._used}
+            self._dirty = True
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix=".tmp-", dir=self.path.parent)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    dump_entry(f, {"version": self.version}, lines)
+                os.replace(tmp, self.path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except OSError:
+            return
+        self._dirty = False
@@ -0,0 +1,240 @@
+"""Inverted index with BM25 ranking for keyword search."""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Columns searched by `Paper.matches_query`.
+SEARCH_FIELDS = ("Title", "Tag", "Authors", "Subjects")
+
+# Term frequencies are stored in one byte; BM25 saturates long before that.
+_MAX_TF = 255
+
+
+def tokenize(text: str) -> List[str]:
+    """Split lowercased text into word tokens."""
+    return _TOKEN_RE.findall(str(text).lower()) if text else []
+
+
+def trigrams(text: str) -> Set[str]:
+    """Return the set of 3-character substrings of `text`."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class SearchIndex:
+    """Term -> {row: term frequency} postings over `SEARCH_FIELDS`.
+
+    Keyword search keeps the substring semantics of `Paper.matches_query`:
+    every word run of a matching query is a substring of some indexed term, so
+    the union of postings of vocabulary terms containing each query token is a
+    superset of the true matches. Callers verify candidates exactly.
+
+    Terms are numbered in order of first appearance. Postings are kept packed
+    (`_offsets` into parallel `_rows`/`_tfs` arrays) so the index unpickles in
+    a few large copies; rows added since the last pickle live in `_tail`. The
+    vocabulary has its own trigram -> term ids index, so expanding a token to
+    the terms containing it does not scan every term.
+    """
+
+    # BM25 parameters (standard Okapi defaults).
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self) -> None:
+        self.vocabulary: List[str] = []
+        self.doc_lengths = array("I")
+        self.total_length = 0
+        self._offsets = array("I", [0])
+        self._rows = array("I")
+        self._tfs = array("B")
+        self._tail: Dict[int, Dict[int, int]] = {}
+        self._grams: Dict[str, array] = {}
+        self._ids: Optional[Dict[str, int]] = None
+
+    def __getstate__(self):
+        self._pack()
+        state = self.__dict__.copy()
+        del state["_ids"]  # rebuilt on demand
+        return state
+
+    def __setstate__(self, state) -> None:
+        self.__dict__.update(state)
+        self._ids = None
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, str]]) -> "SearchIndex":
+        index = cls()
+        for record in records:
+            index.add_record(record)
+        index._pack()
+        return index
+
+    @property
+    def size(self) -> int:
+        return len(self.doc_lengths)
+
+    def _term_ids(self) -> Dict[str, int]:
+        if self._ids is None:
+            self._ids = {term: i for i, term in enumerate(self.vocabulary)}
+        return self._ids
+
+    def add_record(self, record: Dict[str, str]) -> int:
+        """Index the next CSV row and return its row number."""
+        row = len(self.doc_lengths)
+        ids = self._term_ids()
+        count = 0
+        for field in SEARCH_FIELDS:
+            for term in tokenize(record.get(field, "")):
+                count += 1
+                term_id = ids.get(term)
+                if term_id is None:
+                    term_id = ids[term] = len(self.vocabulary)
+                    self.vocabulary.append(term)
+                    for gram in trigrams(term):
+                        self._grams.setdefault(gram, array("I")).append(term_id)
+                tfs = self._tail.setdefault(term_id, {})
+                tfs[row] = tfs.get(row, 0) + 1
+
+        self.doc_lengths.append(count)
+        self.total_length += count
+        return row
+
+    def _pack(self) -> None:
+        """Merge `_tail` into the packed postings."""
+        if not self._tail:
+            return
+        offsets, rows, tfs = array("I", [0]), array("I"), array("B")
+        packed = len(self._offsets) - 1
+        for term_id in range(len(self.vocabulary)):
+            if term_id < packed:
+                lo, hi = self._offsets[term_id], self._offsets[term_id + 1]
+                rows.extend(self._rows[lo:hi])
+                tfs.extend(self._tfs[lo:hi])
+            tail = self._tail.get(term_id)
+            if tail:
+                rows.extend(tail)
+                tfs.extend(min(tf, _MAX_TF) for tf in tail.values())
+            offsets.append(len(rows))
+        self._offsets, self._rows, self._tfs = offsets, rows, tfs
+        self._tail = {}
+
+    def _hits(self, term_id: int, rows: Set[int]) -> Tuple[int, Dict[int, int]]:
+        """Document frequency of a term and its {row: term frequency} within `rows`."""
+        hits: Dict[int, int] = {}
+        df = 0
+        if term_id < len(self._offsets) - 1:
+            lo, hi = self._offsets[term_id], self._offsets[term_id + 1]
+            df = hi - lo
+            posting, tfs = self._rows, self._tfs
+            if len(rows) * 8 < df:  # few rows: binary-search the sorted posting
+                for row in rows:
+                    i = bisect_left(posting, row, lo, hi)
+                    if i < hi and posting[i] == row:
+                        hits[row] = tfs[i]
+            else:
+                for row, tf in zip(posting[lo:hi], tfs[lo:hi]):
+                    if row in rows:
+                        hits[row] = tf
+        tail = self._tail.get(term_id)
+        if tail:
+            df += len(tail)
+            hits.update((row, tf) for row, tf in tail.items() if row in rows)
+        return df, hits
+
+    def _posting_rows(self, term_id: int) -> Iterable[int]:
+        rows: Iterable[int] = ()
+        if term_id < len(self._offsets) - 1:
+            rows = self._rows[self._offsets[term_id] : self._offsets[term_id + 1]]
+        tail = self._tail.get(term_id)
+        return (*rows, *tail) if tail else rows
+
+    def _terms_containing(self, token: str) -> List[int]:
+        """Ids of the vocabulary terms containing `token`."""
+        vocabulary = self.vocabulary
+        grams = trigrams(token)
+        if not grams:  # too short for the trigram index
+            return [i for i, term in enumerate(vocabulary) if token in term]
+        lists = []
+        for gram in grams:
+            ids = self._grams.get(gram)
+            if ids is None:
+                return []
+            lists.append(ids)
+        lists.sort(key=len)
+        found = set(lists[0])
+        for ids in lists[1:]:
+            found.intersection_update(ids)
+            if not found:
+                return []
+        return sorted(i for i in found if token in vocabulary[i])
+
+    def expand(self, query: str) -> Dict[str, List[int]]:
+        """Map each query token to the ids of the vocabulary terms containing it."""
+        return {token: self._terms_containing(token) for token in set(tokenize(query))}
+
+    def candidates(self, expansions: Dict[str, List[int]]) -> Optional[Set[int]]:
+        """Rows that may match an expanded query, or None if it cannot be narrowed."""
+        if not expansions:
+            return None
+
+        result: Optional[Set[int]] = None
+        # Longest tokens first: they tend to have the smallest posting unions.
+        for token in sorted(expansions, key=len, reverse=True):
+            rows: Set[int] = set()
+            for term_id in expansions[token]:
+                rows.update(self._posting_rows(term_id))
+            result = rows if result is None else result & rows
+            if not result:
+                return set()
+        return result
+
+    def _idf(self, df: int) -> float:
+        n = self.size
+        return math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+
+    def scores(self, expansions: Dict[str, List[int]], rows: Iterable[int]) -> Dict[int, float]:
+        """BM25 scores of `rows` for an expanded query.
+
+        Each query token contributes its best-scoring vocabulary expansion, so
+        "llm" still ranks papers that only mention "MLLM".
+        """
+        rows = set(rows)
+        scores = dict.fromkeys(rows, 0.0)
+        if not rows or not self.size:
+            return scores
+
+        avg_len = self.total_length / self.size or 1.0
+        for token, term_ids in expansions.items():
+            best: Dict[int, float] = {}
+            for term_id in term_ids:
+                df, hits = self._hits(term_id, rows)
+                idf = self._idf(df)
+                # Exact term hits outrank infix expansions.
+                weight = 1.0 if self.vocabulary[term_id] == token else 0.5
+                for row, tf in hits.items():
+                    norm = self.K1 * (1 - self.B + self.B * self.doc_lengths[row] / avg_len)
+                    value = weight * idf * tf * (self.K1 + 1) / (tf + norm)
+                    if value > best.get(row, 0.0):
+                        best[row] = value
+            for row, value in best.items():
+                scores[row] += value
+        return scores
+
+    def rank(self, expansions: Dict[str, List[int]], rows: Iterable[int], limit: int = 0) -> List[int]:
+        """Order `rows` by descending BM25 score (ties keep CSV order).
+
+        With `limit > 0` only the top-k rows are selected.
+        """
+        scores = self.scores(expansions, rows)
+        keyed: List[Tuple[float, int]] = [(-score, row) for row, score in scores.items()]
+        if limit > 0:
+            return [row for _, row in heapq.nsmallest(limit, keyed)]
+        return [row for _, row in sorted(keyed)]
@@ -0,0 +1,420 @@
+"""Optional SQLite mirror of papers.csv.
+
+papers.csv stays the canonical, git-friendly artifact. When the `sqlite`
+storage backend is selected, read paths run as SQL against a mirror database
+in the sidecar cache directory. The mirror records the CSV fingerprint it was
+built from and resyncs itself whenever the CSV changes (external edits,
+`git pull`), so it never has to be managed by hand.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .cache import CACHE_DIRNAME, CsvFingerprint, fingerprint_matches
+from .identity import query_keys, record_keys
+from .author_index import name_suffixes, normalize_author, split_authors
+from .tag_index import normalize_tag, parse_tag_expression, split_tag_cell
+from ..utils.date import date_key
+
+
+# Bump when the schema changes; older mirrors are rebuilt.
+SCHEMA_VERSION = 3
+
+_COLUMNS = [
+    ("source", "Source"),
+    ("title", "Title"),
+    ("authors", "Authors"),
+    ("doi", "DOI"),
+    ("journal_ref", "Journal_Ref"),
+    ("link", "Link"),
+    ("tag", "Tag"),
+    ("subjects", "Subjects"),
+    ("additional_info", "Additional_Info"),
+    ("date", "Date"),
+    ("topic", "Topic"),
+]
+
+# Columns searched by `Paper.matches_query`, mirrored into the FTS table.
+_FTS_COLUMNS = ("title", "tag", "authors", "subjects")
+
+_SCHEMA = """
+CREATE TABLE papers (
+    id INTEGER PRIMARY KEY,
+    {columns},
+    topic_key TEXT NOT NULL,
+    date_key INTEGER
+);
+CREATE INDEX papers_topic ON papers (topic_key);
+CREATE INDEX papers_date ON papers (date_key);
+CREATE TABLE identity (kind TEXT NOT NULL, key TEXT NOT NULL, row INTEGER NOT NULL);
+CREATE INDEX identity_key ON identity (kind, key);
+CREATE TABLE tags (seq INTEGER PRIMARY KEY, row INTEGER NOT NULL, tag TEXT NOT NULL, label TEXT NOT NULL);
+CREATE INDEX tags_tag ON tags (tag);
+CREATE TABLE authors (seq INTEGER PRIMARY KEY, row INTEGER NOT NULL, key TEXT NOT NULL, label TEXT NOT NULL);
+CREATE INDEX authors_key ON authors (key);
+CREATE TABLE author_suffixes (suffix TEXT NOT NULL, key TEXT NOT NULL, PRIMARY KEY (suffix, key)) WITHOUT ROWID;
+CREATE TABLE meta (key TEXT PRIMARY KEY, value);
+""".format(columns=",\n    ".join(f"{name} TEXT NOT NULL DEFAULT ''" for name, _ in _COLUMNS))
+
+_FTS_SCHEMA = "CREATE VIRTUAL TABLE papers_fts USING fts5({columns}, tokenize='trigram')".format(
+    columns=", ".join(_FTS_COLUMNS)
+)
+
+
+def _contains(needle: str, value: Optional[str]) -> bool:
+    """SQL function: Python's `needle in value.lower()` (Unicode-aware)."""
+    return bool(value) and needle in value.lower()
+
+
+def _fts_phrase(text: str) -> str:
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _can_use_fts(needle: str) -> bool:
+    # The trigram tokenizer needs 3+ characters, and its case folding only
+    # agrees with str.lower() for ASCII; other needles are verified by scan.
+    return len(needle) >= 3 and needle.isascii()
+
+
+class SqliteMirror:
+    """SQLite copy of papers.csv with identity, topic, date, tag and FTS5 indexes.
+
+    Row ids are 0-based CSV row numbers, the same numbering the sidecar
+    indexes use.
+    """
+
+    def __init__(self, csv_path: Path, db_path: Optional[Path] = None):
+        self.csv_path = Path(csv_path)
+        self.db_path = Path(db_path) if db_path else (
+            self.csv_path.parent / CACHE_DIRNAME / f"{self.csv_path.stem}.sqlite"
+        )
+        self._conn: Optional[sqlite3.Connection] = None
+        self.has_fts = False
+        self._last_query: Optional[Tuple[str, List[object]]] = None
+
+    def connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path)
+            conn.create_function("py_contains", 2, _contains, deterministic=True)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # -- synchronization -------------------------------------------------
+
+    def _stored_fingerprint(self) -> Optional[Tuple[CsvFingerprint, int]]:
+        conn = self.connect()
+        try:
+            meta = dict(conn.execute("SELECT key, value FROM meta"))
+        except sqlite3.DatabaseError:
+            return None
+        if meta.get("schema") != SCHEMA_VERSION:
+            return None
+        try:
+            fingerprint = CsvFingerprint(int(meta["size"]), int(meta["mtime_ns"]), str(meta["digest"]))
+            return fingerprint, int(meta["written_ns"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def _write_fingerprint(self, conn: sqlite3.Connection, fingerprint: CsvFingerprint) -> None:
+        values = {
+            "schema": SCHEMA_VERSION,
+            "size": fingerprint.size,
+            "mtime_ns": fingerprint.mtime_ns,
+            "digest": fingerprint.digest,
+            "written_ns": time.time_ns(),
+        }
+        conn.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", values.items())
+
+    def current(self) -> Optional[CsvFingerprint]:
+        """Return the CSV fingerprint if the mirror is in sync, else None."""
+        stored = self._stored_fingerprint()
+        if stored is None:
+            return None
+        return fingerprint_matches(self.csv_path, *stored)
+
+    def sync(self, load_rows: Callable[[], Tuple[List[str], List[Tuple[str, ...]]]]) -> None:
+        """Rebuild the mirror from the CSV unless it already matches it."""
+        if self.current() is not None:
+            self.has_fts = self._fts_exists()
+            return
+
+        fingerprint = CsvFingerprint.of(self.csv_path)
+        columns, rows = load_rows()
+        self._rebuild(columns, rows, fingerprint)
+
+    def _fts_exists(self) -> bool:
+        row = self.connect().execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'papers_fts'"
+        ).fetchone()
+        return row is not None
+
+    def _rebuild(
+        self,
+        columns: Sequence[str],
+        rows: Iterable[Tuple[str, ...]],
+        fingerprint: Optional[CsvFingerprint],
+    ) -> None:
+        conn = self.connect()
+        with conn:
+            for (name,) in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type IN ('table', 'view') AND name NOT LIKE 'sqlite_%'"
+            ).fetchall():
+                if not name.startswith("papers_fts_"):
+                    conn.execute(f'DROP TABLE IF EXISTS "{name}"')
+            conn.executescript(_SCHEMA)
+            try:
+                conn.execute(_FTS_SCHEMA)
+                self.has_fts = True
+            except sqlite3.OperationalError:
+                # FTS5/trigram not compiled in: keyword search falls back to a scan.
+                self.has_fts = False
+
+            pos = {name: i for i, name in enumerate(columns)}
+            records = (
+                {csv_name: row[pos[csv_name]] if csv_name in pos else "" for _, csv_name in _COLUMNS}
+                for row in rows
+            )
+            self._insert(conn, records, start=0)
+            if fingerprint is not None:
+                self._write_fingerprint(conn, fingerprint)
+
+    def _insert(self, conn: sqlite3.Connection, records: Iterable[Dict[str, str]], start: int) -> int:
+        placeholders = ", ".join("?" for _ in range(len(_COLUMNS) + 3))
+        names = ", ".join(["id", *(name for name, _ in _COLUMNS), "topic_key", "date_key"])
+        next_seq = conn.execute("SELECT COALESCE(MAX(seq), -1) + 1 FROM tags").fetchone()[0]
+        next_author = conn.execute("SELECT COALESCE(MAX(seq), -1) + 1 FROM authors").fetchone()[0]
+
+        row_id = start
+        for record in records:
+            fields = {csv_name: str(record.get(csv_name, "") or "") for _, csv_name in _COLUMNS}
+            key = date_key(fields["Date"])
+            conn.execute(
+                f"INSERT INTO papers ({names}) VALUES ({placeholders})",
+                (row_id, *fields.values(), fields["Topic"].lower(), key[0] * 100 + key[1] if key else None),
+            )
+            conn.executemany(
+                "INSERT INTO identity (kind, key, row) VALUES (?, ?, ?)",
+                [
+                    (kind, k, row_id)
+                    for kind, k in set(record_keys(fields["DOI"], fields["Link"], fields["Title"]))
+                ],
+            )
+            seen = set()
+            for label in split_tag_cell(fields["Tag"]):
+                tag = normalize_tag(label)
+                if tag not in seen:
+                    seen.add(tag)
+                    conn.execute(
+                        "INSERT INTO tags (seq, row, tag, label) VALUES (?, ?, ?, ?)", (next_seq, row_id, tag, label)
+                    )
+                    next_seq += 1
+            seen = set()
+            for label in split_authors(fields["Authors"]):
+                key = normalize_author(label)
+                if key and key not in seen:
+                    seen.add(key)
+                    conn.execute(
+                        "INSERT INTO authors (seq, row, key, label) VALUES (?, ?, ?, ?)", (next_author, row_id, key, label)
+                    )
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO author_suffixes (suffix, key) VALUES (?, ?)",
+                        [(suffix, key) for suffix in name_suffixes(key)],
+                    )
+                    next_author += 1
+            if self.has_fts:
+                conn.execute(
+                    "INSERT INTO papers_fts (rowid, title, tag, authors, subjects) VALUES (?, ?, ?, ?, ?)",
+                    (row_id, fields["Title"], fields["Tag"], fields["Authors"], fields["Subjects"]),
+                )
+            row_id += 1
+        return row_id
+
+    def append(self, records: Sequence[Dict[str, str]], before: CsvFingerprint, appended: int) -> bool:
+        """Mirror rows just appended to the CSV.
+
+        `before` is the fingerprint the mirror was in sync with prior to the
+        append of `appended` bytes. If anything else touched the CSV the mirror
+        is left stale and rebuilt on the next sync. Returns True if applied.
+        """
+        stored = self._stored_fingerprint()
+        if stored is None or stored[0].size != before.size or stored[0].digest != before.digest:
+            return False
+        fingerprint = CsvFingerprint.of(self.csv_path)
+        if fingerprint is None or fingerprint.size != before.size + appended:
+            return False
+
+        conn = self.connect()
+        self.has_fts = self._fts_exists()
+        with conn:
+            start = conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+            self._insert(conn, records, start=start)
+            self._write_fingerprint(conn, fingerprint)
+        return True
+
+    # -- queries ---------------------------------------------------------
+
+    def fetch(self, ids: Sequence[int]) -> List[Dict[str, str]]:
+        """Return CSV-style dicts for `ids`, in the given order."""
+        if not ids:
+            return []
+        names = ", ".join(["id", *(name for name, _ in _COLUMNS)])
+        by_id: Dict[int, Dict[str, str]] = {}
+        conn = self.connect()
+        # Stay below SQLite's bound-parameter limit.
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            marks = ", ".join("?" for _ in chunk)
+            for row in conn.execute(f"SELECT {names} FROM papers WHERE id IN ({marks})", chunk):
+                by_id[row[0]] = {csv_name: value for (_, csv_name), value in zip(_COLUMNS, row[1:])}
+        return [by_id[i] for i in ids]
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        tag: Optional[str] = None,
+        author: Optional[str] = None,
+        topic: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        recent: bool = False,
+        tag_match: str = "substring",
+        author_match: str = "substring",
+    ) -> List[int]:
+        """Return matching row ids, same semantics as `PaperStorage.search`.
+
+        Keyword matches found through FTS5 are ordered by its bm25(); all
+        other results keep CSV order. `recent` orders by date first.
+        """
+        where: List[str] = []
+        params: List[object] = []
+        match: List[str] = []
+
+        if query:
+            q = query.lower()
+            if self.has_fts and _can_use_fts(q):
+                match.append(_fts_phrase(q))
+            where.append("(" + " OR ".join(f"py_contains(?, p.{c})" for c in _FTS_COLUMNS) + ")")
+            params.extend([q] * len(_FTS_COLUMNS))
+
+        if tag and tag_match == "exact":
+            for options in parse_tag_expression(tag):
+                where.append(f"p.id IN (SELECT row FROM tags WHERE tag IN ({', '.join('?' for _ in options)}))")
+                params.extend(options)
+
+        if author and author_match == "prefix":
+            needle = normalize_author(author)
+            # Same prefix rule as `AuthorIndex.prefix`.
+            where.append(
+                "p.id IN (SELECT a.row FROM authors a JOIN author_suffixes s ON s.key = a.key "
+                "WHERE s.suffix >= ? AND s.suffix < ?)"
+            )
+            params.extend([needle, needle + "\U0010ffff"] if needle else ["", ""])
+
+        tag_substring = tag if tag_match == "substring" else None
+        author_substring = author if author_match == "substring" else None
+        for needle, column in ((tag_substring, "tag"), (author_substring, "authors")):
+            if needle:
+                n = needle.lower()
+                if self.has_fts and _can_use_fts(n):
+                    match.append(f"{column} : {_fts_phrase(n)}")
+                where.append(f"py_contains(?, p.{column})")
+                params.append(n)
+
+        if topic:
+            where.append("p.topic_key = ?")
+            params.append(topic.lower())
+
+        if date_from or date_to:
+            # If a date filter is requested, rows without a valid date are excluded.
+            where.append("p.date_key IS NOT NULL")
+            for value, op in ((date_from, ">="), (date_to, "<=")):
+                key = date_key(value) if value else None
+                if key:
+                    where.append(f"p.date_key {op} ?")
+                    params.append(key[0] * 100 + key[1])
+
+        if match:
+            sql = "SELECT p.id FROM papers_fts JOIN papers p ON p.id = papers_fts.rowid WHERE papers_fts MATCH ?"
+            params.insert(0, " AND ".join(match))
+            order = "bm25(papers_fts), p.id" if query and _can_use_fts(query.lower()) else "p.id"
+        else:
+            sql = "SELECT p.id FROM papers p WHERE 1"
+            order = "p.id"
+
+        for clause in where:
+            sql += f" AND {clause}"
+        if recent:
+            order = f"p.date_key IS NULL, p.date_key DESC, {order}"
+        sql += f" ORDER BY {order}"
+        self._last_query = (sql, params)
+        return [row[0] for row in self.connect().execute(sql, params)]
+
+    def query_plan(self) -> List[str]:
+        """SQLite's EXPLAIN QUERY PLAN details for the last `search`."""
+        if self._last_query is None:
+            return []
+        sql, params = self._last_query
+        return [row[-1] for row in self.connect().execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+    def count(self) -> int:
+        return self.connect().execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+
+    def topics(self) -> Dict[str, int]:
+        """Topic counts, most common first (ties in order of first appearance)."""
+        sql = (
+            "SELECT topic, COUNT(*) AS n FROM papers WHERE topic != '' "
+            "GROUP BY topic ORDER BY n DESC, MIN(id)"
+        )
+        return dict(self.connect().execute(sql).fetchall())
+
+    def tags(self) -> Dict[str, int]:
+        """Rows per normalized tag, most common first (ties in order of first appearance).
+
+        Each tag is shown with its most common spelling, like `TagIndex.tag_counts`.
+        """
+        conn = self.connect()
+        labels: Dict[str, str] = {}
+        for tag, label in conn.execute(
+            "SELECT tag, label FROM tags GROUP BY tag, label ORDER BY tag, COUNT(*) DESC, MIN(seq)"
+        ):
+            labels.setdefault(tag, label)
+        sql = "SELECT tag, COUNT(*) AS n FROM tags GROUP BY tag ORDER BY n DESC, MIN(seq)"
+        return {labels[tag]: n for tag, n in conn.execute(sql)}
+
+    def authors(self, prefix: Optional[str] = None, limit: int = 0) -> Dict[str, int]:
+        """Authors by paper count, like `AuthorIndex.top`."""
+        conn = self.connect()
+        labels: Dict[str, str] = {}
+        for key, label in conn.execute(
+            "SELECT key, label FROM authors GROUP BY key, label ORDER BY key, COUNT(*) DESC, MIN(seq)"
+        ):
+            labels.setdefault(key, label)
+        sql = "SELECT key, COUNT(*) AS n FROM authors"
+        params: List[object] = []
+        if prefix:
+            needle = normalize_author(prefix)
+            sql += " WHERE key IN (SELECT key FROM author_suffixes WHERE suffix >= ? AND suffix < ?)"
+            params.extend([needle, needle + "\U0010ffff"] if needle else ["", ""])
+        sql += " GROUP BY key ORDER BY n DESC, MIN(seq)"
+        if limit > 0:
+            sql += f" LIMIT {int(limit)}"
+        return {labels[key]: n for key, n in conn.execute(sql, params)}
+
+    def lookup(self, link: str) -> List[int]:
+        """Row ids matching a link/DOI/arXiv id (see `identity.query_keys`)."""
+        keys = query_keys(link)
+        if not keys:
+            return []
+        sql = " UNION ".join("SELECT row FROM identity WHERE kind = ? AND key = ?" for _ in keys)
+        params = [value for pair in keys for value in pair]
+        return sorted(row[0] for row in self.connect().execute(sql, params))
@@ -3,164 +3,232 @@
 from __future__ import annotations
 
 import csv
-import re
-from collections import Counter
+import io
 from pathlib import Path
-from typing import Dict, List, Optional
-from urllib.parse import urlsplit, urlunsplit
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 import pandas as pd
 
-from .models import Paper
-from ..utils.date import date_key
-
-
-_ARXIV_ID_RE = re.compile(r"(\d{4}\.\d{4,5})(?:v\d+)?", re.IGNORECASE)
-_ARXIV_BARE_RE = re.compile(r"^\d{4}\.\d{4,5}(?:v\d+)?$", re.IGNORECASE)
-_DOI_RE = re.compile(r"(10\.\d{4,9}/[^\s]+)", re.IGNORECASE)
+from ..config import Config
+from .author_index import AUTHOR_MATCH_MODES, AuthorIndex
+from .cache import CACHE_DIRNAME, CsvFingerprint, SidecarCache
+from .date_index import DateIndex
+from .identity import IdentityIndex, extract_arxiv_id, extract_doi, normalize_link
+from .journal import AppendJournal
+from .library import Library
+from .locking import file_lock
+from .models import CSV_COLUMNS, Paper
+from .planner import QueryPlan
+from .search_index import SearchIndex
+from .sqlite_mirror import SqliteMirror
+from .table import PaperTable
+from .tag_index import TAG_MATCH_MODES, TagIndex
+from .topic_index import TopicIndex
+from .trigram import TrigramIndex
+from ..utils.paths import papers_csv_path
 
 
 class PaperStorage:
     """CSV 存储管理，负责论文数据的读写和查询。"""
 
-    FIELDNAMES = [
-        "Source",
-        "Title",
-        "Authors",
-        "DOI",
-        "Journal_Ref",
-        "Link",
-        "Tag",
-        "Subjects",
-        "Additional_Info",
-        "Date",
-        "Topic",
-    ]
-
-    def __init__(self, csv_path: Path):
-        self.csv_path = Path(csv_path)
-
-    @staticmethod
-    def _extract_arxiv_id(value: str) -> Optional[str]:
-        """Extract canonical arXiv id (without version) from an arXiv-like input."""
-        if not value:
-            return None
-
-        raw = str(value).strip()
-        lowered = raw.lower()
-        looks_like_arxiv = (
-            "arxiv.org" in lowered
-            or lowered.startswith("arxiv:")
-            or bool(_ARXIV_BARE_RE.fullmatch(raw))
-        )
-        if not looks_like_arxiv:
-            return None
-
-        match = _ARXIV_ID_RE.search(raw)
-        return match.group(1) if match else None
-
-    @staticmethod
-    def _extract_doi(value: str) -> Optional[str]:
-        """Extract and normalize DOI token from free text/URLs."""
-        if not value:
-            return None
-
-        match = _DOI_RE.search(str(value))
-        if not match:
-            return None
-
-        doi = match.group(1)
-        doi = re.split(r"[&#?]", doi, maxsplit=1)[0]
-        doi = doi.lstrip("(<[{\"'")
-        doi = doi.rstrip(".,;:)]}>\"'")
-        return doi.lower()
-
-    @staticmethod
-    def _normalize_link(value: str) -> str:
-        """Normalize links for safer duplicate checks without changing semantics."""
-        if not value:
-            return ""
+    FIELDNAMES = list(CSV_COLUMNS)
 
-        raw = str(value).strip()
-        if not raw:
-            return ""
+    # Derived indexes kept in the sidecar cache, by cache entry name.
+    INDEXES = {
+        "identity": IdentityIndex,
+        "search": SearchIndex,
+        "trigram": TrigramIndex,
+        "dates": DateIndex,
+        "topics": TopicIndex,
+        "tags": TagIndex,
+        "authors": AuthorIndex,
+    }
 
-        parsed = urlsplit(raw)
-        if not (parsed.scheme and parsed.netloc):
-            return raw
-
-        # Normalize only scheme/host case and trailing slash in path.
-        path = parsed.path.rstrip("/")
-        return urlunsplit((parsed.scheme.lower(), parsed.netloc.lower(), path, parsed.query, parsed.fragment))
-
-    def load_all(self) -> List[Paper]:
-        """加载所有论文。"""
-        if not self.csv_path.exists():
-            return []
+    BACKENDS = ("csv", "sqlite")
 
+    def __init__(self, csv_path: Path, use_cache: bool = True, backend: str = "csv", fsync: bool = True):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown storage backend: {backend!r} (expected one of {', '.join(self.BACKENDS)})")
+        self.csv_path = Path(csv_path)
+        self.cache: Optional[SidecarCache] = SidecarCache(self.csv_path) if use_cache else None
+        self.backend = backend
+        self._mirror: Optional[SqliteMirror] = None
+        self._library: Optional[Library] = None
+        # fsync=False trades crash durability for speed (the journal still
+        # protects against torn rows from an interrupted process).
+        self._journal = AppendJournal(self.csv_path, fsync=fsync)
+        self._lock_path = self.csv_path.parent / CACHE_DIRNAME / f"{self.csv_path.stem}.lock"
+        self.last_match_count = 0
+        self.last_plan: Optional[QueryPlan] = None
+
+    def _sqlite(self) -> SqliteMirror:
+        """Return the SQLite mirror, resynced from the CSV if it changed."""
+        if self._mirror is None:
+            self._mirror = SqliteMirror(self.csv_path)
+        self._mirror.sync(self.load_rows)
+        return self._mirror
+
+    # Kept as static methods for callers that predate `core.identity`.
+    _extract_arxiv_id = staticmethod(extract_arxiv_id)
+    _extract_doi = staticmethod(extract_doi)
+    _normalize_link = staticmethod(normalize_link)
+
+    def _read_csv_table(self) -> PaperTable:
+        """Parse the CSV into a columnar `PaperTable`."""
         # Keep all columns as strings (the CSV is a pure metadata store).
         # This avoids dtype-related warnings/errors when filling missing values.
         df = pd.read_csv(self.csv_path, dtype=str, keep_default_na=False)
-        return [Paper.from_csv_row(row) for _, row in df.iterrows()]
-
-    def add_paper(self, paper: Paper) -> None:
-        """添加单篇论文到 CSV。"""
-        file_exists = self.csv_path.exists()
+        return PaperTable.from_dataframe(df)
 
-        with open(self.csv_path, "a", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=self.FIELDNAMES, quoting=csv.QUOTE_ALL)
-            if not file_exists:
-                writer.writeheader()
-            writer.writerow(paper.to_csv_row())
-
-    def exists(self, link: str) -> bool:
-        """检查论文是否已存在。
+    def load_table_with_fingerprint(self) -> Tuple[Optional[CsvFingerprint], PaperTable]:
+        """Return the CSV fingerprint and its parsed table.
 
-        Notes:
-            - arXiv IDs are only extracted/compared when the input looks like an arXiv link/ID.
-              (Avoid false positives on ACM DOIs like 10.1145/3706598.3713728.)
-            - DOIs are compared against stored DOI fields and DOI-style links.
-            - Fallback link matching uses normalized links (trim + URL host/scheme normalization).
+        The table is served from the sidecar cache when warm.
         """
-        if not link:
-            return False
-
-        papers = self.load_all()
-        if not papers:
-            return False
+        self.recover()
+        if not self.csv_path.exists():
+            return None, PaperTable([])
+
+        if self.cache is not None:
+            hit = self.cache.load_with_fingerprint("table", replay=PaperTable.append)
+            if hit is not None:
+                return hit
+
+        # Fingerprint before parsing: a concurrent edit then leaves the entry stale.
+        fingerprint = CsvFingerprint.of(self.csv_path)
+        table = self._read_csv_table()
+        if self.cache is not None:
+            self.cache.store("table", table, fingerprint)
+        return fingerprint, table
+
+    def load_rows(self) -> Tuple[List[str], List[Tuple[str, ...]]]:
+        """Return (columns, row tuples), served from the sidecar cache when warm."""
+        table = self.load_table_with_fingerprint()[1]
+        return table.columns, list(table.iter_rows())
+
+    def library(self) -> Library:
+        """Return the shared library snapshot, reloading it if the CSV changed."""
+        if self._library is None or not self._library.is_current():
+            self._library = Library(self)
+        return self._library
 
-        input_doi = self._extract_doi(link)
-        input_arxiv_id = self._extract_arxiv_id(link)
-        normalized_input_link = self._normalize_link(link)
+    def load_all(self) -> List[Paper]:
+        """加载所有论文。"""
+        return self.library().papers
 
-        stored_dois: set[str] = set()
-        stored_arxiv_ids: set[str] = set()
-        stored_links: set[str] = set()
+    def index(self, name: str):
+        """Return a derived index by name, loading or building it as needed.
 
+        Indexes are registered in `INDEXES`; each provides `from_records` and
+        `add_record` so it can be persisted and extended on append.
+        """
+        return self.library().index(name)
+
+    def identity_index(self) -> IdentityIndex:
+        """Return the duplicate-detection index."""
+        return self.index("identity")
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.csv_path, "rb") as f:
+            f.seek(0, 2)
+            if f.tell() == 0:
+                return True
+            f.seek(-1, 2)
+            return f.read(1) == b"\n"
+
+    def _encode_rows(self, papers: Sequence[Paper], header: bool) -> bytes:
+        buf = io.StringIO(newline="")
+        writer = csv.DictWriter(buf, fieldnames=self.FIELDNAMES, quoting=csv.QUOTE_ALL)
+        if header:
+            writer.writeheader()
         for paper in papers:
-            if paper.doi:
-                doi = self._extract_doi(paper.doi)
-                if doi:
-                    stored_dois.add(doi)
+            writer.writerow(paper.to_csv_row())
+        return buf.getvalue().encode("utf-8")
 
-            if paper.link:
-                stored_links.add(self._normalize_link(paper.link))
+    def add_paper(self, paper: Paper, allow_duplicate: bool = False) -> bool:
+        """添加单篇论文到 CSV，返回是否写入。
 
-                link_doi = self._extract_doi(paper.link)
-                if link_doi:
-                    stored_dois.add(link_doi)
+        Unless `allow_duplicate` is set, the paper's DOI and link are checked
+        again under the write lock, so a paper appended by a concurrent run
+        since the caller's own check is not added twice.
+        """
+        added, _ = self.add_papers([paper], skip_duplicates=not allow_duplicate)
+        return bool(added)
 
-                arxiv_id = self._extract_arxiv_id(paper.link)
-                if arxiv_id:
-                    stored_arxiv_ids.add(arxiv_id)
+    def add_papers(self, papers: Iterable[Paper], skip_duplicates: bool = True) -> Tuple[List[Paper], List[Paper]]:
+        """批量添加论文到 CSV，返回 (added, skipped)。
+
+        With `skip_duplicates`, each paper's DOI and link are checked against the
+        identity index and against earlier papers of the same batch in one pass.
+        All accepted rows are written with a single journaled append (see
+        `AppendJournal`), so a crash never leaves a torn row behind.
+        """
+        # Serialize with other writers; the snapshot below is (re)loaded under
+        # the lock, so the duplicate checks see their appends too.
+        with file_lock(self._lock_path):
+            self._recover_locked()
+            file_exists = self.csv_path.exists()
+
+            # Bring the snapshot up to date with the pre-append file so it can
+            # be extended in place afterwards.
+            library = self.library().load() if file_exists else None
+
+            added: List[Paper] = []
+            skipped: List[Paper] = []
+            batch = IdentityIndex()
+            for paper in papers:
+                if skip_duplicates:
+                    candidates = [c for c in (paper.doi, paper.link) if c]
+                    if any((library is not None and library.exists(c)) or batch.lookup(c) for c in candidates):
+                        skipped.append(paper)
+                        continue
+                    batch.add(paper.doi, paper.link, paper.title)
+                added.append(paper)
+
+            if not added:
+                return added, skipped
+
+            mirror_before = None
+            if self.backend == "sqlite" and file_exists:
+                mirror_before = self._sqlite().current()
+
+            data = self._encode_rows(added, header=not file_exists)
+            if file_exists and not self._ends_with_newline():
+                # Never glue the first new row onto an unterminated last line.
+                data = b"\n" + data
+            self._journal.append(data)
+
+            records = [paper.to_csv_row() for paper in added]
+            if library is not None:
+                library.extend(records, len(data))
+            elif self._library is not None:
+                self._library.invalidate()
+            if mirror_before is not None:
+                self._mirror.append(records, mirror_before, len(data))
+            return added, skipped
+
+    def recover(self) -> Optional[str]:
+        """Repair an append interrupted by a crash (see `AppendJournal.recover`)."""
+        if not self._journal.pending():
+            return None
+        with file_lock(self._lock_path):
+            return self._recover_locked()
 
-        if input_doi and input_doi in stored_dois:
-            return True
+    def _recover_locked(self) -> Optional[str]:
+        if not self._journal.pending():
+            return None
+        outcome = self._journal.recover()
+        if outcome and self._library is not None:
+            self._library.invalidate()
+        return outcome
 
-        if input_arxiv_id and input_arxiv_id in stored_arxiv_ids:
-            return True
+    def exists(self, link: str) -> bool:
+        """检查论文是否已存在。
 
-        return normalized_input_link in stored_links
+        Matching rules live in `IdentityIndex.lookup`; the index is persisted in
+        the sidecar cache, so this is a hash lookup on a warm cache.
+        """
+        return self.library().exists(link)
 
     def search(
         self,
@@ -170,79 +238,73 @@ class PaperStorage:
         topic: Optional[str] = None,
         date_from: Optional[str] = None,
         date_to: Optional[str] = None,
+        limit: int = 0,
+        recent: bool = False,
+        tag_match: str = "substring",
+        author_match: str = "substring",
     ) -> List[Paper]:
         """
         搜索论文。
 
+        Keyword matches are ranked by BM25 (best first); without a query the CSV
+        order is kept. With `recent`, results are ordered by date, most recent
+        first (undated last, ties in the previous order). The number of matches
+        before `limit` is applied is left in `last_match_count`, and the query
+        plan (indexes used, candidate counts, timing) in `last_plan`.
+
         Args:
             query: 关键字搜索（搜索标题、标签、作者）
-            tag: 按标签过滤
+            tag: 按标签过滤 (substring 模式下为子串; exact 模式下 "," 表示 AND, "|" 表示 OR)
             author: 按作者过滤
             topic: 按 topic 过滤
             date_from: 起始日期 (YYYY.MM)
             date_to: 截止日期 (YYYY.MM)
+            limit: 最多返回的结果数 (0 表示全部；有 query 时按 top-k 选取)
+            recent: 按日期倒序 (最新在前)
+            tag_match: "substring" (在整个 Tag 字段中子串匹配，不区分大小写) 或 "exact" (规范化标签精确匹配)
+            author_match: "substring" (在整个 Authors 字段中子串匹配，不区分大小写) 或
+                "prefix" (规范化姓名或其姓氏部分的前缀，不区分大小写和重音)
         """
-        papers = self.load_all()
-        results = []
-
-        for paper in papers:
-            # 关键字搜索
-            if query and not paper.matches_query(query):
-                continue
-
-            # 标签过滤
-            if tag and tag.lower() not in paper.tag.lower():
-                continue
-
-            # 作者过滤
-            if author and author.lower() not in paper.authors.lower():
-                continue
-
-            # Topic 过滤
-            if topic and topic.lower() != paper.topic.lower():
-                continue
-
-            # 日期范围过滤
-            if date_from or date_to:
-                p_key = date_key(paper.date)
-                # If a date filter is requested, rows without a valid date are excluded.
-                if not p_key:
-                    continue
-
-                from_key = date_key(date_from) if date_from else None
-                to_key = date_key(date_to) if date_to else None
-
-                if from_key and p_key < from_key:
-                    continue
-                if to_key and p_key > to_key:
-                    continue
-
-            results.append(paper)
-
-        return results
+        if tag_match not in TAG_MATCH_MODES:
+            raise ValueError(f"Unknown tag match mode: {tag_match!r} (expected one of {', '.join(TAG_MATCH_MODES)})")
+        if author_match not in AUTHOR_MATCH_MODES:
+            raise ValueError(
+                f"Unknown author match mode: {author_match!r} (expected one of {', '.join(AUTHOR_MATCH_MODES)})"
+            )
+        library = self.library()
+        papers, self.last_match_count = library.search(
+            query=query,
+            tag=tag,
+            author=author,
+            topic=topic,
+            date_from=date_from,
+            date_to=date_to,
+            limit=limit,
+            recent=recent,
+            tag_match=tag_match,
+            author_match=author_match,
+        )
+        self.last_plan = library.last_plan
+        return papers
 
     def get_topics(self) -> Dict[str, int]:
         """获取所有 topics 及其论文数量。"""
-        papers = self.load_all()
-        topics: Dict[str, int] = {}
-        for paper in papers:
-            if paper.topic:
-                topics[paper.topic] = topics.get(paper.topic, 0) + 1
-        return dict(sorted(topics.items(), key=lambda x: -x[1]))
+        return self.library().topics()
 
     def get_all_tags(self) -> Dict[str, int]:
         """获取所有标签及其出现次数。"""
-        papers = self.load_all()
-        tags: Counter = Counter()
-        for paper in papers:
-            if paper.tag:
-                # 分割逗号分隔的标签
-                for t in paper.tag.split(","):
-                    t = t.strip()
-                    if t:
-                        tags[t] += 1
-        return dict(tags.most_common())
+        return self.library().tags()
+
+    def get_authors(self, prefix: Optional[str] = None, limit: int = 0) -> Dict[str, int]:
+        """获取作者及其论文数量（按论文数降序；prefix 按规范化姓名前缀过滤）。"""
+        return self.library().authors(prefix, limit)
 
     def count(self) -> int:
         """返回论文总数。"""
-        return len(self.load_all())
+        return self.library().count()
+
+
+def open_storage(repo_path: Path) -> PaperStorage:
+    """Open the papers.csv of a repository with its configured backend."""
+    config = Config.for_repo(repo_path)
+    return PaperStorage(papers_csv_path(repo_path), backend=config.storage_backend, fsync=config.fsync_writes)
@@ -0,0 +1,162 @@
+"""Columnar in-memory representation of papers.csv."""
+
+from __future__ import annotations
+
+from array import array
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from ..utils.date import date_key
+
+
+# Columns whose values repeat across rows; stored as codes into a value list.
+CATEGORICAL = ("Source", "Journal_Ref", "Tag", "Subjects", "Date", "Topic")
+
+
+def pack_date(value: str) -> int:
+    """Return YYYYMM as an int, or 0 when the date is missing/invalid."""
+    key = date_key(value)
+    return key[0] * 100 + key[1] if key else 0
+
+
+class _Category:
+    """Interned string column: one code per row into a list of distinct values."""
+
+    __slots__ = ("values", "codes", "_lookup")
+
+    def __init__(self, values: List[str], codes: array):
+        self.values = values
+        self.codes = codes
+        self._lookup: Optional[Dict[str, int]] = None
+
+    def __getstate__(self):
+        return self.values, self.codes
+
+    def __setstate__(self, state) -> None:
+        self.values, self.codes = state
+        self._lookup = None
+
+    def code(self, value: str) -> int:
+        """Return the code of `value`, interning it if new."""
+        if self._lookup is None:
+            self._lookup = {v: i for i, v in enumerate(self.values)}
+        code = self._lookup.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self._lookup[value] = code
+        return code
+
+    def append(self, value: str) -> int:
+        code = self.code(value)
+        self.codes.append(code)
+        return code
+
+    def counts(self) -> Counter:
+        """Return {code: rows} for every code in use."""
+        return Counter(self.codes)
+
+
+class PaperTable:
+    """Struct-of-arrays view of the library.
+
+    Free-text columns (title, authors, ...) are plain lists of strings;
+    repeated columns (see `CATEGORICAL`) keep one interned value list plus an
+    array of codes, and the Date column is additionally packed into YYYYMM
+    integers (0 when invalid). `Paper` objects are only created on request.
+    """
+
+    def __init__(self, columns: Sequence[str]):
+        self.columns: List[str] = list(columns)
+        self._text: Dict[str, List[str]] = {}
+        self._cats: Dict[str, _Category] = {}
+        for name in self.columns:
+            if name in CATEGORICAL:
+                self._cats[name] = _Category([], array("I"))
+            else:
+                self._text[name] = []
+        self.dates = array("i")
+        self._size = 0
+
+    # -- construction ----------------------------------------------------
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "PaperTable":
+        """Build a table from an all-string DataFrame (as read by `pd.read_csv(dtype=str)`)."""
+        table = cls(list(df.columns))
+        for name in table.columns:
+            series = df[name].fillna("")
+            if name in table._cats:
+                codes, uniques = pd.factorize(series, sort=False)
+                table._cats[name] = _Category(
+                    [str(v) for v in uniques], array("I", codes.astype("uint32").tobytes())
+                )
+            else:
+                table._text[name] = series.tolist()
+        table._size = len(df)
+        table._derive()
+        return table
+
+    def _derive(self) -> None:
+        """Recompute the packed dates from the Date column."""
+        date = self._cats.get("Date")
+        if date is not None:
+            packed = [pack_date(v) for v in date.values]
+            self.dates = array("i", (packed[c] for c in date.codes))
+        else:
+            self.dates = array("i", bytes(4 * self._size))
+
+    def append(self, record: Dict[str, str]) -> None:
+        """Append one CSV-style record (missing columns become "")."""
+        for name in self.columns:
+            value = record.get(name, "") or ""
+            category = self._cats.get(name)
+            if category is None:
+                self._text[name].append(value)
+            else:
+                category.append(value)
+        self.dates.append(pack_date(record.get("Date", "") or "") if "Date" in self._cats else 0)
+        self._size += 1
+
+    # -- access ----------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._size
+
+    def value(self, row: int, name: str) -> str:
+        """Return one cell ("" for columns the CSV lacks)."""
+        category = self._cats.get(name)
+        if category is not None:
+            return category.values[category.codes[row]]
+        text = self._text.get(name)
+        return text[row] if text is not None else ""
+
+    def column(self, name: str) -> List[str]:
+        """Return a whole column as a list of strings."""
+        category = self._cats.get(name)
+        if category is not None:
+            values = category.values
+            return [values[c] for c in category.codes]
+        return list(self._text.get(name, [""] * self._size))
+
+    def row(self, row: int) -> Tuple[str, ...]:
+        return tuple(self.value(row, name) for name in self.columns)
+
+    def iter_rows(self) -> Iterator[Tuple[str, ...]]:
+        cols = [self.column(name) for name in self.columns]
+        return zip(*cols)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Return the table as an all-string DataFrame."""
+        return pd.DataFrame({name: self.column(name) for name in self.columns}, columns=self.columns, dtype=str)
+
+    # -- categorical helpers --------------------------------------------
+
+    def value_counts(self, name: str) -> Dict[str, int]:
+        """Return {value: rows} for a categorical column."""
+        category = self._cats.get(name)
+        if category is None:
+            return dict(Counter(self._text.get(name, [])))
+        return {category.values[code]: n for code, n in category.counts().items()}
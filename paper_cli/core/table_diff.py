@@ -0,0 +1,83 @@
+"""Row-level diff of README Markdown tables, keyed by paper identity."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+from .identity import extract_arxiv_id, extract_doi, normalize_link, normalize_title
+
+
+_LINKED_TITLE_RE = re.compile(r"^\[(.*)\]\((.*)\)$", re.DOTALL)
+
+RowKey = Tuple[str, str, int]
+
+
+def paper_key(link: str, title: str) -> Tuple[str, str]:
+    """Identity of a table row: arXiv id, DOI, link, then title as the fallback."""
+    if link:
+        arxiv_id = extract_arxiv_id(link)
+        if arxiv_id:
+            return "arxiv", arxiv_id
+        doi = extract_doi(link)
+        if doi:
+            return "doi", doi
+        return "link", normalize_link(link)
+    return "title", normalize_title(title)
+
+
+def parse_table_rows(table: str) -> Dict[RowKey, str]:
+    """Map each paper row of a rendered table to its line.
+
+    The title cell (`[title](link)` or a bare title) gives the identity; a
+    paper listed twice gets an occurrence counter in its key. Header,
+    separator and non-table lines are skipped.
+    """
+    rows: Dict[RowKey, str] = {}
+    for line in table.splitlines():
+        if not line.startswith("| ") or line.startswith("| Source |"):
+            continue
+        cells = line[2:].split(" | ")
+        title_cell = cells[1] if len(cells) > 1 else line
+        match = _LINKED_TITLE_RE.match(title_cell)
+        kind, key = paper_key(match.group(2), match.group(1)) if match else paper_key("", title_cell)
+        n = 0
+        while (kind, key, n) in rows:
+            n += 1
+        rows[(kind, key, n)] = line
+    return rows
+
+
+@dataclass
+class TableDiff:
+    """Papers added to, removed from and changed in one topic table."""
+
+    added: List[RowKey] = field(default_factory=list)
+    removed: List[RowKey] = field(default_factory=list)
+    modified: List[RowKey] = field(default_factory=list)
+
+    def describe(self) -> str:
+        parts = []
+        if self.added:
+            parts.append(f"+{len(self.added)} added")
+        if self.removed:
+            parts.append(f"-{len(self.removed)} removed")
+        if self.modified:
+            parts.append(f"~{len(self.modified)} modified")
+        return ", ".join(parts) or "rows reordered or reformatted"
+
+
+def diff_tables(old_table: str, new_table: str) -> TableDiff:
+    """Compare two renderings of a topic table row by row (linear time)."""
+    old_rows = parse_table_rows(old_table)
+    new_rows = parse_table_rows(new_table)
+    diff = TableDiff()
+    for key, line in new_rows.items():
+        old_line = old_rows.get(key)
+        if old_line is None:
+            diff.added.append(key)
+        elif old_line != line:
+            diff.modified.append(key)
+    diff.removed = [key for key in old_rows if key not in new_rows]
+    return diff
@@ -0,0 +1,120 @@
+"""Normalized tag vocabulary with per-tag row bitmaps."""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List
+
+
+# "substring" (the default) matches text anywhere in the Tag cell; "exact"
+# matches normalized tags, with "," = AND and "|" = OR.
+TAG_MATCH_MODES = ("substring", "exact")
+
+
+def normalize_tag(tag: str) -> str:
+    """Casefold and collapse whitespace, so "LLM" and " llm " are one tag."""
+    return " ".join(tag.casefold().split())
+
+
+def split_tag_cell(value: str) -> List[str]:
+    """Split a comma-separated Tag cell into its non-empty, stripped tags."""
+    return [t for t in (piece.strip() for piece in (value or "").split(",")) if t]
+
+
+def parse_tag_expression(expression: str) -> List[List[str]]:
+    """Parse a tag filter into AND-ed groups of OR-ed normalized tags.
+
+    "," separates required tags and "|" separates alternatives, so
+    "llm|mllm, memory" means (llm OR mllm) AND memory.
+    """
+    clauses = []
+    for part in expression.split(","):
+        options = [normalize_tag(t) for t in part.split("|")]
+        options = [t for t in options if t]
+        if options:
+            clauses.append(options)
+    return clauses
+
+
+def bitmap_rows(bitmap: int) -> List[int]:
+    """Return the set bits of `bitmap` as ascending row numbers."""
+    bits = bin(bitmap)[:1:-1]
+    return [row for row, bit in enumerate(bits) if bit == "1"]
+
+
+def _bitmap(rows: List[int]) -> int:
+    if not rows:
+        return 0
+    buf = bytearray(rows[-1] // 8 + 1)
+    for row in rows:
+        buf[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(buf, "little")
+
+
+class TagIndex:
+    """Normalized tag -> bitmap of the rows carrying it (bit i = CSV row i).
+
+    Tag filters become AND/OR of Python ints and tag counts are kept up to
+    date as rows are added. Each tag is displayed with its most common
+    spelling (first seen wins ties); vocabulary order is first appearance.
+    """
+
+    def __init__(self) -> None:
+        self.size = 0
+        self.bitmaps: Dict[str, int] = {}
+        self.counts: Dict[str, int] = {}
+        self.spellings: Dict[str, Dict[str, int]] = {}
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, str]]) -> "TagIndex":
+        index = cls()
+        rows: Dict[str, List[int]] = {}
+        for record in records:
+            row = index.size
+            index.size += 1
+            for key in index._count(record):
+                rows.setdefault(key, []).append(row)
+        index.bitmaps = {key: _bitmap(found) for key, found in rows.items()}
+        return index
+
+    def _count(self, record: Dict[str, str]) -> List[str]:
+        """Update counts/spellings for one row and return its distinct tag keys."""
+        keys: Dict[str, None] = {}
+        for tag in split_tag_cell(record.get("Tag", "")):
+            key = normalize_tag(tag)
+            if key in keys:
+                continue
+            keys[key] = None
+            self.counts[key] = self.counts.get(key, 0) + 1
+            spellings = self.spellings.setdefault(key, {})
+            spellings[tag] = spellings.get(tag, 0) + 1
+        return list(keys)
+
+    def add_record(self, record: Dict[str, str]) -> int:
+        """Index the next CSV row and return its row number."""
+        row = self.size
+        self.size += 1
+        bit = 1 << row
+        for key in self._count(record):
+            self.bitmaps[key] = self.bitmaps.get(key, 0) | bit
+        return row
+
+    def label(self, key: str) -> str:
+        spellings = self.spellings[key]
+        return max(spellings, key=spellings.__getitem__)
+
+    def match(self, clauses: List[List[str]]) -> int:
+        """Bitmap of rows satisfying AND-ed groups of OR-ed tags (see `parse_tag_expression`)."""
+        result = -1  # all bits set
+        for options in clauses:
+            any_of = 0
+            for key in options:
+                any_of |= self.bitmaps.get(key, 0)
+            result &= any_of
+            if not result:
+                break
+        return result if result > 0 else 0
+
+    def tag_counts(self) -> Dict[str, int]:
+        """Rows per tag (by display spelling), most common first."""
+        ranked = sorted(self.counts.items(), key=lambda item: -item[1])
+        return {self.label(key): n for key, n in ranked}
@@ -0,0 +1,36 @@
+"""Topic -> rows postings for exact (case-insensitive) topic filters."""
+
+from __future__ import annotations
+
+from array import array
+from typing import Dict, Iterable
+
+
+class TopicIndex:
+    """Lowercased topic -> ascending row numbers."""
+
+    def __init__(self) -> None:
+        self.size = 0
+        self.postings: Dict[str, array] = {}
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, str]]) -> "TopicIndex":
+        index = cls()
+        for record in records:
+            index.add_record(record)
+        return index
+
+    def add_record(self, record: Dict[str, str]) -> int:
+        """Index the next CSV row and return its row number."""
+        row = self.size
+        self.size += 1
+        key = (record.get("Topic", "") or "").lower()
+        posting = self.postings.get(key)
+        if posting is None:
+            posting = self.postings[key] = array("I")
+        posting.append(row)
+        return row
+
+    def rows(self, topic: str) -> array:
+        """Rows whose topic equals `topic`, ignoring case."""
+        return self.postings.get(topic.lower(), array("I"))
@@ -0,0 +1,117 @@
+"""Trigram index for case-insensitive substring search."""
+
+from __future__ import annotations
+
+from array import array
+from typing import Dict, Iterable, List, Optional, Set
+
+from .search_index import SEARCH_FIELDS, trigrams
+from .tag_index import bitmap_rows
+
+
+def _bitmap(rows: Iterable[int], size: int) -> int:
+    buf = bytearray(size // 8 + 1)
+    for row in rows:
+        buf[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(buf, "little")
+
+
+class TrigramIndex:
+    """Trigram -> rows over the lowercased `SEARCH_FIELDS`.
+
+    Keyword queries other than a single word and the substring-mode `--tag`
+    and `--author` filters are plain `needle in field.lower()` tests. Any
+    field containing the needle contains all of its trigrams, so intersecting
+    the needle's postings yields a superset of the matches that callers then
+    verify with the original test. Needles shorter than three characters
+    cannot be narrowed.
+
+    Rare trigrams keep sorted row arrays; trigrams found in more than 1/32 of
+    the rows are stored as row bitmaps (like `TagIndex`), which are smaller
+    and intersect with a single `&`.
+    """
+
+    # A posting becomes a bitmap once it holds more than size / DENSE rows.
+    DENSE = 32
+
+    def __init__(self) -> None:
+        self.size = 0
+        self.postings: Dict[str, array] = {}
+        self.bitmaps: Dict[str, int] = {}
+
+    def __getstate__(self):
+        self._compact()
+        return self.__dict__.copy()
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, str]]) -> "TrigramIndex":
+        index = cls()
+        for record in records:
+            index.add_record(record)
+        index._compact()
+        return index
+
+    def _compact(self) -> None:
+        """Turn postings that became dense into bitmaps."""
+        for gram in [g for g, rows in self.postings.items() if len(rows) * self.DENSE > self.size]:
+            self.bitmaps[gram] = _bitmap(self.postings.pop(gram), self.size)
+
+    def add_record(self, record: Dict[str, str]) -> int:
+        """Index the next CSV row and return its row number."""
+        row = self.size
+        self.size += 1
+
+        grams: Set[str] = set()
+        for field in SEARCH_FIELDS:
+            value = record.get(field, "")
+            if value:
+                grams |= trigrams(str(value).lower())
+
+        bit = 1 << row
+        for gram in grams:
+            bitmap = self.bitmaps.get(gram)
+            if bitmap is not None:
+                self.bitmaps[gram] = bitmap | bit
+                continue
+            posting = self.postings.get(gram)
+            if posting is None:
+                posting = self.postings[gram] = array("I")
+            posting.append(row)
+        return row
+
+    def candidates(self, needle: str) -> Optional[Set[int]]:
+        """Rows whose indexed fields may contain `needle` (case-insensitive).
+
+        Returns None when the needle is too short to use the index.
+        """
+        grams = trigrams(needle.lower())
+        if not grams:
+            return None
+
+        lists: List[array] = []
+        mask = -1  # all rows
+        for gram in grams:
+            bitmap = self.bitmaps.get(gram)
+            if bitmap is not None:
+                mask &= bitmap
+                continue
+            posting = self.postings.get(gram)
+            if posting is None:
+                return set()
+            lists.append(posting)
+
+        if not lists:
+            return set(bitmap_rows(mask)) if mask > 0 else set()
+
+        lists.sort(key=len)
+        result = set(lists[0])
+        for posting in lists[1:]:
+            result.intersection_update(posting)
+            if not result:
+                return result
+        if mask != -1:
+            if len(result) * 64 < self.size:
+                result = {row for row in result if mask >> row & 1}
+            else:
+                result.intersection_update(bitmap_rows(mask))
+        return result
@@ -111,6 +111,19 @@ def display_topics(topics: dict) -> None:
     console.print(table)
 
 
+def display_authors(authors: dict, title: str = "Authors") -> None:
+    """显示作者及其论文数量。"""
+    table = Table(title=title)
+    table.add_column("#", style="dim", width=4)
+    table.add_column("Author", style="cyan")
+    table.add_column("Papers", justify="right", style="green")
+
+    for i, (author, count) in enumerate(authors.items(), 1):
+        table.add_row(str(i), author, str(count))
+
+    console.print(table)
+
+
 def display_stats(
     total: int,
     topics: dict,
@@ -0,0 +1,9 @@
+import os
+import tempfile
+
+from paper_cli.core.cache import KEY_PATH_ENV
+
+# Sign cache entries written by the tests with a throwaway key instead of
+# creating one in the developer's home directory.
+_key_dir = tempfile.TemporaryDirectory()
+os.environ[KEY_PATH_ENV] = os.path.join(_key_dir.name, "cache.key")
@@ -58,7 +58,7 @@ class TestAddCommand(unittest.TestCase):
         self._tmp.cleanup()
 
     def test_add_detects_duplicate_after_metadata_fetch(self) -> None:
-        with patch("paper_cli.commands.add.FetcherRegistry", return_value=_FakeRegistry()):
+        with patch("paper_cli.commands.add.FetcherRegistry.for_repo", return_value=_FakeRegistry()):
             with patch("paper_cli.commands.add.typer.confirm", return_value=False) as confirm:
                 with self.assertRaises(typer.Exit) as cm:
                     add_paper(
@@ -77,6 +77,31 @@ class TestAddCommand(unittest.TestCase):
             rows = list(csv.reader(f))
         self.assertEqual(len(rows), 2)
 
+    def test_add_rechecks_duplicates_under_the_lock(self) -> None:
+        new = Paper(title="Concurrent Paper", doi="10.1145/7777777", link="https://doi.org/10.1145/7777777", topic="VR")
+
+        class _RacingFetcher:
+            def fetch(inner, url: str, custom_tag=None) -> Paper:  # noqa: ANN001, N805
+                # Another `paper add` appends the same paper while this one fetches.
+                PaperStorage(self.csv_path).add_paper(new)
+                return Paper(title=new.title, doi=new.doi, link=new.link)
+
+        registry = _FakeRegistry()
+        registry.get_fetcher = lambda url: _RacingFetcher()  # type: ignore[method-assign]
+        with patch("paper_cli.commands.add.FetcherRegistry.for_repo", return_value=registry):
+            with self.assertRaises(typer.Exit) as cm:
+                add_paper(
+                    link="https://dl.acm.org/doi/10.1145/7777777",
+                    topic="VR",
+                    no_sync=True,
+                    no_git=True,
+                    repo_path=self.repo,
+                )
+
+        self.assertEqual(cm.exception.exit_code, 0)
+        titles = [p.title for p in PaperStorage(self.csv_path).load_all()]
+        self.assertEqual(titles, ["Existing IEEE Paper", "Concurrent Paper"])
+
 
 if __name__ == "__main__":
     unittest.main()
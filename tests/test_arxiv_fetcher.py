@@ -0,0 +1,121 @@
+import tempfile
+import time
+import unittest
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import arxiv
+
+from paper_cli.core.fetchers.arxiv import ArxivFetcher
+from paper_cli.core.http_cache import ResponseCache
+
+
+def _result(paper_id: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        entry_id=f"http://arxiv.org/abs/{paper_id}v2",
+        pdf_url=f"http://arxiv.org/pdf/{paper_id}v2",
+        title=f"Paper {paper_id}",
+        authors=[SimpleNamespace(name="Alice")],
+        updated=datetime(2024, 5, 1),
+        categories=["cs.HC"],
+        doi=None,
+        journal_ref=None,
+        comment=None,
+    )
+
+
+class FakeClient:
+    """Answers `id_list` searches from a fixed set of known ids."""
+
+    def __init__(self, known, reject=()):
+        self.known = set(known)
+        self.reject = set(reject)
+        self.queries = []
+
+    def results(self, search):
+        self.queries.append(list(search.id_list))
+        if self.reject & set(search.id_list):
+            raise arxiv.HTTPError("http://export.arxiv.org/api/query", 0, 400)
+        return iter([_result(i) for i in search.id_list if i in self.known])
+
+
+_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <entry>
+    <id>http://arxiv.org/abs/2401.00001v2</id>
+    <updated>2024-05-01T00:00:00Z</updated>
+    <published>2024-01-01T00:00:00Z</published>
+    <title>Cached Paper</title>
+    <summary>Abstract</summary>
+    <author><name>Alice</name></author>
+    <link href="http://arxiv.org/abs/2401.00001v2" rel="alternate" type="text/html"/>
+    <link title="pdf" href="http://arxiv.org/pdf/2401.00001v2" rel="related" type="application/pdf"/>
+    <arxiv:primary_category term="cs.HC"/>
+    <category term="cs.HC"/>
+  </entry>
+</feed>"""
+
+
+class TestArxivFetchMany(unittest.TestCase):
+    def _fetcher(self, client: FakeClient, batch_size: int = 2) -> ArxivFetcher:
+        fetcher = ArxivFetcher()
+        fetcher.client = client
+        fetcher.BATCH_SIZE = batch_size
+        return fetcher
+
+    def test_batches_ids_and_maps_results_to_inputs(self) -> None:
+        client = FakeClient(["2401.00001", "2401.00002", "2401.00003"])
+        urls = [
+            "https://arxiv.org/abs/2401.00003",
+            "2401.00001",
+            "arxiv:2401.00002v1",
+            "2401.00004",
+            "https://arxiv.org/pdf/2401.00001",
+        ]
+
+        papers, missing = self._fetcher(client).fetch_many(urls, custom_tag="hci")
+
+        self.assertEqual(client.queries, [["2401.00003", "2401.00001"], ["2401.00002", "2401.00004"]])
+        self.assertEqual(list(papers), [urls[0], urls[1], urls[2], urls[4]])
+        self.assertEqual(papers[urls[0]].title, "Paper 2401.00003")
+        self.assertEqual(papers[urls[4]].link, "http://arxiv.org/abs/2401.00001v2")
+        self.assertEqual(papers[urls[1]].tag, "hci")
+        self.assertEqual(missing, ["2401.00004"])
+
+    def test_rejected_batch_is_split_to_isolate_bad_ids(self) -> None:
+        client = FakeClient(["2401.00001", "2401.00002", "2401.00003"], reject=["2401.00009"])
+
+        papers, missing = self._fetcher(client, batch_size=4).fetch_many(
+            ["2401.00001", "2401.00009", "2401.00002", "2401.00003"]
+        )
+
+        self.assertEqual(set(papers), {"2401.00001", "2401.00002", "2401.00003"})
+        self.assertEqual(missing, ["2401.00009"])
+        self.assertEqual(client.queries[0], ["2401.00001", "2401.00009", "2401.00002", "2401.00003"])
+
+    def test_invalid_input_raises_before_any_request(self) -> None:
+        client = FakeClient([])
+        with self.assertRaises(ValueError):
+            self._fetcher(client).fetch_many(["2401.00001", "not-an-id"])
+        self.assertEqual(client.queries, [])
+
+
+class TestArxivCache(unittest.TestCase):
+    def test_cached_responses_are_not_delayed(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ResponseCache(Path(tmp))
+            fetcher = ArxivFetcher(cache)
+            search = arxiv.Search(id_list=["2401.00001"])
+            cache.put(fetcher.client._format_url(search, 0, fetcher.BATCH_SIZE), _FEED, "application/atom+xml")
+
+            start = time.monotonic()
+            titles = [fetcher.fetch("2401.00001").title for _ in range(3)]
+
+            self.assertEqual(titles, ["Cached Paper"] * 3)
+            # Online, only requests that reach arXiv are spaced out.
+            self.assertLess(time.monotonic() - start, fetcher.REQUEST_INTERVAL)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+from paper_cli.core.author_index import AuthorIndex, normalize_author, split_authors
+
+
+class TestAuthorIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        cells = [
+            "Jürgen Müller, Yu Wang, et al.",
+            "Yu  Wang, Yuxin Li",
+            "Authors TBD",
+            "jurgen muller, yu wang",
+        ]
+        self.index = AuthorIndex.from_records({"Authors": c} for c in cells)
+
+    def test_names_are_normalized(self) -> None:
+        self.assertEqual(normalize_author("Jürgen  Müller-Lee"), "jurgen muller lee")
+        self.assertEqual(split_authors("A B, et al."), ["A B"])
+        self.assertEqual(list(self.index.rows("JURGEN MULLER")), [0, 3])
+        self.assertEqual(list(self.index.rows("yu wang")), [0, 1, 3])
+
+    def test_prefix_lookup(self) -> None:
+        self.assertEqual(self.index.prefix("yu"), {"yu wang", "yuxin li"})
+        self.assertEqual(self.index.prefix("yu w"), {"yu wang"})
+        self.assertEqual(self.index.prefix("mül"), {"jurgen muller"})
+        self.assertEqual(self.index.prefix_rows("li"), {1})
+
+    def test_top_authors_and_incremental_add(self) -> None:
+        self.assertEqual(self.index.top(), {"Yu Wang": 3, "Jürgen Müller": 2, "Yuxin Li": 1})
+        self.index.add_record({"Authors": "Yuxin Li, Ana Ruiz"})
+        self.assertEqual(self.index.top(2), {"Yu Wang": 3, "Jürgen Müller": 2})
+        self.assertEqual(self.index.top(prefix="ru"), {"Ana Ruiz": 1})
+        self.assertEqual(self.index.prefix("ana"), {"ana ruiz"})
+        self.assertEqual(list(self.index.rows("yuxin li")), [1, 4])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+import asyncio
+import json
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote
+
+from paper_cli.core.fetchers.crossref_async import AsyncCrossRefFetcher, TokenBucket, parse_rate_limit
+from paper_cli.core.http_cache import ResponseCache
+
+
+class StubCrossRef(ThreadingHTTPServer):
+    """Local stand-in for api.crossref.org/works/<doi>."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.lock = threading.Lock()
+        self.hits = {}
+        self.active = 0
+        self.max_active = 0
+        self.delay = 0.05
+        self.rate_headers = {"X-Rate-Limit-Limit": "50", "X-Rate-Limit-Interval": "1s"}
+        self.throttle_once = set()
+
+    @property
+    def api_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/works/"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        server = self.server
+        doi = unquote(self.path[len("/works/") :])
+        with server.lock:
+            server.hits[doi] = server.hits.get(doi, 0) + 1
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+            throttled = doi in server.throttle_once
+            server.throttle_once.discard(doi)
+        time.sleep(server.delay)
+        with server.lock:
+            server.active -= 1
+
+        if throttled:
+            self._reply(429, {}, {"Retry-After": "0"})
+        elif doi.startswith("10.1145/missing"):
+            self._reply(404, {})
+        else:
+            message = {
+                "title": [f"Paper {doi}"],
+                "author": [{"given": "Ada", "family": "Lovelace"}],
+                "container-title": ["CHI"],
+                "published-print": {"date-parts": [[2024, 5]]},
+            }
+            self._reply(200, {"message": message}, server.rate_headers)
+
+    def _reply(self, status, body, headers=None) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class TestAsyncCrossRefFetcher(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = StubCrossRef()
+        self._thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _run(self, urls, **options):
+        async def main():
+            async with AsyncCrossRefFetcher(api_url=self.server.api_url, **options) as fetcher:
+                return await fetcher.fetch_many(urls), fetcher
+
+        return asyncio.run(main())
+
+    def test_fetch_many_parses_like_sync_fetcher(self) -> None:
+        (papers, errors), _ = self._run(["https://dl.acm.org/doi/10.1145/1", "10.1145/missing1"], rate=100)
+
+        paper = papers["https://dl.acm.org/doi/10.1145/1"]
+        self.assertEqual(paper.title, "Paper 10.1145/1")
+        self.assertEqual(paper.authors, "Ada Lovelace")
+        self.assertEqual(paper.source, "CHI 2024")
+        self.assertEqual(paper.date, "2024.05")
+        self.assertEqual(paper.tag, "ACM")
+        self.assertEqual(list(errors), ["10.1145/missing1"])
+        self.assertIn("404", str(errors["10.1145/missing1"]))
+
+    def test_concurrent_requests_for_one_doi_are_coalesced(self) -> None:
+        urls = ["10.1145/42", "https://doi.org/10.1145/42", "https://dl.acm.org/doi/pdf/10.1145/42"]
+        (papers, errors), fetcher = self._run(urls, rate=100)
+
+        self.assertEqual(len(papers), 3)
+        self.assertEqual(errors, {})
+        self.assertEqual(self.server.hits, {"10.1145/42": 1})
+        self.assertEqual(fetcher.requests_sent, 1)
+
+    def test_concurrency_is_bounded(self) -> None:
+        urls = [f"10.1145/{n}" for n in range(8)]
+        (papers, _), _ = self._run(urls, concurrency=3, rate=1000)
+
+        self.assertEqual(len(papers), 8)
+        self.assertLessEqual(self.server.max_active, 3)
+        self.assertGreater(self.server.max_active, 1)
+
+    def test_rate_limit_headers_lower_the_rate(self) -> None:
+        self.server.rate_headers = {"X-Rate-Limit-Limit": "20", "X-Rate-Limit-Interval": "1s"}
+        self.server.delay = 0
+        urls = [f"10.1145/{n}" for n in range(6)]
+
+        start = time.monotonic()
+        _, fetcher = self._run(urls, concurrency=1, rate=1000)
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(fetcher.bucket.rate, 20)
+        # One banked token, then the remaining requests at 20 per second.
+        self.assertGreaterEqual(elapsed, 4 / 20)
+
+    def test_cached_responses_take_no_token(self) -> None:
+        urls = [f"10.1145/{n}" for n in range(3)]
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ResponseCache(Path(tmp))
+            (papers, _), fetcher = self._run(urls, rate=100, cache=cache)
+            self.assertEqual((len(papers), fetcher.requests_sent), (3, 3))
+
+            # One token, then one every 100 s: only cache hits can finish quickly.
+            start = time.monotonic()
+            (papers, errors), fetcher = self._run(urls, concurrency=1, rate=0.01, cache=cache)
+
+        self.assertEqual((len(papers), errors, fetcher.requests_sent), (3, {}, 0))
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(sum(self.server.hits.values()), 3)
+
+    def test_throttled_request_is_retried(self) -> None:
+        self.server.throttle_once = {"10.1145/7"}
+        (papers, errors), fetcher = self._run(["10.1145/7"], rate=100)
+
+        self.assertIn("10.1145/7", papers)
+        self.assertEqual(errors, {})
+        self.assertEqual(fetcher.requests_sent, 2)
+
+
+class TestRateLimitHelpers(unittest.TestCase):
+    def test_parse_rate_limit(self) -> None:
+        self.assertEqual(parse_rate_limit({"X-Rate-Limit-Limit": "50", "X-Rate-Limit-Interval": "1s"}), (50, 1.0))
+        self.assertEqual(parse_rate_limit({"X-Rate-Limit-Limit": "10", "X-Rate-Limit-Interval": "2m"}), (10, 120.0))
+        self.assertIsNone(parse_rate_limit({"X-Rate-Limit-Limit": "x", "X-Rate-Limit-Interval": "1s"}))
+        self.assertIsNone(parse_rate_limit({}))
+
+    def test_token_bucket_spaces_acquisitions(self) -> None:
+        async def main():
+            bucket = TokenBucket(rate=50, capacity=1)
+            start = time.monotonic()
+            for _ in range(4):
+                await bucket.acquire()
+            return time.monotonic() - start
+
+        self.assertGreaterEqual(asyncio.run(main()), 3 / 50 - 0.005)
+
+
+if __name__ == "__main__":
+    unittest.main()
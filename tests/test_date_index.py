@@ -0,0 +1,62 @@
+import csv
+import tempfile
+import unittest
+from pathlib import Path
+
+from paper_cli.core.date_index import DateIndex
+from paper_cli.core.models import Paper
+from paper_cli.core.storage import PaperStorage
+
+
+DATES = ["2024.03", "", "2023.01", "2024.03", "2025.11", "n/a", "2023.12"]
+
+
+class TestDateIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = DateIndex.from_records({"Date": d} for d in DATES)
+
+    def test_range_bisects_packed_dates(self) -> None:
+        self.assertEqual(sorted(self.index.range(202312, 202403)), [0, 3, 6])
+        self.assertEqual(sorted(self.index.range(date_to=202301)), [2])
+        self.assertEqual(sorted(self.index.range(date_from=202401)), [0, 3, 4])
+
+    def test_recent_matches_stable_reverse_sort(self) -> None:
+        self.index.add_record({"Date": "2024.03"})
+        self.index.add_record({"Date": ""})
+        dates = DATES + ["2024.03", ""]
+        expected = sorted(range(len(dates)), key=lambda i: dates[i] if dates[i][:2] == "20" else "", reverse=True)
+        # sorted(reverse=True) is stable, so ties keep CSV order.
+        self.assertEqual(list(self.index.recent()), expected)
+
+
+class TestRecentSearch(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.csv_path = Path(self._tmp.name) / "papers.csv"
+        with self.csv_path.open("w", encoding="utf-8", newline="") as f:
+            w = csv.DictWriter(f, fieldnames=PaperStorage.FIELDNAMES, quoting=csv.QUOTE_ALL)
+            w.writeheader()
+            for i, date in enumerate(DATES):
+                w.writerow(Paper(title=f"P{i}", date=date, topic="HCI" if i % 2 else "LLM").to_csv_row())
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_recent_limit_and_count(self) -> None:
+        storage = PaperStorage(self.csv_path)
+        papers = storage.search(recent=True, limit=3)
+        self.assertEqual([p.title for p in papers], ["P4", "P0", "P3"])
+        self.assertEqual(storage.last_match_count, 7)
+
+        papers = storage.search(topic="llm", recent=True, date_from="2023.06")
+        self.assertEqual([p.title for p in papers], ["P4", "P0", "P6"])
+
+    def test_appended_row_joins_date_order(self) -> None:
+        storage = PaperStorage(self.csv_path)
+        storage.search(recent=True, limit=1)
+        storage.add_paper(Paper(title="New", date="2026.01", topic="LLM"))
+        self.assertEqual([p.title for p in storage.search(recent=True, limit=2)], ["New", "P4"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+import json
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+from paper_cli.core.fetchers.crossref import CrossRefFetcher
+from paper_cli.core.http_cache import OfflineCacheMiss, ResponseCache, cached_session
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.requests = []
+        self.etag = '"v1"'
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        server = self.server
+        server.requests.append((self.path, self.headers.get("If-None-Match")))
+        if self.headers.get("If-None-Match") == server.etag:
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path.startswith("/works/"):
+            message = {"title": ["Cached Paper"], "container-title": ["CHI"], "published": {"date-parts": [[2024, 3]]}}
+            body = json.dumps({"message": message}).encode()
+        else:
+            body = f"body of {self.path}".encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", server.etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(Path(self._tmp.name) / "http")
+        self.server = StubServer()
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self._tmp.cleanup()
+
+    def test_fresh_response_is_served_without_request(self) -> None:
+        session = cached_session(self.cache, ttl=60)
+        first = session.get(self.server.url("/a"))
+        second = session.get(self.server.url("/a"))
+
+        self.assertEqual(first.text, "body of /a")
+        self.assertEqual(second.text, "body of /a")
+        self.assertEqual(second.headers["X-Paper-Cache"], "hit")
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_throttle_runs_only_for_network_requests(self) -> None:
+        calls = []
+        session = cached_session(self.cache, ttl=60, throttle=lambda: calls.append(len(self.server.requests)))
+        for path in ["/a", "/a", "/b", "/a"]:
+            session.get(self.server.url(path))
+
+        self.assertEqual(calls, [0, 1])
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_stale_response_is_revalidated_with_etag(self) -> None:
+        session = cached_session(self.cache, ttl=0)
+        session.get(self.server.url("/a"))
+        stored_at = self.cache.get(self.server.url("/a")).stored_at
+        time.sleep(0.01)
+
+        response = session.get(self.server.url("/a"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, "body of /a")
+        self.assertEqual(self.server.requests, [("/a", None), ("/a", '"v1"')])
+        self.assertGreater(self.cache.get(self.server.url("/a")).stored_at, stored_at)
+
+    def test_stale_response_is_served_when_unreachable(self) -> None:
+        url = self.server.url("/a")
+        cached_session(self.cache, ttl=60).get(url)
+        self.server.shutdown()
+        self.server.server_close()
+
+        response = cached_session(self.cache, ttl=0).get(url, timeout=2)
+        self.assertEqual(response.text, "body of /a")
+
+    def test_offline_serves_cache_only(self) -> None:
+        cached_session(self.cache, ttl=60).get(self.server.url("/a"))
+        offline = cached_session(self.cache, ttl=0, offline=True)
+
+        self.assertEqual(offline.get(self.server.url("/a")).text, "body of /a")
+        with self.assertRaises(OfflineCacheMiss):
+            offline.get(self.server.url("/b"))
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_identical_bodies_are_stored_once(self) -> None:
+        self.cache.put("http://x/1", b"same")
+        self.cache.put("http://x/2", b"same")
+        self.assertEqual(self.cache.size(), 4)
+        self.assertEqual(len([p for p in (self.cache.directory / "objects").rglob("*") if p.is_file()]), 1)
+
+    def test_least_recently_used_entries_are_evicted(self) -> None:
+        self.cache.max_bytes = 30
+        self.cache.put("http://x/1", b"1" * 10)
+        time.sleep(0.01)
+        self.cache.put("http://x/2", b"2" * 10)
+        time.sleep(0.01)
+        self.cache.put("http://x/3", b"3" * 10)
+        time.sleep(0.01)
+        self.cache.get("http://x/1")
+        time.sleep(0.01)
+        self.cache.put("http://x/4", b"4" * 10)
+
+        self.assertIsNone(self.cache.get("http://x/2"))
+        for n in (1, 3, 4):
+            self.assertIsNotNone(self.cache.get(f"http://x/{n}"))
+        self.assertEqual(self.cache.size(), 30)
+
+    def test_crossref_fetcher_reuses_cached_response_offline(self) -> None:
+        fetcher = CrossRefFetcher(self.cache)
+        fetcher.CROSSREF_API = self.server.url("/works/")
+        paper = fetcher.fetch("10.1145/1234")
+
+        offline = CrossRefFetcher(self.cache, offline=True)
+        offline.CROSSREF_API = self.server.url("/works/")
+        self.assertEqual(offline.fetch("10.1145/1234"), paper)
+        self.assertEqual(paper.title, "Cached Paper")
+        self.assertEqual(len(self.server.requests), 1)
+
+        with self.assertRaises(requests.ConnectionError):
+            offline.fetch("10.1145/9999")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+import csv
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import typer
+
+from paper_cli.commands.import_cmd import import_papers
+from paper_cli.core.fetchers.arxiv import ArxivFetcher
+from paper_cli.core.fetchers.crossref import CrossRefFetcher
+from paper_cli.core.importer import ImportCheckpoint, Importer, ImportItem, read_import_file
+from paper_cli.core.models import Paper
+from paper_cli.core.storage import PaperStorage
+
+
+class FakeArxiv(ArxivFetcher):
+    def __init__(self, known, fail_on=None):
+        super().__init__()
+        self.known = known
+        self.fail_on = fail_on
+        self.calls = []
+
+    def fetch_many(self, urls, custom_tag=None):
+        urls = list(urls)
+        self.calls.append(urls)
+        if self.fail_on and self.fail_on in urls:
+            raise KeyboardInterrupt
+        papers = {u: Paper(title=f"arXiv {self._extract_id(u)}", link=f"http://arxiv.org/abs/{self._extract_id(u)}v1", tag=custom_tag or "arxiv") for u in urls if self._extract_id(u) in self.known}
+        return papers, [u for u in urls if u not in papers]
+
+
+class FakeCrossRef:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    async def fetch_many(self, urls, custom_tag=None):
+        papers = {u: Paper(title=f"DOI {u}", doi=u, link=f"https://doi.org/{u}") for u in urls if "404" not in u}
+        errors = {u: ValueError("CrossRef API error: 404") for u in urls if u not in papers}
+        return papers, errors
+
+    def close(self):
+        pass
+
+
+class FakeRegistry:
+    cache = None
+    offline = False
+
+    def __init__(self, arxiv):
+        self.arxiv = arxiv
+        self.crossref = CrossRefFetcher()
+
+    def get_fetcher(self, url):
+        for fetcher in (self.arxiv, self.crossref):
+            if fetcher.can_handle(url):
+                return fetcher
+        raise ValueError(f"Unsupported paper source: {url}")
+
+
+class TestImporter(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.repo = Path(self._tmp.name)
+        self.csv_path = self.repo / "papers.csv"
+        with self.csv_path.open("w", encoding="utf-8", newline="") as f:
+            w = csv.DictWriter(f, fieldnames=PaperStorage.FIELDNAMES, quoting=csv.QUOTE_ALL)
+            w.writeheader()
+            w.writerow(Paper(title="Existing", link="https://arxiv.org/abs/2401.00001", topic="HCI").to_csv_row())
+        self._patch = patch("paper_cli.core.importer.AsyncCrossRefFetcher", FakeCrossRef)
+        self._patch.start()
+
+    def tearDown(self) -> None:
+        self._patch.stop()
+        self._tmp.cleanup()
+
+    def _rows(self):
+        with self.csv_path.open("r", encoding="utf-8", newline="") as f:
+            return list(csv.DictReader(f))
+
+    def test_read_import_file(self) -> None:
+        path = self.repo / "links.txt"
+        path.write_text(
+            "# papers to add\n2401.00002\n\n10.1145/1 LLM  # keep\nhttps://x.org/a#frag Memory\n2401.00002 RAG\n",
+            encoding="utf-8",
+        )
+        self.assertEqual(
+            read_import_file(path, "HCI"),
+            [
+                ImportItem("2401.00002", "HCI"),
+                ImportItem("10.1145/1", "LLM"),
+                ImportItem("https://x.org/a#frag", "Memory"),
+            ],
+        )
+
+    def test_run_fetches_dedups_and_appends(self) -> None:
+        arxiv = FakeArxiv({"2401.00002", "2401.00003"})
+        items = [
+            ImportItem("2401.00001", "HCI"),  # already in papers.csv
+            ImportItem("2401.00002", "LLM"),
+            ImportItem("arxiv:2401.00002", "LLM"),  # same paper, second spelling
+            ImportItem("2401.00009", "LLM"),  # not on arXiv
+            ImportItem("10.1145/7", "HCI"),
+            ImportItem("10.1145/404", "HCI"),
+            ImportItem("https://example.com/paper", "HCI"),  # unsupported
+        ]
+        checkpoint = ImportCheckpoint(self.repo / "checkpoint.json")
+
+        stats = Importer(PaperStorage(self.csv_path), FakeRegistry(arxiv), checkpoint=checkpoint).run(items)
+
+        self.assertEqual((stats.added, stats.skipped, stats.failed, stats.rejected), (2, 2, 3, 2))
+        self.assertEqual(set(stats.errors), {"2401.00009", "10.1145/404", "https://example.com/paper"})
+        self.assertEqual(arxiv.calls, [["2401.00002", "arxiv:2401.00002", "2401.00009"]])
+        rows = self._rows()
+        self.assertEqual([(r["Title"], r["Topic"]) for r in rows[1:]], [("arXiv 2401.00002", "LLM"), ("DOI 10.1145/7", "HCI")])
+        self.assertEqual(
+            checkpoint.done,
+            {
+                "2401.00001": "skipped",
+                "2401.00002": "added",
+                "arxiv:2401.00002": "skipped",
+                "2401.00009": "rejected",  # unknown to arXiv: never retried
+                "10.1145/7": "added",
+                "https://example.com/paper": "rejected",  # malformed: never retried
+            },
+        )
+
+    def test_interrupted_run_resumes_after_last_chunk(self) -> None:
+        items = [ImportItem(f"2401.0001{n}", "HCI") for n in range(6)]
+        known = {item.link for item in items}
+        checkpoint = ImportCheckpoint.for_file(self.repo, self.repo / "links.txt")
+
+        importer = Importer(
+            PaperStorage(self.csv_path), FakeRegistry(FakeArxiv(known, fail_on="2401.00014")), batch_size=2, checkpoint=checkpoint
+        )
+        with self.assertRaises(KeyboardInterrupt):
+            importer.run(items)
+        self.assertEqual(len(self._rows()), 5)  # existing + 2 chunks
+
+        resumed = Importer(
+            PaperStorage(self.csv_path),
+            FakeRegistry(FakeArxiv(known)),
+            batch_size=2,
+            checkpoint=ImportCheckpoint.for_file(self.repo, self.repo / "links.txt").load(),
+        )
+        pending = resumed.pending(items)
+        self.assertEqual([item.link for item in pending], ["2401.00014", "2401.00015"])
+        stats = resumed.run(pending)
+
+        self.assertEqual(stats.added, 2)
+        self.assertEqual(len(self._rows()), 7)
+
+    def test_checkpoint_is_kept_until_the_readme_is_updated(self) -> None:
+        links = self.repo / "links.txt"
+        links.write_text("2401.00002\nhttps://example.com/paper\n", encoding="utf-8")
+        checkpoint = ImportCheckpoint.for_file(self.repo, links)
+        registry = FakeRegistry(FakeArxiv({"2401.00002"}))
+
+        def run() -> None:
+            import_papers(file=links, topic="HCI", no_git=True, repo_path=self.repo)
+
+        with patch("paper_cli.commands.import_cmd.FetcherRegistry.for_repo", return_value=registry):
+            with patch("paper_cli.commands.import_cmd.open_markdown", side_effect=OSError("disk full")):
+                with self.assertRaises(typer.Exit):
+                    run()
+            self.assertEqual(
+                checkpoint.load().done, {"2401.00002": "added", "https://example.com/paper": "rejected"}
+            )
+
+            run()  # nothing left to fetch: only the README update is redone
+
+        self.assertEqual(registry.arxiv.calls, [["2401.00002"]])
+        self.assertIn("arXiv 2401.00002", (self.repo / "README.md").read_text(encoding="utf-8"))
+        self.assertFalse(checkpoint.path.exists())
+
+    def test_blank_topic_is_rejected(self) -> None:
+        links = self.repo / "links.txt"
+        links.write_text("2401.00002\n", encoding="utf-8")
+        with patch("paper_cli.commands.import_cmd.print_error") as print_error:
+            with self.assertRaises(typer.Exit) as cm:
+                import_papers(file=links, topic="  ", no_git=True, repo_path=self.repo)
+
+        self.assertEqual(cm.exception.exit_code, 2)
+        print_error.assert_called_once_with("Topic cannot be empty")
+        self.assertEqual(len(self._rows()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
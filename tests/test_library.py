@@ -0,0 +1,78 @@
+import csv
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from paper_cli.commands.stats import show_stats
+from paper_cli.core.markdown import MarkdownGenerator
+from paper_cli.core.models import Paper
+from paper_cli.core.storage import PaperStorage
+
+
+class TestLibrarySession(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.repo = Path(self._tmp.name)
+        self.csv_path = self.repo / "papers.csv"
+        self.readme_path = self.repo / "README.md"
+        with self.csv_path.open("w", encoding="utf-8", newline="") as f:
+            w = csv.DictWriter(f, fieldnames=PaperStorage.FIELDNAMES, quoting=csv.QUOTE_ALL)
+            w.writeheader()
+            w.writerow(Paper(title="A", tag="vr, imu", date="2023.01", topic="HCI").to_csv_row())
+            w.writerow(Paper(title="B", tag="llm", date="2024.12", topic="LLM").to_csv_row())
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_stats_parses_csv_once(self) -> None:
+        real = PaperStorage._read_csv_table
+        calls = []
+
+        def _counting(storage):  # noqa: ANN001
+            calls.append(1)
+            return real(storage)
+
+        captured = {}
+
+        def _capture(total, topics, tags, date_range):  # noqa: ANN001
+            captured.update(total=total, topics=topics, tags=tags, date_range=date_range)
+
+        with patch.object(PaperStorage, "_read_csv_table", _counting):
+            with patch("paper_cli.commands.stats.display_stats", side_effect=_capture):
+                show_stats(repo_path=self.repo)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(captured["total"], 2)
+        self.assertEqual(captured["topics"], {"HCI": 1, "LLM": 1})
+        self.assertEqual(captured["tags"], {"vr": 1, "imu": 1, "llm": 1})
+        self.assertEqual(captured["date_range"], ("2023.01", "2024.12"))
+
+    def test_markdown_from_library_matches_csv_rendering(self) -> None:
+        library = PaperStorage(self.csv_path).library()
+        from_csv = MarkdownGenerator(self.csv_path, self.readme_path).generate_tables_by_topic()
+        from_library = MarkdownGenerator(self.csv_path, self.readme_path, library=library).generate_tables_by_topic()
+        self.assertEqual(from_library, from_csv)
+
+    def test_add_paper_extends_shared_snapshot(self) -> None:
+        storage = PaperStorage(self.csv_path)
+        library = storage.library()
+        self.assertFalse(library.exists("https://example.com/c"))
+
+        with patch.object(PaperStorage, "_read_csv_table", side_effect=AssertionError("reparsed")):
+            storage.add_paper(Paper(title="C", link="https://example.com/c", topic="HCI"))
+            self.assertIs(storage.library(), library)
+            self.assertTrue(library.exists("https://example.com/c"))
+            self.assertEqual(library.topics(), {"HCI": 2, "LLM": 1})
+
+    def test_snapshot_reloads_after_external_edit(self) -> None:
+        storage = PaperStorage(self.csv_path)
+        self.assertEqual(storage.count(), 2)
+        with self.csv_path.open("w", encoding="utf-8", newline="") as f:
+            w = csv.DictWriter(f, fieldnames=PaperStorage.FIELDNAMES, quoting=csv.QUOTE_ALL)
+            w.writeheader()
+        self.assertEqual(storage.count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
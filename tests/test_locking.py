@@ -0,0 +1,72 @@
+import csv
+import multiprocessing
+import tempfile
+import unittest
+from pathlib import Path
+
+from paper_cli.core.locking import CoalescingRebuild, atomic_write_text
+from paper_cli.core.markdown import MarkdownGenerator
+from paper_cli.core.models import Paper
+from paper_cli.core.storage import PaperStorage
+
+
+def _add_many(csv_path: str, worker: int, count: int) -> None:
+    storage = PaperStorage(Path(csv_path), fsync=False)
+    for i in range(count):
+        storage.add_paper(Paper(title=f"W{worker}-{i}", link=f"https://example.com/{worker}/{i}", topic="HCI"))
+
+
+class TestLocking(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.repo = Path(self._tmp.name)
+        self.csv_path = self.repo / "papers.csv"
+        self.readme_path = self.repo / "README.md"
+        with self.csv_path.open("w", encoding="utf-8", newline="") as f:
+            w = csv.DictWriter(f, fieldnames=PaperStorage.FIELDNAMES, quoting=csv.QUOTE_ALL)
+            w.writeheader()
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_atomic_write_replaces_content(self) -> None:
+        target = self.repo / "file.txt"
+        atomic_write_text(target, "old\n")
+        atomic_write_text(target, "new\n")
+        self.assertEqual(target.read_text(encoding="utf-8"), "new\n")
+        self.assertEqual([p.name for p in self.repo.iterdir() if p.name.endswith(".tmp")], [])
+
+    def test_covered_ticket_skips_rebuild(self) -> None:
+        rebuild = CoalescingRebuild(self.repo / "README.lock")
+        calls = []
+        first = rebuild.request()
+        second = rebuild.request()
+
+        self.assertTrue(rebuild.run(lambda: calls.append(1), first))
+        self.assertFalse(rebuild.run(lambda: calls.append(2), second))
+        # An unticketed run always rebuilds.
+        self.assertTrue(rebuild.run(lambda: calls.append(3)))
+        self.assertEqual(calls, [1, 3])
+
+    def test_coalesced_readme_update(self) -> None:
+        PaperStorage(self.csv_path).add_paper(Paper(title="A", topic="HCI"))
+        md_gen = MarkdownGenerator(self.csv_path, self.readme_path)
+        self.assertTrue(md_gen.update_readme(coalesce=True))
+        self.assertIn("<!-- TABLE_START: HCI -->", self.readme_path.read_text(encoding="utf-8"))
+        self.assertTrue(md_gen.update_readme())
+
+    def test_concurrent_adds_keep_every_row(self) -> None:
+        ctx = multiprocessing.get_context("spawn")
+        workers = [ctx.Process(target=_add_many, args=(str(self.csv_path), w, 15)) for w in range(4)]
+        for p in workers:
+            p.start()
+        for p in workers:
+            p.join(60)
+            self.assertEqual(p.exitcode, 0)
+
+        titles = sorted(p.title for p in PaperStorage(self.csv_path, use_cache=False).load_all())
+        self.assertEqual(titles, sorted(f"W{w}-{i}" for w in range(4) for i in range(15)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,12 @@
 import csv
+import shutil
 import tempfile
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from unittest.mock import patch
 
-from paper_cli.core.markdown import MarkdownGenerator
+from paper_cli.core.markdown import MarkdownGenerator, split_readme
 from paper_cli.core.models import Paper
 from paper_cli.core.storage import PaperStorage
 
@@ -90,6 +93,115 @@ class TestMarkdownGenerator(unittest.TestCase):
         self.assertIn("x\\|y", table)
         self.assertIn("line1<br>line2", table)
 
+    def test_update_readme_rerenders_only_changed_topics(self) -> None:
+        papers = [Paper(title="a1", topic="A"), Paper(title="b1", topic="B")]
+        self._write_rows(papers)
+        MarkdownGenerator(self.csv_path, self.readme_path).update_readme()
+
+        self._write_rows(papers + [Paper(title="b2", topic="B")])
+        md = MarkdownGenerator(self.csv_path, self.readme_path)
+        md.update_readme()
+        content = self.readme_path.read_text(encoding="utf-8")
+
+        self.assertEqual(md.last_rendered, ["B"])
+        self.assertIn("b2", content)
+        self.assertIn("a1", content)
+
+        md.update_readme()
+        self.assertEqual(md.last_rendered, [])
+        self.assertEqual(self.readme_path.read_text(encoding="utf-8"), content)
+
+    def test_update_readme_rerenders_hand_edited_block(self) -> None:
+        self._write_rows([Paper(title="a1", topic="A")])
+        MarkdownGenerator(self.csv_path, self.readme_path).update_readme()
+        rendered = self.readme_path.read_text(encoding="utf-8")
+        self.readme_path.write_text(rendered.replace("a1", "edited"), encoding="utf-8")
+
+        md = MarkdownGenerator(self.csv_path, self.readme_path)
+        md.update_readme()
+
+        self.assertEqual(md.last_rendered, ["A"])
+        self.assertEqual(self.readme_path.read_text(encoding="utf-8"), rendered)
+
+    def test_split_readme_separates_managed_blocks(self) -> None:
+        content = (
+            "# Intro\n<!-- TABLE_START: Open -->\n"
+            "# A\n<!-- TABLE_START: A -->\nrows\n<!-- TABLE_END: A -->\n"
+            "<!-- TABLE_START: B -->\n<!-- TABLE_END: B -->"
+        )
+        segments = split_readme(content)
+
+        self.assertEqual("".join(text for _, text in segments), content)
+        self.assertEqual(
+            [name for name, _ in segments],
+            [None, "A", None, "B"],
+        )
+        self.assertEqual(segments[0][1], "# Intro\n<!-- TABLE_START: Open -->\n# A\n")
+
+    def test_update_readme_keeps_text_around_blocks(self) -> None:
+        self._write_rows([Paper(title="a1", topic="A"), Paper(title="c1", topic="C")])
+        self.readme_path.write_text(
+            "Intro \\1\n\n# A\n<!-- TABLE_START: A -->\nold\n<!-- TABLE_END: A -->\n\n"
+            "# B\n<!-- TABLE_START: B -->\nold\n<!-- TABLE_END: B -->\n\nFooter\n",
+            encoding="utf-8",
+        )
+
+        MarkdownGenerator(self.csv_path, self.readme_path).update_readme()
+        content = self.readme_path.read_text(encoding="utf-8")
+
+        self.assertTrue(content.startswith("Intro \\1\n\n# A\n<!-- TABLE_START: A -->\n| Source |"))
+        self.assertIn("<!-- TABLE_END: A -->\n\n\nFooter\n\n# C\n<!-- TABLE_START: C -->", content)
+        self.assertNotIn("# B", content)
+
+    def test_rendered_rows_are_reused_across_runs(self) -> None:
+        papers = [Paper(title="a1", topic="A", date="2024.01"), Paper(title="a2", topic="A", date="2023.05")]
+        self._write_rows(papers)
+        expected = MarkdownGenerator(self.csv_path, self.readme_path).generate_tables_by_topic()
+
+        self._write_rows(papers + [Paper(title="a3", topic="A", date="2025.02")])
+        md = MarkdownGenerator(self.csv_path, self.readme_path)
+        with patch.object(md, "_render_rows", wraps=md._render_rows) as render_rows:
+            tables = md.generate_tables_by_topic()
+
+        self.assertEqual(len(render_rows.call_args.args[0]), 1)
+        self.assertTrue(tables["A"].endswith(expected["A"].split("|---|---|---|---|---|---|---|\n")[1]))
+        self.assertIn("a3", tables["A"].splitlines()[2])
+
+    def test_parallel_rendering_matches_serial(self) -> None:
+        self._write_rows(
+            [Paper(title=f"p{i}", topic="AB"[i % 2], date=f"2024.{i % 12 + 1:02d}") for i in range(9)]
+        )
+        serial = MarkdownGenerator(self.csv_path, self.readme_path).preview_topic()
+        shutil.rmtree(self.repo / ".paper-cache")
+
+        md = MarkdownGenerator(self.csv_path, self.readme_path, jobs=2)
+        with patch("paper_cli.core.markdown._PARALLEL_MIN_ROWS", 0), patch(
+            "paper_cli.core.markdown._PARALLEL_CHUNK_ROWS", 2
+        ), patch("paper_cli.core.markdown.ProcessPoolExecutor", wraps=ProcessPoolExecutor) as pool:
+            parallel = md.preview_topic()
+
+        pool.assert_called_once()
+        self.assertEqual(parallel, serial)
+
+    def test_get_diff_counts_row_changes_and_is_reused_by_update(self) -> None:
+        papers = [Paper(title="a1", topic="A", link="https://arxiv.org/abs/2401.00001v1"), Paper(title="a2", topic="A")]
+        self._write_rows(papers)
+        MarkdownGenerator(self.csv_path, self.readme_path).update_readme()
+
+        papers[0].link = "https://arxiv.org/abs/2401.00001v2"
+        self._write_rows(papers + [Paper(title="a3", topic="A")])
+        md = MarkdownGenerator(self.csv_path, self.readme_path)
+        diff = md.get_diff()
+
+        self.assertEqual(diff, "Changes:\n  A: +1 added, ~1 modified")
+        with patch.object(md, "_render_tables", wraps=md._render_tables) as render_tables:
+            md.update_readme()
+
+        render_tables.assert_called_once_with({})
+        self.assertEqual(md.last_rendered, ["A"])
+        self.assertIn("2401.00001v2", self.readme_path.read_text(encoding="utf-8"))
+        self.assertEqual(MarkdownGenerator(self.csv_path, self.readme_path).get_diff(), "No changes detected.")
+
     def test_format_source_does_not_duplicate_journal_ref(self) -> None:
         md = MarkdownGenerator(self.csv_path, self.readme_path)
         source = md._format_source_column(
@@ -0,0 +1,56 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from paper_cli.core.models import CSV_COLUMNS, Paper
+from paper_cli.core.storage import PaperStorage
+
+
+class TestTrustedConstruction(unittest.TestCase):
+    def setUp(self) -> None:
+        self.row = Paper(title="T", authors="A. B", tag="llm", date="2024.01", topic="HCI").to_csv_row()
+
+    def test_trusted_paths_match_validated_model(self) -> None:
+        validated = Paper.from_csv_row(self.row)
+        from_row = Paper.from_trusted_row(self.row)
+        from_values = Paper.from_trusted_values([self.row[c] for c in CSV_COLUMNS])
+
+        self.assertEqual(from_row, validated)
+        self.assertEqual(from_values, validated)
+        self.assertEqual(from_values.model_dump(), validated.model_dump())
+        self.assertEqual(from_values.to_csv_row(), self.row)
+
+    def test_trusted_paths_match_model_validate_on_stored_rows(self) -> None:
+        papers = [
+            Paper(title='Quoted "title", with comma', authors="A. B, C. D", tag="llm, vr", topic="HCI"),
+            Paper(title="Multi\nline", link="https://arxiv.org/abs/2401.00001", date="2024.01", topic="LLM"),
+            Paper(),
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            storage = PaperStorage(Path(tmp) / "papers.csv")
+            storage.add_papers(papers)
+            records = list(PaperStorage(Path(tmp) / "papers.csv", use_cache=False).library().records())
+
+        self.assertEqual(len(records), len(papers))
+        for record in records:
+            fields = {field: record[column] for column, field in zip(CSV_COLUMNS, Paper.model_fields)}
+            validated = Paper.model_validate(fields)
+            values = [record[column] for column in CSV_COLUMNS]
+            for trusted in (Paper.from_trusted_row(record), Paper.from_trusted_values(values)):
+                self.assertEqual(trusted, validated)
+                self.assertEqual(trusted.model_fields_set, validated.model_fields_set)
+                self.assertEqual(trusted.model_dump(), validated.model_dump())
+
+    def test_csv_columns_follow_the_model_fields(self) -> None:
+        self.assertEqual(PaperStorage.FIELDNAMES, list(CSV_COLUMNS))
+        self.assertEqual(len(CSV_COLUMNS), len(Paper.model_fields))
+
+    def test_trusted_row_fills_missing_columns(self) -> None:
+        paper = Paper.from_trusted_row({"Title": "Only", "Tag": None})
+        self.assertEqual((paper.title, paper.tag, paper.topic), ("Only", "", ""))
+        paper.topic = "HCI"
+        self.assertEqual(paper.to_csv_row()["Topic"], "HCI")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import pickle
+import unittest
+
+import pandas as pd
+
+from paper_cli.core.models import Paper
+from paper_cli.core.storage import PaperStorage
+from paper_cli.core.table import PaperTable
+
+
+def _frame(papers):
+    return pd.DataFrame([p.to_csv_row() for p in papers], columns=PaperStorage.FIELDNAMES, dtype=str)
+
+
+class TestPaperTable(unittest.TestCase):
+    def setUp(self) -> None:
+        self.papers = [
+            Paper(title="A", tag="vr, imu", date="2023.01", topic="HCI", source="CHI 2023"),
+            Paper(title="B", tag="llm", date="bad", topic="LLM", source="CHI 2023"),
+            Paper(title="C", tag="vr, imu", date="2024.12", topic="HCI", source="arXiv(v1) 2024"),
+        ]
+        self.table = PaperTable.from_dataframe(_frame(self.papers))
+
+    def test_round_trips_rows(self) -> None:
+        self.assertEqual(len(self.table), 3)
+        self.assertEqual(self.table.value(2, "Title"), "C")
+        self.assertTrue(self.table.to_dataframe().equals(_frame(self.papers)))
+
+    def test_categorical_columns_and_dates(self) -> None:
+        self.assertEqual(self.table.value_counts("Topic"), {"HCI": 2, "LLM": 1})
+        self.assertEqual(self.table.column("Source"), ["CHI 2023", "CHI 2023", "arXiv(v1) 2024"])
+        self.assertEqual(list(self.table.dates), [202301, 0, 202412])
+
+    def test_append_and_pickle(self) -> None:
+        self.table.append(Paper(title="D", tag="imu, new", date="2025.02", topic="LLM").to_csv_row())
+        restored = pickle.loads(pickle.dumps(self.table))
+        restored.append(Paper(title="E", tag="new", topic="Other").to_csv_row())
+
+        self.assertEqual(restored.value(3, "Topic"), "LLM")
+        self.assertEqual(restored.value_counts("Topic"), {"HCI": 2, "LLM": 2, "Other": 1})
+        self.assertEqual(restored.value(4, "Tag"), "new")
+        self.assertEqual(list(restored.dates)[3:], [202502, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import csv
+import tempfile
+import unittest
+from pathlib import Path
+
+from paper_cli.core.models import Paper
+from paper_cli.core.planner import QueryPlan
+from paper_cli.core.storage import PaperStorage
+
+
+class TestQueryPlan(unittest.TestCase):
+    def test_intersects_smallest_first(self) -> None:
+        plan = QueryPlan("csv", 10)
+        rows = plan.intersect([("keyword", "trigram", {1, 2, 3, 4}), ("topic", "topics", [2, 4]), ("date", "dates", [4, 5, 2, 9])])
+        self.assertEqual(rows, [2, 4])
+        self.assertEqual([(s.filter, s.candidates, s.remaining) for s in plan.steps], [("topic", 2, 2), ("keyword", 4, 2), ("date", 4, 2)])
+        self.assertIsNone(QueryPlan("csv", 10).intersect([]))
+
+
+class TestSearchPlan(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.csv_path = Path(self._tmp.name) / "papers.csv"
+        with self.csv_path.open("w", encoding="utf-8", newline="") as f:
+            w = csv.DictWriter(f, fieldnames=PaperStorage.FIELDNAMES, quoting=csv.QUOTE_ALL)
+            w.writeheader()
+            for i in range(20):
+                w.writerow(
+                    Paper(
+                        title=f"Paper {i} about {'memory' if i % 2 else 'agents'}",
+                        tag="llm" if i % 3 == 0 else "vr",
+                        date=f"2024.{i % 12 + 1:02d}",
+                        topic="Memory" if i < 5 else "Other",
+                    ).to_csv_row()
+                )
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_plan_records_index_steps(self) -> None:
+        storage = PaperStorage(self.csv_path)
+        papers = storage.search(query="memory", topic="memory", date_from="2024.02")
+        self.assertEqual([p.title for p in papers], ["Paper 1 about memory", "Paper 3 about memory"])
+
+        plan = storage.last_plan
+        self.assertEqual([(s.filter, s.index) for s in plan.steps], [("topic", "topics"), ("keyword", "search"), ("date", "dates")])
+        self.assertEqual(plan.steps[0].candidates, 5)
+        self.assertEqual((plan.verified, plan.matched), (2, 2))
+        self.assertIn("topic via topics index: 5 candidates -> 5 remaining", "\n".join(plan.describe()))
+
+    def test_short_needles_are_scanned(self) -> None:
+        storage = PaperStorage(self.csv_path)
+        papers = storage.search(tag="vr", topic="other")
+        self.assertEqual(len(papers), 15 - 5)
+        self.assertEqual(storage.last_plan.scanned_filters, ["tag"])
+
+    def test_sqlite_plan_has_sqlite_details(self) -> None:
+        storage = PaperStorage(self.csv_path, backend="sqlite")
+        storage.search(topic="memory")
+        self.assertEqual(storage.last_plan.backend, "sqlite")
+        self.assertTrue(any("papers_topic" in note for note in storage.last_plan.notes))
+
+
+if __name__ == "__main__":
+    unittest.main()
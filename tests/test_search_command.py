@@ -40,6 +40,31 @@ class TestSearchCommand(unittest.TestCase):
         self.assertEqual(captured["titles"], ["new", "old", "no date"])
         self.assertIn("sort=recent", captured["title"])
 
+    def test_search_explain_prints_plan(self) -> None:
+        with patch("paper_cli.commands.search.display_papers_table"):
+            with patch("paper_cli.commands.search.print_info") as print_info:
+                search_papers(topic="HCI", date_from="2024.01", explain=True, repo_path=self.repo)
+
+        lines = [c.args[0] for c in print_info.call_args_list]
+        self.assertIn("1. date via dates index: 1 candidates -> 1 remaining", lines)
+        self.assertTrue(any(line.startswith("verified 1 rows, 1 matched") for line in lines))
+
+    def test_search_tag_matches_substrings_unless_exact(self) -> None:
+        storage = PaperStorage(self.csv_path)
+        storage.add_papers([Paper(title="a", tag="agent", topic="HCI"), Paper(title="b", tag="multi-agent", topic="HCI")])
+        results = {}
+
+        def _capture(papers, title, show_all):  # noqa: ANN001
+            results[title] = [p.title for p in papers]
+
+        with patch("paper_cli.commands.search.display_papers_table", side_effect=_capture):
+            search_papers(tag="agent", limit=0, repo_path=self.repo)
+            search_papers(tag="agent", tag_match="exact", limit=0, repo_path=self.repo)
+
+        self.assertEqual(list(results.values()), [["a", "b"], ["a"]])
+        self.assertIn("tag~'agent'", list(results)[0])
+        self.assertIn("tag='agent'", list(results)[1])
+
     def test_search_rejects_invalid_from_date(self) -> None:
         with patch("paper_cli.commands.search.print_error") as print_error:
             with self.assertRaises(typer.Exit) as cm:
@@ -0,0 +1,102 @@
+import csv
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+
+from paper_cli.core.models import Paper
+from paper_cli.core.search_index import SearchIndex
+from paper_cli.core.storage import PaperStorage
+from paper_cli.core.trigram import TrigramIndex
+
+
+class TestRankedSearch(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.csv_path = Path(self._tmp.name) / "papers.csv"
+        self.papers = [
+            Paper(title="Memory for agents", tag="agent", authors="Alice Zhang", topic="Memory"),
+            Paper(title="MLLM grounding", tag="vision", authors="Bob Li", topic="MLLM"),
+            Paper(title="LLM memory LLM agents", tag="llm, memory", authors="Carol Wu", topic="Memory"),
+            Paper(title="Typing in VR", tag="c++ toolkit", authors="Dan Müller", subjects="cs.HC", topic="HCI"),
+        ]
+        with self.csv_path.open("w", encoding="utf-8", newline="") as f:
+            w = csv.DictWriter(f, fieldnames=PaperStorage.FIELDNAMES, quoting=csv.QUOTE_ALL)
+            w.writeheader()
+            for p in self.papers:
+                w.writerow(p.to_csv_row())
+        self.storage = PaperStorage(self.csv_path)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_keyword_results_match_substring_semantics(self) -> None:
+        for query in ["llm", "LLM", "mem", "ller", "c++", "++", "cs.h", "agents memory", "x"]:
+            expected = {p.title for p in self.papers if p.matches_query(query)}
+            got = {p.title for p in self.storage.search(query=query)}
+            self.assertEqual(got, expected, query)
+
+    def test_tag_and_author_filters_match_substring_semantics(self) -> None:
+        cases = [("tag", "vis"), ("tag", "LLM"), ("tag", "c+"), ("author", "müller"), ("author", "ZHANG"), ("author", "li")]
+        for kind, needle in cases:
+            if kind == "tag":
+                expected = {p.title for p in self.papers if needle.lower() in p.tag.lower()}
+            else:
+                expected = {p.title for p in self.papers if needle.lower() in p.authors.lower()}
+            got = {p.title for p in self.storage.search(**{kind: needle})}
+            self.assertEqual(got, expected, (kind, needle))
+
+    def test_prefix_author_filter_matches_normalized_name_prefixes(self) -> None:
+        cases = [
+            ("muller", {"Typing in VR"}),
+            ("Müller", {"Typing in VR"}),
+            ("ZHANG", {"Memory for agents"}),
+            ("alice z", {"Memory for agents"}),
+            ("li", {"MLLM grounding"}),
+            ("lice", set()),
+        ]
+        for needle, expected in cases:
+            got = {p.title for p in self.storage.search(author=needle, author_match="prefix")}
+            self.assertEqual(got, expected, needle)
+
+    def test_trigram_candidates_narrow_before_verification(self) -> None:
+        index = self.storage.index("trigram")
+        self.assertEqual(index.candidates("grounding"), {1})
+        self.assertEqual(index.candidates("zzz"), set())
+        self.assertIsNone(index.candidates("ll"))
+
+    def test_indexes_match_a_scan_after_pickling_and_appends(self) -> None:
+        records = [{"Title": f"Paper {i} on {'memory' if i % 3 else 'agents'} w{i % 7}x", "Tag": "llm"} for i in range(200)]
+        search = pickle.loads(pickle.dumps(SearchIndex.from_records(records[:150])))
+        trigram = pickle.loads(pickle.dumps(TrigramIndex.from_records(records[:150])))
+        self.assertTrue(trigram.bitmaps and trigram.postings)  # both posting layouts in use
+        for record in records[150:]:
+            search.add_record(record)
+            trigram.add_record(record)
+
+        for token in ["mem", "w3", "3x", "x", "zzz", "paper"]:
+            expected = {i for i, term in enumerate(search.vocabulary) if token in term}
+            self.assertEqual(set(search.expand(token)[token]), expected, token)
+        for needle in ["memory", "w3x", "er 1", "ents w6", "zzz"]:
+            expected = {i for i, r in enumerate(records) if needle in r["Title"].lower()}
+            self.assertTrue(expected <= trigram.candidates(needle), needle)
+            self.assertTrue(expected <= search.candidates(search.expand(needle)), needle)
+
+    def test_keyword_results_are_ranked_by_bm25(self) -> None:
+        titles = [p.title for p in self.storage.search(query="llm")]
+        self.assertEqual(titles[0], "LLM memory LLM agents")
+        self.assertEqual(set(titles), {"LLM memory LLM agents", "MLLM grounding"})
+
+    def test_limit_is_applied_as_top_k(self) -> None:
+        results = self.storage.search(query="memory", limit=1)
+        self.assertEqual([p.title for p in results], ["LLM memory LLM agents"])
+        self.assertEqual(self.storage.last_match_count, 2)
+
+    def test_index_is_extended_on_add(self) -> None:
+        self.storage.search(query="haptics")
+        self.storage.add_paper(Paper(title="Haptics glove", topic="HCI"))
+        self.assertEqual([p.title for p in self.storage.search(query="haptic")], ["Haptics glove"])
+
+
+if __name__ == "__main__":
+    unittest.main()
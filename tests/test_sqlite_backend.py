@@ -0,0 +1,101 @@
+import csv
+import tempfile
+import unittest
+from pathlib import Path
+
+from paper_cli.core.models import Paper
+from paper_cli.core.storage import PaperStorage, open_storage
+
+
+class TestSqliteBackend(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.repo = Path(self._tmp.name)
+        self.csv_path = self.repo / "papers.csv"
+        self._write_rows(
+            [
+                Paper(title="Memory agents", tag="agent, memory", authors="Alice Zhang", date="2024.02", topic="Memory"),
+                Paper(title="MLLM grounding", tag="vision", authors="Bob Li", date="2023.11", topic="MLLM"),
+                Paper(
+                    title="CAvatar",
+                    doi="10.1145/3631424",
+                    link="https://doi.org/10.1145/3631424",
+                    tag="memory",
+                    authors="Dan Müller",
+                    topic="HCI",
+                ),
+                Paper(title="A-MEM", link="http://arxiv.org/abs/2502.12110v1", date="2025.02", topic="Memory"),
+            ]
+        )
+        self.csv = PaperStorage(self.csv_path)
+        self.sql = PaperStorage(self.csv_path, backend="sqlite")
+
+    def tearDown(self) -> None:
+        if self.sql._mirror is not None:
+            self.sql._mirror.close()
+        self._tmp.cleanup()
+
+    def _write_rows(self, papers: list[Paper]) -> None:
+        with self.csv_path.open("w", encoding="utf-8", newline="") as f:
+            w = csv.DictWriter(f, fieldnames=PaperStorage.FIELDNAMES, quoting=csv.QUOTE_ALL)
+            w.writeheader()
+            for p in papers:
+                w.writerow(p.to_csv_row())
+
+    def test_read_paths_match_csv_backend(self) -> None:
+        self.assertEqual(self.sql.count(), self.csv.count())
+        self.assertEqual(self.sql.get_topics(), self.csv.get_topics())
+        self.assertEqual(self.sql.get_all_tags(), self.csv.get_all_tags())
+        self.assertEqual(self.sql.get_authors(), self.csv.get_authors())
+        self.assertEqual(self.sql.get_authors(prefix="li", limit=1), self.csv.get_authors(prefix="li", limit=1))
+
+        for link in ["10.1145/3631424", "https://arxiv.org/abs/2502.12110v2", "https://example.com/x"]:
+            self.assertEqual(self.sql.exists(link), self.csv.exists(link), link)
+
+        searches = [
+            {"query": "mem"},
+            {"query": "llm"},
+            {"tag": "memory"},
+            {"tag": "memory", "tag_match": "exact"},
+            {"tag": "agent|vision, MEMORY", "tag_match": "exact"},
+            {"tag": "mem"},
+            {"author": "müller"},
+            {"author": "li"},
+            {"author": "alice z", "author_match": "prefix"},
+            {"author": "muller", "author_match": "prefix"},
+            {"topic": "memory"},
+            {"date_from": "2024.01", "date_to": "2025.12"},
+            {"query": "memory", "topic": "Memory"},
+        ]
+        for kwargs in searches:
+            expected = {p.title for p in self.csv.search(**kwargs)}
+            got = {p.title for p in self.sql.search(**kwargs)}
+            self.assertEqual(got, expected, kwargs)
+
+    def test_mirror_resyncs_after_external_edit(self) -> None:
+        self.assertEqual(self.sql.count(), 4)
+        self._write_rows([Paper(title="Only one", topic="HCI")])
+        self.assertEqual(self.sql.count(), 1)
+        self.assertEqual(self.sql.get_topics(), {"HCI": 1})
+
+    def test_add_paper_updates_mirror(self) -> None:
+        self.assertFalse(self.sql.exists("10.1145/9999999"))
+        self.sql.add_paper(Paper(title="New", doi="10.1145/9999999", tag="vr", topic="HCI"))
+        self.assertTrue(self.sql.exists("10.1145/9999999"))
+        self.assertEqual(self.sql.count(), 5)
+        self.assertEqual([p.title for p in self.sql.search(tag="vr")], ["New"])
+
+    def test_open_storage_reads_repo_config(self) -> None:
+        (self.repo / ".paper-cli.toml").write_text('storage_backend = "sqlite"\n', encoding="utf-8")
+        storage = open_storage(self.repo)
+        self.assertEqual(storage.backend, "sqlite")
+        self.assertEqual(storage.count(), 4)
+        storage._mirror.close()
+
+    def test_unknown_backend_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            PaperStorage(self.csv_path, backend="postgres")
+
+
+if __name__ == "__main__":
+    unittest.main()
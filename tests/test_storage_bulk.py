@@ -0,0 +1,86 @@
+import csv
+import tempfile
+import unittest
+from pathlib import Path
+
+from paper_cli.core.journal import AppendJournal
+from paper_cli.core.models import Paper
+from paper_cli.core.storage import PaperStorage
+
+
+class TestBulkAdd(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.csv_path = Path(self._tmp.name) / "papers.csv"
+        with self.csv_path.open("w", encoding="utf-8", newline="") as f:
+            w = csv.DictWriter(f, fieldnames=PaperStorage.FIELDNAMES, quoting=csv.QUOTE_ALL)
+            w.writeheader()
+            w.writerow(Paper(title="Existing", doi="10.1145/1", link="https://doi.org/10.1145/1", topic="HCI").to_csv_row())
+        self.storage = PaperStorage(self.csv_path)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_add_papers_dedups_against_library_and_batch(self) -> None:
+        added, skipped = self.storage.add_papers(
+            [
+                Paper(title="Dup of existing", link="https://dl.acm.org/doi/10.1145/1", topic="HCI"),
+                Paper(title="New", link="https://arxiv.org/abs/2401.00001v1", topic="LLM"),
+                Paper(title="New again", link="2401.00001", topic="LLM"),
+                Paper(title="Other", doi="10.1145/2", topic="HCI"),
+            ]
+        )
+
+        self.assertEqual([p.title for p in added], ["New", "Other"])
+        self.assertEqual([p.title for p in skipped], ["Dup of existing", "New again"])
+        self.assertEqual([p.title for p in PaperStorage(self.csv_path).load_all()], ["Existing", "New", "Other"])
+        self.assertFalse(AppendJournal(self.csv_path).pending())
+
+    def test_add_papers_can_keep_duplicates(self) -> None:
+        added, skipped = self.storage.add_papers([Paper(title="Again", doi="10.1145/1", topic="HCI")], skip_duplicates=False)
+        self.assertEqual((len(added), len(skipped)), (1, 0))
+        self.assertEqual(self.storage.count(), 2)
+
+    def test_torn_append_is_replayed_on_next_load(self) -> None:
+        journal = AppendJournal(self.csv_path, fsync=False)
+        data = self.storage._encode_rows([Paper(title="Torn", topic="HCI")], header=False)
+        offset = self.csv_path.stat().st_size
+        journal._begin(offset, data)
+        with self.csv_path.open("ab") as f:
+            f.write(data[: len(data) // 2])  # process "dies" mid-row
+
+        titles = [p.title for p in PaperStorage(self.csv_path).load_all()]
+        self.assertEqual(titles, ["Existing", "Torn"])
+        self.assertFalse(journal.pending())
+
+    def test_incomplete_journal_is_discarded(self) -> None:
+        journal = AppendJournal(self.csv_path, fsync=False)
+        journal.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        journal.journal_path.write_bytes(b"PCJ1\x00")  # crashed while writing the journal
+
+        before = self.csv_path.read_bytes()
+        self.assertEqual(self.storage.recover(), "discarded")
+        self.assertEqual(self.csv_path.read_bytes(), before)
+        self.assertFalse(journal.pending())
+
+    def test_stale_journal_does_not_undo_external_edits(self) -> None:
+        journal = AppendJournal(self.csv_path, fsync=False)
+        data = self.storage._encode_rows([Paper(title="Lost", topic="HCI")], header=False)
+        journal._begin(self.csv_path.stat().st_size - 10, data)
+        with self.csv_path.open("ab") as f:  # e.g. `git pull` rewrote the file since
+            f.write(self.storage._encode_rows([Paper(title="Pulled", topic="HCI")], header=False))
+
+        before = self.csv_path.read_bytes()
+        self.assertEqual(self.storage.recover(), "discarded")
+        self.assertEqual(self.csv_path.read_bytes(), before)
+        self.assertFalse(journal.pending())
+
+    def test_append_after_unterminated_last_line(self) -> None:
+        raw = self.csv_path.read_bytes().rstrip(b"\r\n")
+        self.csv_path.write_bytes(raw)
+        PaperStorage(self.csv_path).add_paper(Paper(title="Next", topic="HCI"))
+        self.assertEqual([p.title for p in PaperStorage(self.csv_path).load_all()], ["Existing", "Next"])
+
+
+if __name__ == "__main__":
+    unittest.main()
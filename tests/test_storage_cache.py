@@ -0,0 +1,127 @@
+import csv
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from paper_cli.core import cache
+from paper_cli.core.models import Paper
+from paper_cli.core.search_index import SearchIndex
+from paper_cli.core.storage import PaperStorage
+
+
+class TestStorageSidecarCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.csv_path = Path(self._tmp.name) / "papers.csv"
+        # Keep the signing key out of the real home directory.
+        self.key_path = Path(self._tmp.name) / "keys" / "cache.key"
+        self._env = patch.dict(os.environ, {cache.KEY_PATH_ENV: str(self.key_path)})
+        self._env.start()
+
+    def tearDown(self) -> None:
+        self._env.stop()
+        self._tmp.cleanup()
+
+    def _write_rows(self, papers: list[Paper]) -> None:
+        with self.csv_path.open("w", encoding="utf-8", newline="") as f:
+            w = csv.DictWriter(f, fieldnames=PaperStorage.FIELDNAMES, quoting=csv.QUOTE_ALL)
+            w.writeheader()
+            for p in papers:
+                w.writerow(p.to_csv_row())
+
+    def test_warm_load_skips_csv_parsing(self) -> None:
+        self._write_rows([Paper(title="A", topic="HCI"), Paper(title="B", topic="LLM")])
+        cold = PaperStorage(self.csv_path).load_all()
+
+        with patch("paper_cli.core.storage.pd.read_csv", side_effect=AssertionError("parsed")):
+            warm = PaperStorage(self.csv_path).load_all()
+
+        self.assertEqual(warm, cold)
+        self.assertTrue((self.csv_path.parent / ".paper-cache").is_dir())
+
+    def test_cache_rebuilds_when_csv_changes(self) -> None:
+        self._write_rows([Paper(title="A", topic="HCI")])
+        self.assertEqual([p.title for p in PaperStorage(self.csv_path).load_all()], ["A"])
+
+        self._write_rows([Paper(title="A", topic="HCI"), Paper(title="C", topic="HCI")])
+        self.assertEqual([p.title for p in PaperStorage(self.csv_path).load_all()], ["A", "C"])
+
+    def test_cache_detects_same_size_rewrite(self) -> None:
+        self._write_rows([Paper(title="A", topic="HCI")])
+        PaperStorage(self.csv_path).load_all()
+
+        self._write_rows([Paper(title="B", topic="HCI")])
+        self.assertEqual([p.title for p in PaperStorage(self.csv_path).load_all()], ["B"])
+
+    def test_corrupt_cache_entry_is_ignored(self) -> None:
+        self._write_rows([Paper(title="A", topic="HCI")])
+        storage = PaperStorage(self.csv_path)
+        storage.load_all()
+
+        for entry in (self.csv_path.parent / ".paper-cache").glob("*.pickle"):
+            entry.write_bytes(b"garbage")
+
+        self.assertEqual([p.title for p in PaperStorage(self.csv_path).load_all()], ["A"])
+
+    def test_appends_are_logged_instead_of_rewriting_entries(self) -> None:
+        self._write_rows([Paper(title="A", link="https://x.org/a", topic="HCI")])
+        PaperStorage(self.csv_path).search(query="paper")  # warm the table and search entries
+        cache_dir = self.csv_path.parent / ".paper-cache"
+        entries = {p.name: p.stat().st_mtime_ns for p in cache_dir.glob("papers.*.pickle")}
+
+        PaperStorage(self.csv_path).add_paper(Paper(title="B paper", link="https://x.org/b", topic="HCI"))
+        PaperStorage(self.csv_path).add_paper(Paper(title="C paper", link="https://x.org/c", topic="LLM"))
+
+        for name, mtime in entries.items():
+            self.assertEqual((cache_dir / name).stat().st_mtime_ns, mtime, name)
+        with patch("paper_cli.core.storage.pd.read_csv", side_effect=AssertionError("parsed")):
+            with patch.object(SearchIndex, "from_records", side_effect=AssertionError("rebuilt")):
+                storage = PaperStorage(self.csv_path)
+                self.assertEqual([p.title for p in storage.search(query="paper")], ["B paper", "C paper"])
+        self.assertEqual([p.title for p in storage.load_all()], ["A", "B paper", "C paper"])
+        self.assertEqual(storage.get_topics(), {"HCI": 2, "LLM": 1})
+
+    def test_append_log_is_ignored_after_an_external_edit(self) -> None:
+        self._write_rows([Paper(title="A", topic="HCI")])
+        PaperStorage(self.csv_path).load_all()
+        PaperStorage(self.csv_path).add_paper(Paper(title="B", topic="HCI"))
+
+        self._write_rows([Paper(title="A", topic="HCI"), Paper(title="Z", topic="HCI")])
+        self.assertEqual([p.title for p in PaperStorage(self.csv_path).load_all()], ["A", "Z"])
+
+    def test_entry_signed_with_another_key_is_not_unpickled(self) -> None:
+        self._write_rows([Paper(title="A", topic="HCI")])
+        with patch.dict(os.environ, {cache.KEY_PATH_ENV: str(self.key_path.with_name("other.key"))}):
+            PaperStorage(self.csv_path).load_all()  # entries signed with a foreign key
+
+        with patch("paper_cli.core.cache.pickle.loads") as loads:
+            self.assertEqual([p.title for p in PaperStorage(self.csv_path).load_all()], ["A"])
+        loads.assert_not_called()
+
+    def test_key_is_created_at_the_configured_path(self) -> None:
+        self._write_rows([Paper(title="A", topic="HCI")])
+        with patch("paper_cli.core.cache.Path.home", side_effect=AssertionError("home")):
+            PaperStorage(self.csv_path).load_all()
+
+        self.assertEqual(cache.cache_key_path(), self.key_path)
+        self.assertEqual(self.key_path.read_bytes(), cache.cache_key())
+        self.assertEqual(self.key_path.stat().st_mode & 0o777, 0o600)
+
+    def test_tampered_entry_is_ignored(self) -> None:
+        self._write_rows([Paper(title="A", topic="HCI")])
+        PaperStorage(self.csv_path).load_all()
+
+        entry = self.csv_path.parent / ".paper-cache" / "papers.table.pickle"
+        data = bytearray(entry.read_bytes())
+        data[-2] ^= 0xFF
+        entry.write_bytes(bytes(data))
+
+        with patch("paper_cli.core.cache.pickle.loads") as loads:
+            self.assertEqual([p.title for p in PaperStorage(self.csv_path).load_all()], ["A"])
+        loads.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
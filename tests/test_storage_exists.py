@@ -2,6 +2,7 @@ import csv
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from paper_cli.core.models import Paper
 from paper_cli.core.storage import PaperStorage
@@ -81,6 +82,25 @@ class TestPaperStorageExists(unittest.TestCase):
         )
         self.assertTrue(self.storage.exists("https://example.com/paper/abc"))
 
+    def test_add_paper_updates_index_without_rescan(self) -> None:
+        self._write_rows([Paper(title="A-MEM", link="http://arxiv.org/abs/2502.12110v1", topic="Memory")])
+        self.assertFalse(self.storage.exists("10.1145/3631424"))
+
+        with patch.object(PaperStorage, "_read_csv_table", side_effect=AssertionError("rescanned")):
+            self.storage.add_paper(
+                Paper(title="CAvatar", doi="10.1145/3631424", link="https://doi.org/10.1145/3631424", topic="HCI")
+            )
+            self.assertTrue(self.storage.exists("https://dl.acm.org/doi/10.1145/3631424"))
+            self.assertTrue(self.storage.exists("2502.12110"))
+
+        self.assertEqual([p.title for p in PaperStorage(self.csv_path).load_all()], ["A-MEM", "CAvatar"])
+
+    def test_identity_index_matches_normalized_titles(self) -> None:
+        self._write_rows([Paper(title="Café: A Study!", link="https://example.com/a", topic="HCI")])
+        index = self.storage.identity_index()
+        self.assertEqual(index.lookup_title("cafe a study"), {0})
+        self.assertEqual(index.lookup_title("other"), set())
+
 
 if __name__ == "__main__":
     unittest.main()
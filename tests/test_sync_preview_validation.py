@@ -5,8 +5,15 @@ from unittest.mock import patch
 
 import typer
 
+from paper_cli.commands.add import add_paper
+from paper_cli.commands.authors import list_authors
+from paper_cli.commands.import_cmd import import_papers
+from paper_cli.commands.list_cmd import list_papers
 from paper_cli.commands.preview import preview_markdown
+from paper_cli.commands.search import search_papers
+from paper_cli.commands.stats import show_stats
 from paper_cli.commands.sync import sync_readme
+from paper_cli.commands.topics import list_topics
 
 
 class TestSyncPreviewValidation(unittest.TestCase):
@@ -33,6 +40,36 @@ class TestSyncPreviewValidation(unittest.TestCase):
         self.assertEqual(cm.exception.exit_code, 1)
         print_error.assert_called_once()
 
+    def test_jobs_must_be_positive(self) -> None:
+        for command, module in ((sync_readme, "sync"), (preview_markdown, "preview")):
+            with patch(f"paper_cli.commands.{module}.print_error") as print_error:
+                with self.assertRaises(typer.Exit) as cm:
+                    command(repo_path=self.repo, jobs=0)
+
+            self.assertEqual(cm.exception.exit_code, 2)
+            print_error.assert_called_once_with("--jobs must be >= 1")
+
+    def test_unknown_storage_backend_is_a_usage_error(self) -> None:
+        (self.repo / ".paper-cli.toml").write_text('storage_backend = "postgres"\n', encoding="utf-8")
+        links = self.repo / "links.txt"
+        links.write_text("2312.00752\n", encoding="utf-8")
+        commands = {
+            "add": lambda: add_paper("2312.00752", "HCI", repo_path=self.repo),
+            "authors": lambda: list_authors(repo_path=self.repo),
+            "import_cmd": lambda: import_papers(links, "HCI", repo_path=self.repo),
+            "list_cmd": lambda: list_papers(repo_path=self.repo),
+            "search": lambda: search_papers("memory", repo_path=self.repo),
+            "stats": lambda: show_stats(repo_path=self.repo),
+            "topics": lambda: list_topics(repo_path=self.repo),
+        }
+        for module, command in commands.items():
+            with patch(f"paper_cli.commands.{module}.print_error") as print_error:
+                with self.assertRaises(typer.Exit) as cm:
+                    command()
+
+            self.assertEqual(cm.exception.exit_code, 2, module)
+            self.assertIn("Unknown storage backend", print_error.call_args.args[0])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+
+from paper_cli.core.table_diff import diff_tables, paper_key, parse_table_rows
+
+
+HEADER = "| Source | Title (Link) | Authors | Tag | Subjects | Additional info | Date |\n|---|---|---|---|---|---|---|\n"
+
+
+def _row(title: str, link: str = "", tag: str = "") -> str:
+    linked = f"[{title}]({link})" if link else title
+    return f"| CHI 2024 | {linked} | A |  {tag} |  |  | 2024.01 |\n"
+
+
+class TestTableDiff(unittest.TestCase):
+    def test_paper_key_prefers_stable_ids(self) -> None:
+        self.assertEqual(paper_key("https://arxiv.org/abs/2401.00001v2", "T"), ("arxiv", "2401.00001"))
+        self.assertEqual(paper_key("https://doi.org/10.1145/3544548.3581000", "T"), ("doi", "10.1145/3544548.3581000"))
+        self.assertEqual(paper_key("https://Example.com/p/", "T"), ("link", "https://example.com/p"))
+        self.assertEqual(paper_key("", "A \\[Title\\]"), ("title", "a title"))
+
+    def test_parse_skips_header_and_counts_duplicates(self) -> None:
+        rows = parse_table_rows(HEADER + _row("A", "https://x.org/a") + _row("A", "https://x.org/a"))
+
+        self.assertEqual(list(rows), [("link", "https://x.org/a", 0), ("link", "https://x.org/a", 1)])
+
+    def test_diff_reports_added_removed_and_modified(self) -> None:
+        old = HEADER + _row("A", "https://arxiv.org/abs/2401.00001v1") + _row("B") + _row("C", "https://x.org/c")
+        new = HEADER + _row("A", "https://arxiv.org/abs/2401.00001v2") + _row("C", "https://x.org/c") + _row("D")
+
+        diff = diff_tables(old, new)
+
+        self.assertEqual(diff.added, [("title", "d", 0)])
+        self.assertEqual(diff.removed, [("title", "b", 0)])
+        self.assertEqual(diff.modified, [("arxiv", "2401.00001", 0)])
+        self.assertEqual(diff.describe(), "+1 added, -1 removed, ~1 modified")
+
+    def test_reordered_rows_are_not_row_changes(self) -> None:
+        a, b = _row("A"), _row("B")
+        self.assertEqual(diff_tables(HEADER + a + b, HEADER + b + a).describe(), "rows reordered or reformatted")
+
+
+if __name__ == "__main__":
+    unittest.main()
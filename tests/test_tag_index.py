@@ -0,0 +1,68 @@
+import csv
+import tempfile
+import unittest
+from pathlib import Path
+
+from paper_cli.core.models import Paper
+from paper_cli.core.storage import PaperStorage
+from paper_cli.core.tag_index import TagIndex, bitmap_rows, parse_tag_expression
+
+
+class TestTagIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        cells = ["LLM, memory", "llm", "vr,  Eye Tracking", "", "eye  tracking, LLM, llm"]
+        self.index = TagIndex.from_records({"Tag": c} for c in cells)
+
+    def test_vocabulary_is_normalized(self) -> None:
+        self.assertEqual(bitmap_rows(self.index.bitmaps["llm"]), [0, 1, 4])
+        self.assertEqual(bitmap_rows(self.index.bitmaps["eye tracking"]), [2, 4])
+        self.assertEqual(self.index.tag_counts(), {"LLM": 3, "Eye Tracking": 2, "memory": 1, "vr": 1})
+
+    def test_and_or_expressions(self) -> None:
+        self.assertEqual(parse_tag_expression("llm|VR, eye tracking"), [["llm", "vr"], ["eye tracking"]])
+        self.assertEqual(bitmap_rows(self.index.match(parse_tag_expression("llm|vr, eye tracking"))), [2, 4])
+        self.assertEqual(bitmap_rows(self.index.match(parse_tag_expression("llm, memory"))), [0])
+        self.assertEqual(self.index.match(parse_tag_expression("missing|nothing")), 0)
+
+    def test_add_record_is_incremental(self) -> None:
+        self.index.add_record({"Tag": "Memory, new"})
+        self.assertEqual(bitmap_rows(self.index.bitmaps["memory"]), [0, 5])
+        self.assertEqual(self.index.tag_counts()["memory"], 2)
+
+
+class TestTagSearch(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.csv_path = Path(self._tmp.name) / "papers.csv"
+        with self.csv_path.open("w", encoding="utf-8", newline="") as f:
+            w = csv.DictWriter(f, fieldnames=PaperStorage.FIELDNAMES, quoting=csv.QUOTE_ALL)
+            w.writeheader()
+            w.writerow(Paper(title="A", tag="LLM, memory", topic="HCI").to_csv_row())
+            w.writerow(Paper(title="B", tag="mllm", topic="HCI").to_csv_row())
+            w.writerow(Paper(title="C", tag="llm", topic="HCI").to_csv_row())
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_substring_is_default_and_exact_is_explicit(self) -> None:
+        storage = PaperStorage(self.csv_path)
+        self.assertEqual([p.title for p in storage.search(tag="llm")], ["A", "B", "C"])
+        self.assertEqual([p.title for p in storage.search(tag="llm", tag_match="exact")], ["A", "C"])
+        self.assertEqual([p.title for p in storage.search(tag="mllm|memory", tag_match="exact")], ["A", "B"])
+        # "," and "|" are plain text in substring mode.
+        self.assertEqual([p.title for p in storage.search(tag="llm, memory")], ["A"])
+        self.assertEqual(storage.search(tag="mllm|memory"), [])
+        with self.assertRaises(ValueError):
+            storage.search(tag="llm", tag_match="fuzzy")
+
+    def test_counts_follow_appends(self) -> None:
+        storage = PaperStorage(self.csv_path)
+        self.assertEqual(storage.get_all_tags(), {"LLM": 2, "memory": 1, "mllm": 1})
+        storage.add_paper(Paper(title="D", tag="llm", topic="HCI"))
+        # "llm" is now the more common spelling.
+        self.assertEqual(storage.get_all_tags()["llm"], 3)
+        self.assertEqual([p.title for p in storage.search(tag="LLM", tag_match="exact")], ["A", "C", "D"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,211 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from paper_cli.commands.sync import sync_readme
+from paper_cli.core.markdown import MarkdownGenerator, open_markdown
+from paper_cli.core.models import Paper
+from paper_cli.core.pages import INDEX_END, INDEX_START, PageLayout, plan_pages, topic_slugs
+from paper_cli.core.storage import PaperStorage
+
+
+class TestPlanPages(unittest.TestCase):
+    def test_topic_slugs_are_file_safe_and_unique(self) -> None:
+        slugs = topic_slugs(["Personalization & Memory", "personalization memory", "!!"])
+        self.assertEqual(
+            slugs,
+            {
+                "Personalization & Memory": "personalization-memory",
+                "personalization memory": "personalization-memory-2",
+                "!!": "topic",
+            },
+        )
+
+    def test_split_by_year_and_row_cap(self) -> None:
+        layout = PageLayout(Path("topics"), by_year=True, max_rows=2)
+        pages = plan_pages(layout, "hci", [2025, 2025, 2025, 2024, 0])
+
+        self.assertEqual(
+            [(p.path.as_posix(), p.label, p.start, p.end) for p in pages],
+            [
+                ("topics/hci/2025-1.md", "2025 (1)", 0, 2),
+                ("topics/hci/2025-2.md", "2025 (2)", 2, 3),
+                ("topics/hci/2024.md", "2024", 3, 4),
+                ("topics/hci/undated.md", "undated", 4, 5),
+            ],
+        )
+
+    def test_single_page_per_topic_by_default(self) -> None:
+        pages = plan_pages(PageLayout(Path("topics")), "hci", [2025, 2024])
+        self.assertEqual([(p.path.as_posix(), p.label) for p in pages], [("topics/hci.md", "")])
+
+
+class TestTopicPages(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.repo = Path(self._tmp.name)
+        self.csv_path = self.repo / "papers.csv"
+        self.readme_path = self.repo / "README.md"
+        self.pages_dir = self.repo / "topics"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _write_rows(self, papers: list[Paper]) -> None:
+        with self.csv_path.open("w", encoding="utf-8", newline="") as f:
+            w = csv.DictWriter(f, fieldnames=PaperStorage.FIELDNAMES, quoting=csv.QUOTE_ALL)
+            w.writeheader()
+            for p in papers:
+                w.writerow(p.to_csv_row())
+
+    def _generator(self, **layout) -> MarkdownGenerator:
+        return MarkdownGenerator(self.csv_path, self.readme_path, pages=PageLayout(self.pages_dir, **layout))
+
+    def test_update_writes_pages_and_index(self) -> None:
+        self._write_rows([Paper(title="a", topic="HCI", date="2024.01"), Paper(title="b", topic="LLM")])
+        self.readme_path.write_text(
+            "# Collection\n\nintro\n\n# HCI\n<!-- TABLE_START: HCI -->\nold\n<!-- TABLE_END: HCI -->\n",
+            encoding="utf-8",
+        )
+
+        self._generator().update_readme()
+        readme = self.readme_path.read_text(encoding="utf-8")
+
+        self.assertNotIn("TABLE_START", readme)
+        self.assertIn("intro", readme)
+        self.assertIn(INDEX_START, readme)
+        self.assertIn("- [HCI](topics/hci.md) (1 paper)", readme)
+        self.assertIn("- [LLM](topics/llm.md) (1 paper)", readme)
+        page = (self.pages_dir / "hci.md").read_text(encoding="utf-8")
+        self.assertIn("# HCI", page)
+        self.assertIn("[Back to index](../README.md)", page)
+        self.assertIn("| a |", page)
+
+    def test_update_rewrites_only_changed_pages(self) -> None:
+        papers = [
+            Paper(title="old", topic="HCI", date="2024.01"),
+            Paper(title="new", topic="HCI", date="2025.01"),
+            Paper(title="other", topic="LLM", date="2025.01"),
+        ]
+        self._write_rows(papers)
+        self._generator(by_year=True).update_readme()
+
+        papers[1].tag = "edited"
+        self._write_rows(papers)
+        md = self._generator(by_year=True)
+        self.assertEqual(md.get_diff(), "Changes:\n  HCI: ~1 modified")
+        md.update_readme()
+
+        self.assertEqual(md.last_rendered, ["HCI"])
+        self.assertEqual(md.last_written, [self.pages_dir / "hci" / "2025.md"])
+        self.assertEqual(self._generator(by_year=True).get_diff(), "No changes detected.")
+
+    def test_update_removes_stale_pages(self) -> None:
+        self._write_rows([Paper(title="a", topic="HCI", date="2024.01"), Paper(title="b", topic="LLM")])
+        self._generator(by_year=True).update_readme()
+        self.assertTrue((self.pages_dir / "llm" / "undated.md").exists())
+
+        self._write_rows([Paper(title="a", topic="HCI", date="2024.01")])
+        md = self._generator(by_year=True)
+        self.assertIn("LLM: REMOVED", md.get_diff())
+        md.update_readme()
+
+        self.assertFalse((self.pages_dir / "llm").exists())
+        self.assertTrue((self.pages_dir / "hci" / "2024.md").exists())
+        readme = self.readme_path.read_text(encoding="utf-8")
+        index = readme[readme.index(INDEX_START) : readme.index(INDEX_END)]
+        self.assertNotIn("LLM", index)
+
+    def test_index_replaces_tables_without_leftover_blank_lines(self) -> None:
+        self._write_rows([Paper(title=t, topic=t) for t in ["HCI", "LLM", "Memory"]])
+        self.readme_path.write_text("# Collection\n\nintro\n\n", encoding="utf-8")
+        MarkdownGenerator(self.csv_path, self.readme_path).update_readme()
+        with self.readme_path.open("a", encoding="utf-8") as f:
+            f.write("\n## License\n\nMIT\n")
+
+        self._generator().update_readme()
+        readme = self.readme_path.read_text(encoding="utf-8")
+
+        self.assertTrue(readme.startswith("# Collection\n\nintro\n\n## License\n\nMIT\n\n# Topics\n"), readme)
+        self.assertNotIn("\n\n\n", readme)
+
+    def test_switching_back_to_single_removes_index_and_pages(self) -> None:
+        self._write_rows([Paper(title="a", topic="HCI", date="2024.01"), Paper(title="b", topic="LLM")])
+        self.readme_path.write_text("# Collection\n\nintro\n", encoding="utf-8")
+        self._generator(by_year=True).update_readme()
+        self.assertTrue((self.pages_dir / "hci" / "2024.md").exists())
+
+        md = MarkdownGenerator(self.csv_path, self.readme_path)
+        md.update_readme()
+        readme = self.readme_path.read_text(encoding="utf-8")
+
+        self.assertNotIn(INDEX_START, readme)
+        self.assertNotIn("# Topics", readme)
+        self.assertIn("<!-- TABLE_START: HCI -->", readme)
+        self.assertTrue(readme.startswith("# Collection\n\nintro\n\n# HCI\n"), readme)
+        self.assertFalse(self.pages_dir.exists())
+        self.assertEqual(len(md.last_removed), 2)
+        self.assertIn(str(self.pages_dir), md.output_files())
+
+        # Nothing left to clean up on the next run.
+        md = MarkdownGenerator(self.csv_path, self.readme_path)
+        md.update_readme()
+        self.assertEqual((md.last_removed, self.readme_path.read_text(encoding="utf-8")), ([], readme))
+
+    def test_sync_keeps_pages_when_repo_path_changes(self) -> None:
+        (self.repo / ".paper-cli.toml").write_text('readme_layout = "pages"\n', encoding="utf-8")
+        self._write_rows([Paper(title="a", topic="HCI"), Paper(title="b", topic="LLM")])
+        cwd = os.getcwd()
+        try:
+            os.chdir(self.repo.parent)
+            sync_readme(readme_only=True, repo_path=Path(self.repo.name))
+        finally:
+            os.chdir(cwd)
+
+        self._write_rows([Paper(title=t, topic=t) for t in ["HCI", "LLM", "Memory"]])
+        sync_readme(readme_only=True, repo_path=self.repo.resolve())
+
+        self.assertEqual(sorted(p.name for p in self.pages_dir.iterdir()), ["hci.md", "llm.md", "memory.md"])
+        state = json.loads((self.repo / ".paper-cache" / "README.pages.json").read_text(encoding="utf-8"))
+        self.assertEqual(state["directory"], "topics")
+        self.assertEqual(set(state["topics"]["HCI"]["pages"]), {"topics/hci.md"})
+
+    def test_only_recorded_pages_inside_the_pages_directory_are_removed(self) -> None:
+        outside = self.repo / "notes.md"
+        outside.write_text("mine\n", encoding="utf-8")
+        self._write_rows([Paper(title="a", topic="HCI"), Paper(title="b", topic="LLM")])
+        self._generator().update_readme()
+        state_path = self.repo / ".paper-cache" / "README.pages.json"
+        state = json.loads(state_path.read_text(encoding="utf-8"))
+        state["topics"]["LLM"]["pages"]["notes.md"] = "x"
+        state_path.write_text(json.dumps(state), encoding="utf-8")
+
+        self._write_rows([Paper(title="a", topic="HCI")])
+        self._generator().update_readme()
+        self.assertTrue(outside.exists())
+        self.assertFalse((self.pages_dir / "llm.md").exists())
+
+        state = json.loads(state_path.read_text(encoding="utf-8"))
+        state["topics"]["HCI"]["pages"]["notes.md"] = "x"
+        state_path.write_text(json.dumps(state), encoding="utf-8")
+        MarkdownGenerator(self.csv_path, self.readme_path).update_readme()
+        self.assertTrue(outside.exists())
+        self.assertFalse(self.pages_dir.exists())
+
+    def test_open_markdown_reads_layout_from_config(self) -> None:
+        (self.repo / ".paper-cli.toml").write_text(
+            'readme_layout = "pages"\npages_dir = "docs/topics"\npage_rows = 50\n', encoding="utf-8"
+        )
+        md = open_markdown(self.repo)
+        self.assertEqual(md.pages, PageLayout(self.repo / "docs" / "topics", False, 50))
+
+        (self.repo / ".paper-cli.toml").write_text('readme_layout = "nested"\n', encoding="utf-8")
+        with self.assertRaises(ValueError):
+            open_markdown(self.repo)
+
+
+if __name__ == "__main__":
+    unittest.main()